@@ -1,107 +1,394 @@
 #!/usr/bin/env python3
 """
 Run full Ollama Pulse workflow: ingests + report generation + Nostr posting
+
+Stages are declared as a small dependency graph and scheduled as soon as
+their upstream stages finish:
+
+    ingest_* (parallel) → aggregate → mine_insights → generate_report → post_to_nostr
+
+Independent ingesters run concurrently (bounded by --workers), so the ingest
+phase costs roughly the slowest source instead of the sum of all sources.
+By default all ingesters share one interpreter via scripts/run_sources.py;
+--ingest-mode=subprocess runs one process per ingest_* script instead.
+
+Ingest stages get a deadline a little inside --timeout, so sources stop
+slow sub-fetches themselves and save what they have. --timeout is per
+source: the in-process stage runs its sources in waves of --workers, so its
+own timeout is --timeout per wave and each source keeps the full per-source
+budget however slow the others are. A stage ends
+"complete", "partial" (some sources cut short, or checkpoints salvaged
+after the hard kill) or "failed".
+
+When sentence-transformers is installed, the resident embedding service
+(scripts/embedding_service.py) is started alongside ingestion so the model
+is already loaded by the time mining needs it; it is stopped at the end.
 """
+import argparse
+import importlib.util
+import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).parent
+SCRIPTS_DIR = ROOT_DIR / "scripts"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+try:
+    from monitoring import MetricsCollector, WorkflowOperation
+    MONITORING_AVAILABLE = True
+except ImportError:
+    MONITORING_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 120
+DEFAULT_WORKERS = 6
+# Ingest deadline = timeout minus this, leaving time to save before the hard kill
+DEADLINE_MARGIN_SECONDS = 15
+# run_sources.py exit code for a run where some sources were only partial
+EXIT_PARTIAL = 3
+
+# Serialises stage output so concurrent stages don't interleave in the log
+_print_lock = threading.Lock()
+
+
+@dataclass
+class Stage:
+    """A single workflow stage (one script) and the stages it waits for"""
+    name: str
+    script: str
+    description: str
+    depends_on: List[str] = field(default_factory=list)
+    cwd: Path = ROOT_DIR
+    args: List[str] = field(default_factory=list)
+    operation_type: str = "ingestion"
+    sources: List[str] = field(default_factory=list)  # Sources an ingest stage runs
+    timeout_scale: int = 1  # Stage timeout in multiples of the per-stage --timeout
+
+
+@dataclass
+class StageResult:
+    """Outcome and wall time of a finished stage"""
+    name: str
+    success: bool
+    duration_seconds: float
+    status: str = "complete"  # complete | partial | failed
+    error_message: str = None
+    timed_out: bool = False
+
+
+INGEST_STAGES = [
+    ("official", "ingest_official.py", "Ingest Official (Ollama blog, Cloud API)"),
+    ("cloud", "ingest_cloud.py", "Ingest Cloud (Ollama Turbo/Cloud)"),
+    ("community", "ingest_community.py", "Ingest Community (GitHub discussions)"),
+    ("issues", "ingest_issues.py", "Ingest Issues (GitHub issues)"),
+    ("tools", "ingest_tools.py", "Ingest Tools (GitHub repositories)"),
+    ("bounties", "ingest_bounties.py", "Ingest Bounties (Reward opportunities)"),
+    ("nostr", "ingest_nostr.py", "Ingest Nostr (Decentralized network)"),
+    ("stackoverflow", "ingest_stackoverflow.py", "Ingest Stack Overflow (Q&A)"),
+    ("model_registry", "ingest_model_registry.py", "Ingest Model Registry (ollama.com/library)"),
+    ("releases", "ingest_releases.py", "Ingest Releases (GitHub releases)"),
+    ("devblogs", "ingest_devblogs.py", "Ingest Dev Blogs (Dev.to, Hashnode, Medium)"),
+    ("social_media", "ingest_social_media.py", "Ingest Social Media (Mastodon, web search)"),
+    ("manual", "ingest_manual.py", "Ingest Manual Tracking (tracked_projects.json)"),
+]
+
+
+def build_stages(ingest_mode: str = "inprocess", workers: int = DEFAULT_WORKERS) -> List[Stage]:
+    """Declare the workflow graph: every ingester feeds aggregation"""
+    if ingest_mode == "subprocess":
+        stages = [
+            Stage(name=f"ingest_{name}", script=f"scripts/{script}", description=desc, sources=[name])
+            for name, script, desc in INGEST_STAGES
+        ]
+    else:
+        stages = [
+            Stage(
+                name="ingest_all",
+                script="scripts/run_sources.py",
+                description=f"Ingest All Sources ({len(INGEST_STAGES)} sources, one event loop)",
+                args=["--concurrency", str(workers)],
+                sources=[name for name, _, _ in INGEST_STAGES],
+                # One --timeout per wave of `workers` sources, as if each had its own stage
+                timeout_scale=-(-len(INGEST_STAGES) // max(workers, 1)),
+            )
+        ]
+    ingest_names = [s.name for s in stages]
+
+    stages.extend([
+        Stage(
+            name="aggregate",
+            script="scripts/aggregate.py",
+            description="Aggregate Data (Consolidation)",
+            depends_on=ingest_names,
+            operation_type="aggregation",
+        ),
+        Stage(
+            name="mine_insights",
+            script="scripts/mine_insights.py",
+            description="Mine Insights (Pattern detection)",
+            depends_on=["aggregate"],
+            operation_type="mining",
+        ),
+        # Report generation and publishing resolve ../data and ../docs
+        # relative to scripts/, exactly like the report workflows
+        Stage(
+            name="generate_report",
+            script="generate_report.py",
+            description="Generate Daily EchoVein Report",
+            depends_on=["mine_insights"],
+            cwd=SCRIPTS_DIR,
+            operation_type="report_generation",
+        ),
+        Stage(
+            name="post_to_nostr",
+            script="post_to_nostr.py",
+            description="Post Report to Nostr Network",
+            depends_on=["generate_report"],
+            cwd=SCRIPTS_DIR,
+            operation_type="publishing",
+        ),
+    ])
+    return stages
+
+
+def validate_stages(stages: List[Stage]):
+    """Reject unknown dependencies and cycles before anything runs"""
+    names = {s.name for s in stages}
+    for stage in stages:
+        missing = [d for d in stage.depends_on if d not in names]
+        if missing:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {missing}")
+
+    deps = {s.name: set(s.depends_on) for s in stages}
+    resolved = set()
+    while deps:
+        ready = [name for name, d in deps.items() if d <= resolved]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stages: {sorted(deps)}")
+        for name in ready:
+            resolved.add(name)
+            del deps[name]
+
+
+def salvage(stage: Stage, output: List[str]) -> bool:
+    """After a hard kill, save the sub-results the stage's sources had checkpointed"""
+    result = subprocess.run(
+        [sys.executable, "scripts/run_sources.py", "--salvage", "--only", ",".join(stage.sources)],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    output.append(result.stdout)
+    return result.returncode == EXIT_PARTIAL
+
+
+def run_command(stage: Stage, timeout: int = DEFAULT_TIMEOUT) -> StageResult:
+    """Run a stage's script and report status"""
+    start = time.perf_counter()
+    output = []
+    success = False
+    status = "failed"
+    timed_out = False
+    error_message = None
+
+    args = list(stage.args)
+    env = None
+    source_timeout, timeout = timeout, timeout * stage.timeout_scale
+    if stage.sources:
+        # Let sources wind down on their own before the hard kill below
+        budget = max(source_timeout - DEADLINE_MARGIN_SECONDS, 1)
+        env = {**os.environ, "PULSE_SOURCE_BUDGET": str(budget)}
+        if stage.script.endswith("run_sources.py"):
+            args += ["--deadline", str(max(timeout - DEADLINE_MARGIN_SECONDS, 1))]
 
-def run_command(cmd, description):
-    """Run a command and report status"""
-    print(f"\n{'='*60}")
-    print(f"🚀 {description}")
-    print(f"{'='*60}")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=120)
+        result = subprocess.run(
+            [sys.executable, stage.script, *args],
+            cwd=stage.cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=env,
+        )
         if result.stdout:
-            print(result.stdout)
+            output.append(result.stdout)
         if result.stderr:
-            print("STDERR:", result.stderr)
+            output.append(f"STDERR: {result.stderr}")
         if result.returncode == 0:
-            print(f"✅ {description} - SUCCESS")
-            return True
+            success = True
+            status = "complete"
+        elif result.returncode == EXIT_PARTIAL and stage.sources:
+            success = True
+            status = "partial"
+            error_message = "some sources stopped at their deadline"
         else:
-            print(f"⚠️ {description} - FAILED (code: {result.returncode})")
-            return False
+            error_message = f"exit code {result.returncode}"
     except subprocess.TimeoutExpired:
-        print(f"⏱️ {description} - TIMEOUT (120s)")
-        return False
+        timed_out = True
+        error_message = f"timeout after {timeout}s"
+        if stage.sources and salvage(stage, output):
+            success = True
+            status = "partial"
+            error_message += ", checkpointed results salvaged"
     except Exception as e:
-        print(f"❌ {description} - ERROR: {e}")
-        return False
+        error_message = str(e)
+
+    duration = time.perf_counter() - start
+
+    with _print_lock:
+        print(f"\n{'='*60}")
+        print(f"🚀 {stage.description}")
+        print(f"{'='*60}")
+        for chunk in output:
+            print(chunk)
+        if status == "complete":
+            print(f"✅ {stage.description} - SUCCESS ({duration:.1f}s)")
+        elif status == "partial":
+            print(f"🟡 {stage.description} - PARTIAL ({error_message}, {duration:.1f}s)")
+        elif timed_out:
+            print(f"⏱️ {stage.description} - TIMEOUT ({timeout}s)")
+        else:
+            print(f"⚠️ {stage.description} - FAILED ({error_message}, {duration:.1f}s)")
+
+    return StageResult(
+        name=stage.name,
+        success=success,
+        duration_seconds=duration,
+        status=status,
+        error_message=error_message,
+        timed_out=timed_out,
+    )
+
+
+def run_pipeline(stages: List[Stage], max_workers: int = DEFAULT_WORKERS,
+                 timeout: int = DEFAULT_TIMEOUT) -> Dict[str, StageResult]:
+    """
+    Run stages as soon as all of their dependencies have finished
+
+    A failed stage does not block its dependents: downstream stages run on
+    whatever data is available, matching the continue-on-error behaviour of
+    the hourly ingestion workflow.
+    """
+    validate_stages(stages)
+
+    pending = {s.name: s for s in stages}
+    finished: Dict[str, StageResult] = {}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            ready = [
+                s for s in pending.values()
+                if all(d in finished for d in s.depends_on)
+            ]
+            for stage in ready:
+                del pending[stage.name]
+                running[executor.submit(run_command, stage, timeout)] = stage.name
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                finished[name] = future.result()
+
+    return finished
+
+
+def record_metrics(stages: List[Stage], results: Dict[str, StageResult]):
+    """Persist per-stage wall time through the shared metrics collector"""
+    if not MONITORING_AVAILABLE:
+        return
+
+    collector = MetricsCollector(metrics_dir=str(ROOT_DIR / "data" / "metrics"))
+    collector.start_workflow("full_workflow")
+    for stage in stages:
+        result = results[stage.name]
+        collector.record_operation(WorkflowOperation(
+            operation_type=stage.operation_type,
+            source=stage.name,
+            status={"complete": "success", "partial": "warning"}.get(result.status, "failure"),
+            timestamp=datetime.now().isoformat(),
+            duration_seconds=round(result.duration_seconds, 3),
+            error_message=result.error_message,
+            error_category="timeout" if result.timed_out else ("deadline" if result.status == "partial" else None),
+        ))
+    all_ok = all(r.status == "complete" for r in results.values())
+    collector.end_workflow("full_workflow", "success" if all_ok else "partial")
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the full Ollama Pulse workflow")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Maximum stages running at once (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                        help=f"Per-stage (and per-source) timeout in seconds (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--ingest-mode", choices=["inprocess", "subprocess"], default="inprocess",
+                        help="Run sources in one interpreter or one process per script (default: inprocess)")
+    parser.add_argument("--no-embedding-service", action="store_true",
+                        help="Don't start the resident embedding service (stages encode in-process)")
+    args = parser.parse_args()
+
     print("📡 OLLAMA PULSE - FULL WORKFLOW")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # List of all 10 ingests
-    ingests = [
-        ("python scripts/ingest_official.py", "1️⃣  Ingest Official (Ollama blog, Cloud API)"),
-        ("python scripts/ingest_cloud.py", "2️⃣  Ingest Cloud (Ollama Turbo/Cloud)"),
-        ("python scripts/ingest_community.py", "3️⃣  Ingest Community (GitHub discussions)"),
-        ("python scripts/ingest_issues.py", "4️⃣  Ingest Issues (GitHub issues)"),
-        ("python scripts/ingest_tools.py", "5️⃣  Ingest Tools (GitHub repositories)"),
-        ("python scripts/ingest_bounties.py", "6️⃣  Ingest Bounties (Reward opportunities)"),
-        ("python scripts/ingest_nostr.py", "7️⃣  Ingest Nostr (Decentralized network)"),
-        ("python scripts/mine_insights.py", "8️⃣  Mine Insights (Pattern detection)"),
-        ("python scripts/aggregate.py", "9️⃣  Aggregate Data (Consolidation)"),
-    ]
-    
-    results = {}
-    
-    # Run ingests
-    print("\n" + "="*60)
-    print("📥 PHASE 1: DATA INGESTION (10 sources)")
-    print("="*60)
-    
-    for cmd, desc in ingests:
-        results[desc] = run_command(cmd, desc)
-    
-    # Generate report
-    print("\n" + "="*60)
-    print("📝 PHASE 2: REPORT GENERATION")
-    print("="*60)
-    results["Report Generation"] = run_command(
-        "python scripts/generate_report.py",
-        "Generate Daily EchoVein Report"
-    )
-    
-    # Post to Nostr
-    print("\n" + "="*60)
-    print("🌐 PHASE 3: NOSTR PUBLISHING")
-    print("="*60)
-    results["Nostr Publishing"] = run_command(
-        "python scripts/post_to_nostr.py",
-        "Post Report to Nostr Network"
-    )
-    
+
+    stages = build_stages(args.ingest_mode, args.workers)
+    print(f"🧩 {len(stages)} stages, up to {args.workers} running concurrently")
+
+    # Load the embedding model in the background while ingestion runs
+    embedding_service_started = False
+    if not args.no_embedding_service and importlib.util.find_spec("sentence_transformers"):
+        import embedding_service
+        embedding_service_started = embedding_service.start_background()
+        if embedding_service_started:
+            print(f"🧠 Embedding service starting ({embedding_service.SOCKET_PATH})")
+
+    wall_start = time.perf_counter()
+    try:
+        results = run_pipeline(stages, max_workers=args.workers, timeout=args.timeout)
+    finally:
+        if embedding_service_started:
+            embedding_service.stop()
+    wall_time = time.perf_counter() - wall_start
+
     # Summary
     print("\n" + "="*60)
     print("📊 WORKFLOW SUMMARY")
     print("="*60)
-    
-    success_count = sum(1 for v in results.values() if v)
+
+    success_count = sum(1 for r in results.values() if r.success)
+    partial_count = sum(1 for r in results.values() if r.status == "partial")
     total_count = len(results)
-    
-    for task, success in results.items():
-        status = "✅" if success else "⚠️"
-        print(f"{status} {task}")
-    
-    print(f"\nCompleted: {success_count}/{total_count}")
+
+    for stage in stages:
+        result = results[stage.name]
+        status = {"complete": "✅", "partial": "🟡"}.get(result.status, "⚠️")
+        print(f"{status} {stage.description:<50} {result.duration_seconds:7.1f}s")
+
+    serial_time = sum(r.duration_seconds for r in results.values())
+    print(f"\nCompleted: {success_count}/{total_count}" + (f" ({partial_count} partial)" if partial_count else ""))
+    print(f"Wall time: {wall_time:.1f}s (serial equivalent: {serial_time:.1f}s)")
     print(f"Finished: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
+
+    record_metrics(stages, results)
+
     # Check for latest report
     today = datetime.now().strftime("%Y-%m-%d")
-    report_path = Path(f"docs/reports/pulse-{today}.md")
+    report_path = ROOT_DIR / "docs" / "reports" / f"pulse-{today}.md"
     if report_path.exists():
         size = report_path.stat().st_size
         print(f"\n✅ Latest report generated: {report_path} ({size} bytes)")
     else:
         print(f"\n⚠️ Report not found at {report_path}")
-    
+
     return 0 if success_count == total_count else 1
 
+
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -3,192 +3,487 @@
 Ollama Pulse - Data Aggregation
 Merges daily JSONs from all sources into unified view
 """
+import argparse
+import hashlib
+import heapq
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+import backfill
+from dedupe import NearDuplicateIndex, canonical_url, simhash
+from json_stream import JSONArrayWriter
+from pulse_entry import PulseEntry, load_entries
+import journal
+from relevance import TURBO_RELEVANCE
+import seen_index
+
 
 def ensure_data_dir():
     """Create data/aggregated directory if it doesn't exist"""
     Path("data/aggregated").mkdir(parents=True, exist_ok=True)
 
 
-def get_today_filename():
-    """Get filename for today's aggregated data"""
-    today = datetime.now().strftime("%Y-%m-%d")
+def get_today_filename(day=None):
+    """Get filename for today's (or `day`'s) aggregated data"""
+    today = day or datetime.now().strftime("%Y-%m-%d")
     return f"data/aggregated/{today}.json"
 
 
-def load_source_data(source_dir):
-    """Load today's data from a source directory"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    filename = f"data/{source_dir}/{today}.json"
-
-    if not os.path.exists(filename):
-        return []
-
-    with open(filename, 'r') as f:
-        data = json.load(f)
-
-        # Ensure we always return a list
-        if isinstance(data, dict):
-            # If it's a dict, check if it has an 'entries' key
-            if 'entries' in data:
-                return data['entries']
-            # Otherwise, wrap it in a list
-            return [data]
-        elif isinstance(data, list):
-            return data
-        else:
-            # Unknown type, return empty list
-            return []
+def load_source_data(source_dir, day=None):
+    """Load today's (or `day`'s) data from a source directory as PulseEntry records"""
+    today = day or datetime.now().strftime("%Y-%m-%d")
+    return list(load_entries(f"data/{source_dir}/{today}.json"))
+
+
+def relevance_text(entry):
+    """Text an entry (PulseEntry) is scored on: title, summary and highlights"""
+    return entry.title + ' ' + entry.summary + ' ' + ' '.join(entry.highlights)
 
 
 def score_turbo_relevance(entry):
     """
     Score entry relevance to Ollama Turbo Cloud (0-1)
     Higher scores = more relevant to Turbo/Cloud focus
+    (keyword weights live in relevance.TURBO_RELEVANCE)
     """
-    text = (entry.get('title', '') + ' ' + 
-            entry.get('summary', '') + ' ' + 
-            ' '.join(entry.get('highlights', []))).lower()
-    
-    score = 0.0
-    
-    # Core Turbo/Cloud keywords (high weight)
-    if 'turbo' in text:
-        score += 0.3
-    if 'cloud' in text:
-        score += 0.3
-    if '-cloud' in text:  # Model suffix
-        score += 0.2
-    
-    # Related features
-    if any(word in text for word in ['voice', 'stt', 'tts', 'speech']):
-        score += 0.15
-    if any(word in text for word in ['multimodal', 'vision', 'image']):
-        score += 0.15
-    if any(word in text for word in ['api', 'integration', 'service']):
-        score += 0.1
-    
-    # Model mentions
-    if any(model in text for model in ['gpt-oss', 'qwen3', 'glm', 'mixtral']):
-        score += 0.1
-    
-    return min(score, 1.0)
+    return TURBO_RELEVANCE.score(relevance_text(entry))
 
 
 def filter_by_relevance(entries, threshold=0.3):
-    """Filter entries by Turbo relevance score"""
+    """Filter entries by Turbo relevance score (scored in one batch)"""
+    scores = TURBO_RELEVANCE.score_many(relevance_text(entry) for entry in entries)
     scored_entries = []
-    for entry in entries:
-        score = score_turbo_relevance(entry)
+    for entry, score in zip(entries, scores):
         if score >= threshold:
-            entry['turbo_score'] = round(score, 2)
+            entry['turbo_score'] = round(float(score), 2)
             scored_entries.append(entry)
     
     return scored_entries
 
 
-def aggregate_data():
-    """Aggregate data from all sources with Turbo-centric filtering"""
-    print("🔄 Aggregating data from all 16 sources...")
-
-    # Load from all sources (original 10)
-    official = load_source_data("official")
-    cloud = load_source_data("cloud")  # Changed from models - cloud models data
-    community = load_source_data("community")
-    tools = load_source_data("tools")
-    bounties = load_source_data("bounties")
-    nostr = load_source_data("nostr")
-
-    # Load from new sources (6 new)
-    issues = load_source_data("issues")  # Fixed - was saving to community/
-    stackoverflow = load_source_data("stackoverflow")
-    model_registry = load_source_data("model_registry")  # Fixed - was models/
-    releases = load_source_data("releases")
-    devblogs = load_source_data("devblogs")
-    social_media = load_source_data("social_media")  # Replaced discord - X, Instagram, Facebook
-    manual = load_source_data("manual")
-
-    print(f"  📊 Official: {len(official)} entries")
-    print(f"  ☁️  Cloud Models: {len(cloud)} entries")
-    print(f"  📊 Community: {len(community)} entries")
-    print(f"  🔧 Tools: {len(tools)} entries")
-    print(f"  💰 Bounties: {len(bounties)} entries")
-    print(f"  🌐 Nostr: {len(nostr)} entries")
-    print(f"  ❓ Issues/PRs: {len(issues)} entries")
-    print(f"  💬 Stack Overflow: {len(stackoverflow)} entries")
-    print(f"  🤖 Model Registry: {len(model_registry)} entries")
-    print(f"  📦 Releases: {len(releases)} entries")
-    print(f"  📝 Dev Blogs: {len(devblogs)} entries")
-    print(f"  📱 Social Media: {len(social_media)} entries")
-    print(f"  ⭐ Manual Tracking: {len(manual)} entries")
-
-    # Combine all
-    all_entries = (official + cloud + community + tools + bounties + nostr +
-                   issues + stackoverflow + model_registry + releases + devblogs + social_media + manual)
-    
-    # Deduplicate by URL (handle entries without URL gracefully)
-    unique_dict = {}
-    entries_without_url = []
-    
-    for e in all_entries:
-        if 'url' in e and e['url']:
-            # Use URL as deduplication key
-            unique_dict[e['url']] = e
+# (source dir, label) in the order the sources are merged
+SOURCES = [
+    ("official", "📊 Official"),
+    ("cloud", "☁️  Cloud Models"),
+    ("community", "📊 Community"),
+    ("tools", "🔧 Tools"),
+    ("bounties", "💰 Bounties"),
+    ("nostr", "🌐 Nostr"),
+    ("issues", "❓ Issues/PRs"),
+    ("stackoverflow", "💬 Stack Overflow"),
+    ("model_registry", "🤖 Model Registry"),
+    ("releases", "📦 Releases"),
+    ("devblogs", "📝 Dev Blogs"),
+    ("social_media", "📱 Social Media"),
+    ("manual", "⭐ Manual Tracking"),
+]
+
+# Highest-scoring entries kept in the aggregated file
+MAX_AGGREGATED_ENTRIES = 1000
+
+
+def _dedupe_digest(key):
+    """Compact fixed-size form of a dedupe key for the in-memory index"""
+    return hashlib.blake2b(str(key).encode('utf-8'), digest_size=8).digest()
+
+
+def merge_duplicate(canonical, duplicate):
+    """Fold a duplicate into the record that represents it: merged sources and extra URLs"""
+    sources = canonical.setdefault('sources', [canonical.get('source')])
+    for source in duplicate.get('sources', [duplicate.get('source')]):
+        if source not in sources:
+            sources.append(source)
+
+    urls = canonical.setdefault('duplicate_urls', [])
+    for url in [duplicate.get('url')] + duplicate.get('duplicate_urls', []):
+        if url and url != canonical.get('url') and url not in urls:
+            urls.append(url)
+    if not urls:
+        del canonical['duplicate_urls']
+
+
+class ReplayConflict(Exception):
+    """A journal record whose effect depends on where a full rebuild would meet it"""
+
+
+class Aggregator:
+    """
+    Dedup map and score-ordered index of one day's aggregate
+
+    Records are applied one at a time with add(), in source order. Duplicates
+    are resolved through an index of 8-byte key digests of canonical URLs (a
+    later entry with the same link replaces the earlier one; entries without
+    a URL are kept once per title). Ranked entries are also fingerprinted
+    with SimHash over title + summary, and a near-duplicate of an entry
+    already ranked is merged into it (see merge_duplicate) instead of being
+    listed again. Only the best `max_entries` by (turbo_score, date) are held
+    in a bounded heap, so memory stays flat however large the sources grow;
+    ties go to the earlier source, then to the smaller key digest. A replaced
+    entry is only dropped from `ranked`; its heap item is left behind as
+    stale and skipped when it reaches the top (lazy deletion), and the heap
+    is compacted once stale items outnumber the bound.
+
+    Each index slot also remembers the source rank and record key of its
+    winner, its fingerprint and those of the records it displaced, which is
+    what replay() and remove() need to apply a journal record out of order.
+
+    to_state()/from_state() persist everything except the ranked entries
+    themselves, which are the aggregated file, so an hourly run can resume
+    where the previous one stopped.
+    """
+
+    def __init__(self, max_entries=MAX_AGGREGATED_ENTRIES):
+        self.max_entries = max_entries
+        # digest -> [seq of the winner, its source rank, its record key digest (hex),
+        #            its fingerprint, fingerprints of the records it displaced]
+        self.index = {}
+        # Min-heap of (turbo_score, date, -source rank, digest, seq, entry); smallest is evicted first.
+        # Items whose seq is no longer in `ranked` are stale and skipped.
+        self.heap = []
+        # seq -> (entry, fingerprint) for every live item in the heap
+        self.ranked = {}
+        self.near_duplicates = NearDuplicateIndex()
+        # Every fingerprint computed, ranked or not (slot winners by seq)
+        self.fingerprinted = NearDuplicateIndex()
+        self.seq = 0
+        self.entries_without_url = 0
+        self.merged = 0
+        # Records the bound pushed out or kept out
+        self.evicted = 0
+
+    def _unrank(self, old_seq):
+        entry, fingerprint = self.ranked.pop(old_seq)
+        self.near_duplicates.remove(old_seq, fingerprint)
+        return entry
+
+    def _rank(self, item, fingerprint):
+        self.ranked[item[4]] = (item[5], fingerprint)
+        self.near_duplicates.add(item[4], fingerprint)
+
+    def _live_top(self):
+        """Smallest live heap item (stale ones above it are discarded)"""
+        while self.heap[0][4] not in self.ranked:
+            heapq.heappop(self.heap)
+        return self.heap[0]
+
+    def _compact(self):
+        """Drop stale items once they outnumber the bound, keeping the heap O(max_entries)"""
+        if len(self.heap) - len(self.ranked) > self.max_entries:
+            self.heap = [item for item in self.heap if item[4] in self.ranked]
+            heapq.heapify(self.heap)
+
+    def add(self, e, rank=0):
+        """Apply one PulseEntry from the source at `rank` in SOURCES"""
+        self.seq += 1
+        seq = self.seq
+        key = _dedupe_digest(e.url or e.title).hex()
+
+        replaced = None
+        if e.url:
+            # Use the canonical URL as deduplication key - the latest entry wins
+            digest = _dedupe_digest(canonical_url(e.url))
+            slot = self.index.get(digest)
+            if slot is None:
+                slot = self.index[digest] = [seq, rank, key, None, []]
+            else:
+                # Drop the entry it replaces if that one is still ranked (its heap item goes stale)
+                old_seq = slot[0]
+                if old_seq in self.ranked:
+                    replaced = self._unrank(old_seq)
+                    self._compact()
+                slot[4].append(slot[3])
+                slot[:4] = [seq, rank, key, None]
         else:
-            # Entry missing URL - use title as fallback or keep as-is
-            fallback_key = e.get('title', f"no_url_{len(entries_without_url)}")
-            if fallback_key not in unique_dict:
-                unique_dict[fallback_key] = e
-                entries_without_url.append(e)
-    
-    unique_entries = list(unique_dict.values())
-    
-    if entries_without_url:
-        print(f"⚠️  Warning: {len(entries_without_url)} entries missing URL field (using title as fallback)")
-    
-    # Apply Turbo-centric filtering
-    print("🎯 Applying Turbo-centric relevance filtering...")
-    filtered_entries = filter_by_relevance(unique_entries, threshold=0.3)
-    
-    # Sort by relevance score, then date
-    sorted_entries = sorted(
-        filtered_entries,
-        key=lambda x: (x.get('turbo_score', 0), x.get('date', '')),
-        reverse=True
-    )
-    
-    print(f"✅ Aggregated {len(sorted_entries)} high-relevance entries (from {len(unique_entries)} total)")
-    return sorted_entries, len(unique_entries)
+            # Entry missing URL - use title as fallback, first one wins
+            digest = _dedupe_digest(e.title or f"no_url_{self.entries_without_url}")
+            if digest in self.index:
+                self.index[digest][4].append(None)
+                return
+            slot = self.index[digest] = [seq, rank, key, None, []]
+            self.entries_without_url += 1
+
+        # Apply Turbo-centric filtering
+        score = score_turbo_relevance(e)
+        if score < 0.3:
+            return
+        e.turbo_score = round(score, 2)
+        if replaced is not None and (replaced.sources or replaced.duplicate_urls):
+            merge_duplicate(e, replaced)
+
+        # Same story from another source: merge into the ranked record
+        fingerprint = simhash(f"{e.title} {e.summary}")
+        slot[3] = fingerprint
+        self.fingerprinted.add(seq, fingerprint)
+        match = self.near_duplicates.find(fingerprint)
+        if match is not None:
+            merge_duplicate(self.ranked[match][0], e)
+            self.merged += 1
+            return
+
+        item = (e.turbo_score, str(e.date or ''), -rank, digest, seq, e)
+        if len(self.ranked) < self.max_entries:
+            heapq.heappush(self.heap, item)
+        elif item[:4] > self._live_top()[:4]:
+            self._unrank(heapq.heapreplace(self.heap, item)[4])
+            self.evicted += 1
+        else:
+            self.evicted += 1
+            return
+        self._rank(item, fingerprint)
+
+    def _drop(self, digest, slot, without_url):
+        """Take a slot's record out as if it had never been added (it must not have touched another)"""
+        seq, _, _, fingerprint, displaced = slot
+        if displaced:
+            raise ReplayConflict("its link or title is shared with another record")
+        if seq in self.ranked:
+            entry = self.ranked[seq][0]
+            if entry.sources or entry.duplicate_urls:
+                raise ReplayConflict("other records were merged into it")
+            self._unrank(seq)
+            self._compact()
+        elif fingerprint is not None:
+            raise ReplayConflict("it was merged into another record")
+        self.fingerprinted.remove(seq, fingerprint)
+        del self.index[digest]
+        if without_url:
+            self.entries_without_url -= 1
+
+    def replay(self, e, rank):
+        """
+        Apply a journal record (new or changed) from the source at `rank`
+
+        A full rebuild meets the record at its place in the source files,
+        while a replay applies it after everything else. That only gives the
+        same result when the record touches no other record: its link or
+        title is its own, no other fingerprint is a near-duplicate of it,
+        the version it changes was just as isolated, and no entry was ever
+        evicted. Anything else raises ReplayConflict (rebuild in full).
+        """
+        if self.evicted:
+            raise ReplayConflict("the entry bound was reached")
+        if not (e.url or e.title):
+            raise ReplayConflict("it has neither a URL nor a title")
+        key = _dedupe_digest(e.url or e.title).hex()
+        digest = _dedupe_digest(canonical_url(e.url) if e.url else e.title)
+        slot = self.index.get(digest)
+        if slot is not None:
+            if slot[1] != rank or slot[2] != key:
+                raise ReplayConflict("its link or title is shared with another record")
+            self._drop(digest, slot, not e.url)
 
+        if score_turbo_relevance(e) >= 0.3:
+            if self.fingerprinted.find(simhash(f"{e.title} {e.summary}")) is not None:
+                raise ReplayConflict("it is a near-duplicate of another record")
+            if len(self.ranked) >= self.max_entries:
+                raise ReplayConflict("the entry bound was reached")
+        self.add(e, rank)
 
-def save_aggregated(entries):
-    """Save aggregated data"""
+    def remove(self, key, rank):
+        """Apply a journal removal of the record with dedupe `key` from the source at `rank`"""
+        key_digest = _dedupe_digest(key).hex()
+        for digest, without_url in ((_dedupe_digest(canonical_url(key)), False), (_dedupe_digest(key), True)):
+            slot = self.index.get(digest)
+            if slot is not None and slot[1] == rank and slot[2] == key_digest:
+                self._drop(digest, slot, without_url)
+                return
+        raise ReplayConflict("the removed record does not own its link or title")
+
+    def _sorted_items(self):
+        live = (item for item in self.heap if item[4] in self.ranked)
+        return sorted(live, key=lambda item: item[:4], reverse=True)
+
+    def results(self):
+        """(entries by relevance score then date, number of distinct items seen)"""
+        return [item[5] for item in self._sorted_items()], len(self.index)
+
+    def to_state(self, offsets):
+        """JSON-ready state; `ranked` (slot digests) is aligned with results() order"""
+        return {
+            "version": STATE_VERSION,
+            "seq": self.seq,
+            "entries_without_url": self.entries_without_url,
+            "merged": self.merged,
+            "evicted": self.evicted,
+            "offsets": offsets,
+            "index": {digest.hex(): slot for digest, slot in self.index.items()},
+            "ranked": [item[3].hex() for item in self._sorted_items()],
+        }
+
+    @classmethod
+    def from_state(cls, state, entries, max_entries=MAX_AGGREGATED_ENTRIES):
+        """Rebuild from to_state() output and the aggregated entries it was saved with"""
+        agg = cls(max_entries)
+        agg.seq = state["seq"]
+        agg.entries_without_url = state["entries_without_url"]
+        agg.merged = state["merged"]
+        agg.evicted = state["evicted"]
+        agg.index = {bytes.fromhex(digest): slot for digest, slot in state["index"].items()}
+        for digest, slot in agg.index.items():
+            agg.fingerprinted.add(slot[0], slot[3])
+            for n, fingerprint in enumerate(slot[4]):
+                agg.fingerprinted.add((digest, n), fingerprint)
+        for digest, e in zip(state["ranked"], entries):
+            digest = bytes.fromhex(digest)
+            seq, rank, _, fingerprint, _ = agg.index[digest]
+            item = (e.turbo_score, str(e.date or ''), -rank, digest, seq, e)
+            agg.heap.append(item)
+            agg._rank(item, fingerprint)
+        heapq.heapify(agg.heap)
+        return agg
+
+
+def aggregate_data(max_entries=MAX_AGGREGATED_ENTRIES, day=None):
+    """
+    Aggregate data from all sources with Turbo-centric filtering (for today, or `day`)
+
+    Full rebuild: every source file is streamed record by record as
+    PulseEntry records through an Aggregator (see there for the rules).
+    Returns (entries, total distinct items, aggregator).
+    """
+    print(f"🔄 Aggregating data from all {len(SOURCES)} sources...")
+    today = day or datetime.now().strftime("%Y-%m-%d")
+    agg = Aggregator(max_entries)
+
+    for rank, (source_dir, label) in enumerate(SOURCES):
+        count = 0
+        for e in load_entries(f"data/{source_dir}/{today}.json"):
+            count += 1
+            agg.add(e, rank)
+        print(f"  {label}: {count} entries")
+
+    if agg.entries_without_url:
+        print(f"⚠️  Warning: {agg.entries_without_url} entries missing URL field (using title as fallback)")
+    if agg.merged:
+        print(f"🔗 Merged {agg.merged} near-duplicate entries into existing records")
+
+    sorted_entries, total = agg.results()
+    print(f"✅ Aggregated {len(sorted_entries)} high-relevance entries (from {total} total)")
+    return sorted_entries, total, agg
+
+
+# ---------------------------------------------------------------------------
+# Incremental (hourly) aggregation
+# ---------------------------------------------------------------------------
+
+STATE_DIR = Path(os.getenv("PULSE_AGGREGATE_STATE_DIR", "data/cache/aggregate_state"))
+STATE_VERSION = 3  # 2: journal positions carry the journal id; 3: slots carry source rank and fingerprints
+
+
+def _state_path(day):
+    return STATE_DIR / f"{day}.json"
+
+
+def _file_digest(filename):
+    return hashlib.blake2b(Path(filename).read_bytes(), digest_size=16).hexdigest()
+
+
+def save_state(agg, day, offsets):
+    """Persist the aggregator state for `day` (tied to the saved aggregated file) and drop other days' states"""
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _state_path(day)
+    state = agg.to_state(offsets)
+    state["aggregated_digest"] = _file_digest(get_today_filename(day))
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(',', ':'))
+    tmp.replace(path)
+    for stale in STATE_DIR.glob("*.json"):
+        if stale != path:
+            stale.unlink()
+
+
+def journal_offsets(day):
+    """Current end (journal.position) of every source's journal for `day`"""
+    return {source_dir: journal.position(source_dir, day) for source_dir, _ in SOURCES}
+
+
+def aggregate_incremental(max_entries=MAX_AGGREGATED_ENTRIES):
+    """
+    Apply only the journal records added since the previous run today
+
+    The result is the one a full rebuild (--full) would give: each record is
+    applied with Aggregator.replay()/remove(), which refuse a record whose
+    outcome depends on its place in the source order (a link shared across
+    sources, a near-duplicate, a removal from a shared link...).
+
+    Returns (entries, total, aggregator, offsets), or None when a full rebuild
+    is needed: no usable state (first run of the day, cache miss, aggregated
+    file changed, a journal replaced since the state was saved) or a record
+    the replay refused.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    path = _state_path(today)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    filename = get_today_filename(today)
+    # The state describes one exact aggregated file; anything else rewrote it since
+    if (state.get("version") != STATE_VERSION or not os.path.exists(filename)
+            or state.get("aggregated_digest") != _file_digest(filename)):
+        return None
+    entries = list(load_entries(filename))
+
+    print("⚡ Incremental aggregation from the ingestion journal...")
+    agg = Aggregator.from_state(state, entries, max_entries)
+    offsets = dict(state["offsets"])
+    applied = 0
+    for rank, (source_dir, label) in enumerate(SOURCES):
+        records, offsets[source_dir] = journal.read_since(source_dir, today, offsets.get(source_dir))
+        if records is None:
+            # A fresh journal (e.g. after a cache miss) doesn't continue where the state stopped
+            print(f"⚠️  {label} journal was replaced since the last run - rebuilding from source files")
+            return None
+        try:
+            for record in records:
+                if journal.REMOVED in record:
+                    agg.remove(record[journal.REMOVED], rank)
+                else:
+                    agg.replay(PulseEntry.from_dict(record), rank)
+        except ReplayConflict as conflict:
+            print(f"⚠️  {label} record can't be applied on its own ({conflict}) - rebuilding from source files")
+            return None
+        if records:
+            print(f"  {label}: {len(records)} new, changed or removed entries")
+        applied += len(records)
+
+    sorted_entries, total = agg.results()
+    print(f"✅ Applied {applied} journal records: {len(sorted_entries)} high-relevance entries (from {total} total)")
+    return sorted_entries, total, agg, offsets
+
+
+def save_aggregated(entries, day=None):
+    """Save aggregated data, writing entries one at a time"""
     if not entries:
         print("⚠️  No data to save")
         return
     
-    filename = get_today_filename()
+    filename = get_today_filename(day)
     
-    with open(filename, 'w') as f:
-        json.dump(entries, f, indent=2)
+    with JSONArrayWriter(filename) as writer:
+        for entry in entries:
+            writer.write(entry.to_dict())
     
     print(f"💾 Saved aggregated data to {filename}")
 
 
-def save_yield_metrics(filtered_count, total_count):
+def save_yield_metrics(filtered_count, total_count, day=None):
     """Save daily yield metrics for monitoring"""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = day or datetime.now().strftime("%Y-%m-%d")
     yield_filename = f"data/insights/{today}_yield.json"
     
     # Ensure directory exists
     Path("data/insights").mkdir(parents=True, exist_ok=True)
     
     yield_data = {
-        "date": datetime.now().isoformat(),
+        # Backfilled days are stamped with their own date so reruns are reproducible
+        "date": f"{day}T00:00:00" if day else datetime.now().isoformat(),
         "total_items": total_count,
         "high_relevance_items": filtered_count,
         "turbo_sources": filtered_count,
@@ -202,14 +497,64 @@ def save_yield_metrics(filtered_count, total_count):
     print(f"📊 Saved yield metrics to {yield_filename}")
 
 
+def backfill_inputs(day):
+    """Source files a day's aggregation reads"""
+    return [f"data/{source_dir}/{day}.json" for source_dir, _ in SOURCES]
+
+
+def backfill_outputs(day):
+    return [f"data/insights/{day}_yield.json"]
+
+
+# Scripts whose changes alter aggregated output
+BACKFILL_CODE = ["aggregate.py", "relevance.py", "dedupe.py", "json_stream.py"]
+
+
+def process_day(day):
+    """Aggregate one past day (backfill worker; novelty is annotated afterwards in date order)"""
+    entries, total_count, _ = aggregate_data(day=day)
+    save_aggregated(entries, day)
+    save_yield_metrics(len(entries), total_count, day)
+
+
 def main():
     """Main aggregation function"""
+    parser = argparse.ArgumentParser(description="Ollama Pulse data aggregation")
+    backfill.add_date_arguments(parser)
+    parser.add_argument("--full", action="store_true",
+                        help="Rebuild today's aggregate from the source files instead of the journal")
+    args = parser.parse_args()
+    days = backfill.resolve_days(args)
+
     print("🚀 Starting data aggregation...")
     ensure_data_dir()
+
+    if days:
+        done = backfill.run_days("aggregate", process_day, days, backfill_inputs, backfill_outputs,
+                                 code=BACKFILL_CODE, workers=args.workers, force=args.force)
+        if done:
+            # Novelty depends on every earlier day, so replay the index in date order
+            print("🔄 Re-annotating novelty for reprocessed days...")
+            seen_index.rebuild(rewrite_days=set(done))
+        print("✅ Data aggregation backfill complete!")
+        return
     
-    entries, total_count = aggregate_data()
+    today = datetime.now().strftime("%Y-%m-%d")
+    result = None if args.full else aggregate_incremental()
+    if result is None:
+        # Journal records already in the source files must not be applied again
+        offsets = journal_offsets(today)
+        entries, total_count, agg = aggregate_data()
+    else:
+        entries, total_count, agg, offsets = result
+    if entries:
+        seen_index.seed_if_missing()
+        new_count = seen_index.annotate(entries)
+        print(f"🆕 {new_count} of {len(entries)} entries are new (not reported on earlier days)")
     save_aggregated(entries)
     save_yield_metrics(len(entries), total_count)
+    if entries:
+        save_state(agg, today, offsets)
     
     print("✅ Data aggregation complete!")
 
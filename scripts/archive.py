@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Columnar Archive
+
+Optional compact, column-oriented copy of the daily JSON history, so
+multi-day analysis reads only the columns, dates and sources it needs
+instead of parsing every pretty-printed daily file in full.
+
+Tables (one file per table and day, rows grouped by source):
+    aggregated  - data/aggregated/YYYY-MM-DD.json entries
+    snapshots   - top-level data/YYYY-MM-DD.json entries
+    patterns    - data/insights/YYYY-MM-DD.json patterns, one row per item,
+                  with the pattern name in a `pattern` column (grouped by it)
+    yield       - data/insights/YYYY-MM-DD_yield.json metrics
+
+The archive is a derived cache, not history: it lives in data/cache/archive
+(gitignored, restored in CI with actions/cache) and only completed days are
+archived, so the hourly runs never rewrite or commit binary files.
+
+Storage backends:
+- Parquet (when pyarrow is installed): data/cache/archive/<table>/<date>.parquet,
+  one row group per source, nested values stored as JSON strings
+- pulse-cols (always available): data/cache/archive/<table>/<date>.cols
+    line 1   JSON header: {"format": "pulse-cols/1", "rows": N,
+             "columns": {name: [offset, length]}, "json_columns": [...],
+             "partitions": {source: [first_row, end_row]}}
+    rest     one zlib-compressed JSON array per column, at `offset` bytes
+             after the header line
+  A reader seeks to and inflates only the requested columns.
+
+data/cache/archive/<table>/_index.json lists every archived day (rows, sources,
+columns, backend, hash of the source file), so date and source selection
+never opens a file that cannot match, and rebuilding skips unchanged days.
+
+Usage:
+    python scripts/archive.py build
+    python scripts/archive.py query --table aggregated --columns title,turbo_score \\
+        --from 2026-05-01 --to 2026-05-31 --source github
+    (for the patterns table, --source selects pattern names)
+
+    from archive import scan
+    for row in scan("aggregated", columns=["title", "turbo_score"], start="2026-05-01"):
+        ...
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DATA_DIR = Path("data")
+ARCHIVE_DIR = Path(os.getenv("PULSE_ARCHIVE_DIR", "data/cache/archive"))
+COLS_FORMAT = "pulse-cols/1"
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+# ---------------------------------------------------------------------------
+# Source files -> rows
+# ---------------------------------------------------------------------------
+
+def _load_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _entry_rows(path: Path) -> List[Dict]:
+    data = _load_json(path)
+    if isinstance(data, dict):
+        data = data.get('entries', [data])
+    return [e for e in data if isinstance(e, dict)] if isinstance(data, list) else []
+
+
+def _pattern_rows(path: Path) -> List[Dict]:
+    data = _load_json(path)
+    rows = []
+    for pattern, items in (data.get('patterns') or {}).items():
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict):
+                rows.append({**item, "pattern": pattern})
+    return rows
+
+
+def _yield_rows(path: Path) -> List[Dict]:
+    data = _load_json(path)
+    return [data] if isinstance(data, dict) else []
+
+
+# table -> (source file for a day, row loader)
+TABLES = {
+    "aggregated": (lambda day: DATA_DIR / "aggregated" / f"{day}.json", _entry_rows),
+    "snapshots": (lambda day: DATA_DIR / f"{day}.json", _entry_rows),
+    "patterns": (lambda day: DATA_DIR / "insights" / f"{day}.json", _pattern_rows),
+    "yield": (lambda day: DATA_DIR / "insights" / f"{day}_yield.json", _yield_rows),
+}
+
+# Column a table's rows are grouped and filtered by, when it is not "source"
+PARTITION_COLUMNS = {"patterns": "pattern"}
+
+
+def available_days(table: str) -> List[str]:
+    """Days that have a source file for this table"""
+    source_for, _ = TABLES[table]
+    folder = source_for("2000-01-01").parent
+    days = set()
+    for path in folder.glob("????-??-??*.json"):
+        day = path.name[:10]
+        if DATE_RE.match(day) and source_for(day).exists():
+            days.add(day)
+    return sorted(days)
+
+
+def _to_columns(rows: List[Dict]):
+    """Rows (grouped by source) -> column lists, JSON-encoding nested or mixed-type columns"""
+    names = []
+    for row in rows:
+        for key in row:
+            if key not in names:
+                names.append(key)
+
+    columns, json_columns = {}, []
+    for name in names:
+        values = [row.get(name) for row in rows]
+        kinds = {type(v) for v in values if v is not None}
+        if len(kinds) > 1 or kinds & {list, dict}:
+            if kinds <= {int, float}:
+                values = [None if v is None else float(v) for v in values]
+            else:
+                values = [None if v is None else json.dumps(v, ensure_ascii=False) for v in values]
+                json_columns.append(name)
+        columns[name] = values
+    return columns, json_columns
+
+
+def _partitions(rows: List[Dict], key: str = "source") -> Dict[str, List[int]]:
+    partitions: Dict[str, List[int]] = {}
+    for i, row in enumerate(rows):
+        source = str(row.get(key, ''))
+        if source in partitions:
+            partitions[source][1] = i + 1
+        else:
+            partitions[source] = [i, i + 1]
+    return partitions
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+def _write_cols(path: Path, rows: List[Dict], key: str = "source"):
+    columns, json_columns = _to_columns(rows)
+    blobs, offsets, offset = [], {}, 0
+    for name, values in columns.items():
+        blob = zlib.compress(json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 9)
+        offsets[name] = [offset, len(blob)]
+        offset += len(blob)
+        blobs.append(blob)
+
+    header = {
+        "format": COLS_FORMAT,
+        "rows": len(rows),
+        "columns": offsets,
+        "json_columns": json_columns,
+        "partitions": _partitions(rows, key),
+    }
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(json.dumps(header, separators=(',', ':')).encode('utf-8') + b"\n")
+        for blob in blobs:
+            f.write(blob)
+    tmp.replace(path)
+
+
+def _write_parquet(path: Path, rows: List[Dict], key: str = "source"):
+    columns, json_columns = _to_columns(rows)
+    table = pa.table(columns).replace_schema_metadata({"json_columns": json.dumps(json_columns)})
+    tmp = path.with_suffix(".tmp")
+    with pq.ParquetWriter(tmp, table.schema, compression="zstd") as writer:
+        # One row group per source, so source filters skip whole groups
+        for start, end in _partitions(rows, key).values():
+            writer.write_table(table.slice(start, end - start))
+    tmp.replace(path)
+
+
+def _index_path(table: str) -> Path:
+    return ARCHIVE_DIR / table / "_index.json"
+
+
+def load_index(table: str) -> Dict[str, Dict]:
+    path = _index_path(table)
+    return _load_json(path) if path.exists() else {}
+
+
+def archive_day(table: str, day: str, index: Optional[Dict] = None, force: bool = False) -> bool:
+    """Archive one day of a table; returns False when the day was already up to date"""
+    source_for, load_rows = TABLES[table]
+    source = source_for(day)
+    if not source.exists():
+        return False
+
+    own_index = index is None
+    index = load_index(table) if own_index else index
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+    backend = "parquet" if PARQUET_AVAILABLE else "cols"
+    key = PARTITION_COLUMNS.get(table, "source")
+    current = index.get(day)
+    if (not force and current and current["source_hash"] == digest and current["backend"] == backend
+            and current.get("partition", "source") == key):
+        return False
+
+    rows = load_rows(source)
+    # Group rows by source (or pattern) so each one is a contiguous partition
+    rows.sort(key=lambda row: str(row.get(key, '')))
+
+    folder = ARCHIVE_DIR / table
+    folder.mkdir(parents=True, exist_ok=True)
+    filename = f"{day}.parquet" if backend == "parquet" else f"{day}.cols"
+    for stale in folder.glob(f"{day}.*"):
+        if stale.name != filename:
+            stale.unlink()
+    (_write_parquet if backend == "parquet" else _write_cols)(folder / filename, rows, key)
+
+    index[day] = {
+        "file": filename,
+        "backend": backend,
+        "rows": len(rows),
+        "partition": key,
+        "sources": sorted(_partitions(rows, key)),
+        "columns": list(_to_columns(rows)[0]) if rows else [],
+        "source_hash": digest,
+    }
+    if own_index:
+        save_index(table, index)
+    return True
+
+
+def save_index(table: str, index: Dict):
+    path = _index_path(table)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(index.items())), f, indent=1)
+
+
+def build(tables: Sequence[str] = tuple(TABLES), force: bool = False,
+          include_today: bool = False) -> Dict[str, int]:
+    """Archive every completed day that is new or changed; returns days written per table"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    written = {}
+    for table in tables:
+        index = load_index(table)
+        count = 0
+        for day in available_days(table):
+            # Today's files still change every hour
+            if day >= today and not include_today:
+                continue
+            try:
+                count += archive_day(table, day, index=index, force=force)
+            except (ValueError, OSError) as e:
+                print(f"⚠️  Skipping {table}/{day}: {e}")
+        save_index(table, index)
+        written[table] = count
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+def _read_cols(path: Path, columns: Optional[Sequence[str]], sources: Optional[set]) -> Dict[str, list]:
+    with open(path, 'rb') as f:
+        header = json.loads(f.readline())
+        base = f.tell()
+        names = [c for c in (columns or header["columns"]) if c in header["columns"]]
+
+        data = {}
+        for name in names:
+            offset, length = header["columns"][name]
+            f.seek(base + offset)
+            values = json.loads(zlib.decompress(f.read(length)))
+            if name in header["json_columns"]:
+                values = [None if v is None else json.loads(v) for v in values]
+            data[name] = values
+
+    if sources is not None:
+        keep = [i for source, (start, end) in header["partitions"].items()
+                if source in sources for i in range(start, end)]
+        data = {name: [values[i] for i in keep] for name, values in data.items()}
+    return data
+
+
+def _read_parquet(path: Path, columns: Optional[Sequence[str]], sources: Optional[set],
+                  key: str = "source") -> Dict[str, list]:
+    schema = pq.read_schema(path)
+    json_columns = set(json.loads((schema.metadata or {}).get(b"json_columns", b"[]")))
+    names = [c for c in (columns or schema.names) if c in schema.names]
+    filters = [(key, "in", sorted(sources))] if sources is not None and key in schema.names else None
+    table = pq.read_table(path, columns=names, filters=filters)
+
+    data = {}
+    for name in names:
+        values = table.column(name).to_pylist()
+        if name in json_columns:
+            values = [None if v is None else json.loads(v) for v in values]
+        data[name] = values
+    return data
+
+
+def scan(table: str, columns: Optional[Sequence[str]] = None, start: Optional[str] = None,
+         end: Optional[str] = None, sources: Optional[Sequence[str]] = None) -> Iterator[Dict]:
+    """
+    Rows of an archived table, oldest day first
+
+    Args:
+        table: One of TABLES
+        columns: Fields to read (default: all); missing fields come back as None
+        start, end: Inclusive YYYY-MM-DD bounds
+        sources: Only rows from these sources (pattern names for the patterns table)
+
+    Each row also carries 'archive_date'.
+    """
+    wanted = set(sources) if sources is not None else None
+    for day, meta in sorted(load_index(table).items()):
+        if (start and day < start) or (end and day > end):
+            continue
+        if wanted is not None and not wanted.intersection(meta["sources"]):
+            continue
+
+        path = ARCHIVE_DIR / table / meta["file"]
+        if meta["backend"] == "parquet":
+            data = _read_parquet(path, columns, wanted, meta.get("partition", "source"))
+        else:
+            data = _read_cols(path, columns, wanted)
+
+        names = list(columns) if columns else list(data)
+        count = len(next(iter(data.values()))) if data else 0
+        for i in range(count):
+            row = {name: data[name][i] if name in data else None for name in names}
+            row["archive_date"] = day
+            yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse columnar archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help="Archive new or changed days")
+    build_cmd.add_argument("--table", choices=list(TABLES), action="append",
+                           help="Table to build (repeatable; default: all)")
+    build_cmd.add_argument("--force", action="store_true", help="Rewrite every day")
+    build_cmd.add_argument("--include-today", action="store_true",
+                           help="Also archive today, which is still being ingested")
+
+    query_cmd = sub.add_parser("query", help="Print rows as JSON lines")
+    query_cmd.add_argument("--table", choices=list(TABLES), default="aggregated")
+    query_cmd.add_argument("--columns", help="Comma-separated fields (default: all)")
+    query_cmd.add_argument("--from", dest="start", help="First day (YYYY-MM-DD)")
+    query_cmd.add_argument("--to", dest="end", help="Last day (YYYY-MM-DD)")
+    query_cmd.add_argument("--source", action="append", help="Source to include (repeatable)")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        backend = "Parquet" if PARQUET_AVAILABLE else "pulse-cols"
+        print(f"🗄️  Building columnar archive ({backend})...")
+        written = build(args.table or list(TABLES), force=args.force, include_today=args.include_today)
+        for table, count in written.items():
+            print(f"  {table}: {count} day(s) written")
+        print(f"✅ Archive up to date in {ARCHIVE_DIR}/")
+        return 0
+
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    for row in scan(args.table, columns, args.start, args.end, args.source):
+        sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
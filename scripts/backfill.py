@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Multi-day Backfill
+
+Shared --date / --from / --to mode for the daily stages (aggregate,
+mine_insights, generate_report). A date range is reprocessed through a
+process pool, one task per day, with a progress line as each day finishes.
+
+Runs are idempotent: every finished day is stamped with a content hash of its
+input files plus the stage's code, so a rerun skips days whose inputs and
+code are unchanged (and whose outputs still exist), while a change to e.g.
+relevance.py re-scores every day.
+
+Usage (inside a stage script):
+    parser = argparse.ArgumentParser()
+    backfill.add_date_arguments(parser)
+    args = parser.parse_args()
+    days = backfill.resolve_days(args)          # None -> normal run for today
+    if days:
+        backfill.run_days("aggregate", process_day, days, inputs_for, outputs_for,
+                          code=["aggregate.py", "relevance.py"], workers=args.workers)
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# Anchored to the repo root: generate_report runs from scripts/, the rest from the root
+STAMP_PATH = Path(os.getenv("PULSE_BACKFILL_DB", SCRIPTS_DIR.parent / "data" / "cache" / "backfill.db"))
+
+
+@contextmanager
+def _get_connection():
+    """Context manager for backfill stamp connections"""
+    STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(STAMP_PATH, timeout=30.0)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS backfill_stamps (
+            stage TEXT NOT NULL,
+            day TEXT NOT NULL,
+            input_hash TEXT NOT NULL,
+            finished_at TEXT NOT NULL,
+            PRIMARY KEY (stage, day)
+        )
+    ''')
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _quiet_worker():
+    """Silence per-day stage logging in pool workers so the progress lines stay readable"""
+    sys.stdout = open(os.devnull, 'w')
+
+
+def add_date_arguments(parser):
+    """Add --date, --from, --to, --workers and --force to a stage's CLI"""
+    parser.add_argument("--date", help="Process a single day (YYYY-MM-DD) instead of today")
+    parser.add_argument("--from", dest="start", help="First day of a backfill range (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", help="Last day of a backfill range (default: today)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Parallel worker processes for a range (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess days even if their inputs are unchanged")
+
+
+def resolve_days(args) -> Optional[List[str]]:
+    """Days selected on the command line, or None for the normal run for today"""
+    if args.date:
+        return [date.fromisoformat(args.date).isoformat()]
+    if not args.start:
+        if args.end:
+            raise SystemExit("--to needs --from")
+        return None
+
+    start = date.fromisoformat(args.start)
+    end = date.fromisoformat(args.end) if args.end else date.today()
+    if end < start:
+        raise SystemExit(f"--to ({end}) is before --from ({start})")
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def content_hash(paths: Iterable, code: Iterable[str] = ()) -> str:
+    """Hash of the given files (missing ones count as absent) plus stage code in scripts/"""
+    h = hashlib.sha256()
+    for path in [Path(p) for p in paths] + [SCRIPTS_DIR / name for name in code]:
+        h.update(str(path.name).encode('utf-8'))
+        if path.exists():
+            h.update(path.read_bytes())
+        else:
+            h.update(b"\0missing")
+    return h.hexdigest()
+
+
+def run_days(stage: str, process_day: Callable[[str], object], days: List[str],
+             inputs_for: Callable[[str], List], outputs_for: Callable[[str], List],
+             code: Iterable[str] = (), workers: int = 1, force: bool = False) -> List[str]:
+    """
+    Run process_day(day) for every day whose inputs changed since its last run
+
+    process_day must be a module-level function (it is sent to worker
+    processes). Days with no existing inputs are skipped. Returns the days
+    that were processed successfully.
+    """
+    code = list(code)
+    with _get_connection() as conn:
+        stamps = dict(conn.execute(
+            'SELECT day, input_hash FROM backfill_stamps WHERE stage = ?', (stage,)
+        ).fetchall())
+
+    pending, hashes, skipped, empty = [], {}, 0, 0
+    for day in days:
+        inputs = inputs_for(day)
+        if not any(Path(p).exists() for p in inputs):
+            empty += 1
+            continue
+        hashes[day] = content_hash(inputs, code)
+        outputs_present = all(Path(p).exists() for p in outputs_for(day))
+        if not force and stamps.get(day) == hashes[day] and outputs_present:
+            skipped += 1
+            continue
+        pending.append(day)
+
+    print(f"📅 {stage}: {len(pending)} day(s) to process, {skipped} unchanged, {empty} without input")
+    if not pending:
+        return []
+
+    done, failed = [], []
+    started = time.monotonic()
+
+    def finished(day, error=None):
+        elapsed = time.monotonic() - started
+        count = len(done) + len(failed) + 1
+        if error is None:
+            done.append(day)
+            with _get_connection() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO backfill_stamps (stage, day, input_hash, finished_at) '
+                    'VALUES (?, ?, ?, ?)',
+                    (stage, day, hashes[day], datetime.now().isoformat())
+                )
+            print(f"  [{count}/{len(pending)}] ✅ {day} ({elapsed:.1f}s elapsed)")
+        else:
+            failed.append(day)
+            print(f"  [{count}/{len(pending)}] ❌ {day}: {error}")
+
+    if workers <= 1 or len(pending) == 1:
+        for day in pending:
+            try:
+                process_day(day)
+                finished(day)
+            except Exception as e:
+                finished(day, e)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), initializer=_quiet_worker) as pool:
+            futures = {pool.submit(process_day, day): day for day in pending}
+            for future in as_completed(futures):
+                error = future.exception()
+                finished(futures[future], error)
+
+    elapsed = time.monotonic() - started
+    if failed:
+        print(f"⚠️  {stage}: {len(done)} day(s) processed in {elapsed:.1f}s, "
+              f"{len(failed)} failed: {', '.join(sorted(failed))}")
+    else:
+        print(f"✅ {stage}: {len(done)} day(s) processed in {elapsed:.1f}s")
+    return sorted(done)
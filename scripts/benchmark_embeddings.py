@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Embedding Engine Benchmark
+
+Compares the PyTorch (sentence-transformers) and quantized ONNX encoders on
+real titles and summaries from data/aggregated: model load time, encode
+throughput, peak RSS and cosine agreement with PyTorch. Each engine runs in
+its own child process so load cost and memory are measured from a cold start.
+
+Usage:
+    python scripts/benchmark_embeddings.py                       # both engines, 1000 texts
+    python scripts/benchmark_embeddings.py --texts 5000 --threads 2
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from onnx_embedder import DEFAULT_MODEL, _cosines, validation_texts
+
+ENGINES = ["torch", "onnx"]
+
+
+def run_engine(engine: str, model_name: str, texts_path: Path, out_path: Path, threads: int):
+    """Child process: load one engine, encode the texts, report timings as JSON"""
+    with open(texts_path, 'r', encoding='utf-8') as f:
+        texts = json.load(f)
+
+    start = time.perf_counter()
+    if engine == "onnx":
+        import onnx_embedder
+        encoder = onnx_embedder.load(model_name, threads=threads)
+    else:
+        import torch
+        from sentence_transformers import SentenceTransformer
+        if threads:
+            torch.set_num_threads(threads)
+        model = SentenceTransformer(model_name, device="cpu")
+        encoder = lambda batch: model.encode(batch, batch_size=64)
+    load_seconds = time.perf_counter() - start
+
+    encoder(texts[:16])  # Warm-up outside the timed run
+    start = time.perf_counter()
+    vectors = np.asarray(encoder(texts), dtype=np.float32)
+    encode_seconds = time.perf_counter() - start
+    np.save(out_path, vectors)
+
+    print(json.dumps({
+        "load_seconds": round(load_seconds, 2),
+        "encode_seconds": round(encode_seconds, 2),
+        "texts_per_second": round(len(texts) / encode_seconds, 1),
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PyTorch vs quantized ONNX embeddings")
+    parser.add_argument("--texts", type=int, default=1000, help="Number of texts to encode (default: 1000)")
+    parser.add_argument("--threads", type=int, default=0, help="Intra-op threads for both engines (default: runtime default)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Comma-separated engines (default: torch,onnx)")
+    parser.add_argument("--worker", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--texts-file", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_engine(args.worker, args.model, Path(args.texts_file), Path(args.out), args.threads)
+        return 0
+
+    texts = validation_texts(args.texts)
+    # Repeat the sample if history is shorter than requested
+    texts = (texts * (args.texts // len(texts) + 1))[:args.texts]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip() in ENGINES]
+    print(f"🏁 Benchmarking {', '.join(engines)} on {len(texts)} texts ({args.model})")
+
+    results, vectors = {}, {}
+    with tempfile.TemporaryDirectory() as tmp:
+        texts_path = Path(tmp) / "texts.json"
+        with open(texts_path, 'w', encoding='utf-8') as f:
+            json.dump(texts, f)
+        for engine in engines:
+            out_path = Path(tmp) / f"{engine}.npy"
+            proc = subprocess.run(
+                [sys.executable, __file__, "--worker", engine, "--model", args.model,
+                 "--threads", str(args.threads), "--texts-file", str(texts_path), "--out", str(out_path)],
+                capture_output=True, text=True, env={**os.environ, "PYTHONPATH": str(Path(__file__).parent)},
+            )
+            if proc.returncode != 0:
+                print(f"⚠️  {engine} failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode}")
+                continue
+            results[engine] = json.loads(proc.stdout.strip().splitlines()[-1])
+            vectors[engine] = np.load(out_path)
+
+    print(f"\n{'engine':<8} {'load s':>8} {'encode s':>9} {'texts/s':>9} {'peak RSS MB':>12} {'min cos':>8} {'mean cos':>9}")
+    for engine, r in results.items():
+        agreement = ""
+        if engine != "torch" and "torch" in vectors:
+            cosines = _cosines(vectors["torch"], vectors[engine])
+            agreement = f"{cosines.min():8.4f} {cosines.mean():9.4f}"
+        print(f"{engine:<8} {r['load_seconds']:8.2f} {r['encode_seconds']:9.2f} {r['texts_per_second']:9.1f} "
+              f"{r['peak_rss_mb']:12.1f} {agreement}")
+    if "torch" in results and "onnx" in results:
+        speedup = results["onnx"]["texts_per_second"] / results["torch"]["texts_per_second"]
+        print(f"\n⚡ ONNX int8 throughput: {speedup:.2f}x PyTorch")
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,8 @@
 import json, os, sys
 from datetime import datetime
 
+from relevance import BOUNTY_TURBO
+
 def load_bounties():
     today = datetime.now().strftime("%Y-%m-%d")
     bounty_file = f"../data/bounties/{today}.json"
@@ -10,16 +12,11 @@ def load_bounties():
     with open(bounty_file, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def bounty_text(bounty):
+    return bounty.get('title', '') + ' ' + bounty.get('summary', '')
+
 def score_bounty_turbo_relevance(bounty):
-    text = (bounty.get('title', '') + ' ' + bounty.get('summary', '')).lower()
-    score = 0.0
-    if 'ollama' in text:
-        score += 0.4
-    if 'turbo' in text or 'cloud' in text:
-        score += 0.3
-    if 'llm' in text or 'ai' in text:
-        score += 0.2
-    return min(score, 1.0)
+    return BOUNTY_TURBO.score(bounty_text(bounty))
 
 def format_turbo_score(score):
     if score >= 0.8:
@@ -40,8 +37,8 @@ def render_bounty_section():
         lines.append("No bounty pulses detected today. Check back tomorrow!\n")
         return ''.join(lines)
     
-    for b in bounties:
-        b['turbo_score'] = score_bounty_turbo_relevance(b)
+    for b, score in zip(bounties, BOUNTY_TURBO.score_many(bounty_text(b) for b in bounties)):
+        b['turbo_score'] = float(score)
     bounties.sort(key=lambda b: b['turbo_score'], reverse=True)
     
     lines.append("| Bounty | Source | Reward | Summary | Turbo Score |\n")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Cluster Theme Labels (c-TF-IDF)
+
+Class-based TF-IDF over the ML pattern clusters: a term is distinctive for
+a cluster when it is frequent in that cluster's entries but rare across the
+other clusters. Entry texts are counted once into a sparse entry x term
+matrix and summed per cluster with a sparse membership matrix, so every
+cluster is scored in one pass:
+
+    tf[c, t]  = count of t in cluster c / terms in cluster c
+    idf[t]    = log(1 + mean terms per cluster / count of t over all clusters)
+    weight    = tf * idf
+
+A cluster's label joins two of its top terms ("vision_qwen3-vl"); labels are
+unique across clusters (larger clusters pick first), so no cluster is lost
+to a key collision.
+
+Usage:
+    from cluster_labels import label_clusters
+    labels, keywords = label_clusters({cluster_id: [text, ...], ...})
+"""
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+# Lowercase words of 2+ characters starting with a letter; keeps model names like qwen3-vl or gpt-oss
+TOKEN_PATTERN = r"(?u)\b[a-z][a-z0-9]+(?:-[a-z0-9]+)*\b"
+TOP_TERMS = 8
+LABEL_CANDIDATE_TERMS = 4  # Term pairs tried (in rank order) before falling back to the cluster id
+
+
+def ctfidf_terms(cluster_texts: Dict[int, List[str]], top_n: int = TOP_TERMS) -> Dict[int, List[str]]:
+    """Most distinctive terms per cluster, best first (empty when a cluster has no usable words)"""
+    ids = list(cluster_texts)
+    texts, owners = [], []
+    for row, cid in enumerate(ids):
+        texts.extend(cluster_texts[cid])
+        owners.extend([row] * len(cluster_texts[cid]))
+    if not texts:
+        return {cid: [] for cid in ids}
+
+    vectorizer = CountVectorizer(stop_words='english', token_pattern=TOKEN_PATTERN)
+    try:
+        counts = vectorizer.fit_transform(texts)
+    except ValueError:  # Only stop words / no tokens at all
+        return {cid: [] for cid in ids}
+
+    membership = sparse.csr_matrix(
+        (np.ones(len(owners)), (owners, np.arange(len(owners)))), shape=(len(ids), len(owners))
+    )
+    class_counts = (membership @ counts).astype(np.float64)
+    words = np.asarray(class_counts.sum(axis=1)).ravel()
+    term_totals = np.asarray(class_counts.sum(axis=0)).ravel()
+    tf = sparse.diags(1.0 / np.clip(words, 1.0, None)) @ class_counts
+    idf = np.log1p(words.mean() / term_totals)
+    weights = (tf @ sparse.diags(idf)).tocsr()
+
+    vocabulary = vectorizer.get_feature_names_out()
+    terms = {}
+    for row, cid in enumerate(ids):
+        start, end = weights.indptr[row], weights.indptr[row + 1]
+        data, columns = weights.data[start:end], weights.indices[start:end]
+        # Highest weight first, ties broken alphabetically so labels are reproducible
+        order = np.lexsort((vocabulary[columns], -data))[:top_n]
+        terms[cid] = [str(vocabulary[columns[i]]) for i in order]
+    return terms
+
+
+def unique_labels(terms: Dict[int, List[str]]) -> Dict[int, str]:
+    """One label per cluster from its top terms, never repeating a label"""
+    taken = set()
+    labels = {}
+    for cid, top in terms.items():
+        head = top[:LABEL_CANDIDATE_TERMS]
+        candidates = ["_".join(pair) for pair in combinations(head, 2)] or head
+        label = next((c for c in candidates if c not in taken), None)
+        if label is None:
+            label = f"{'_'.join(top[:2]) or 'cluster'}_{cid}"
+        taken.add(label)
+        labels[cid] = label
+    return labels
+
+
+def label_clusters(cluster_texts: Dict[int, List[str]],
+                   top_n: int = TOP_TERMS) -> Tuple[Dict[int, str], Dict[int, List[str]]]:
+    """(label, top terms) per cluster; pass clusters largest first so they get the plainest labels"""
+    terms = ctfidf_terms(cluster_texts, top_n)
+    return unique_labels(terms), terms
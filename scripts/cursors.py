@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Incremental Ingestion Cursors
+
+Persistent high-water marks keyed by (source, query): the last-seen
+timestamp, id or API cursor. Ingesters ask upstream APIs only for items newer
+than the mark and merge the delta into the day's file.
+
+Cursors are scoped to the day they were written. The first run of a day
+fetches the usual full window (so every daily file stays self-contained),
+and the remaining hourly runs only transfer what is new.
+
+Fetchers only propose a new mark with stage_cursor(). Inside Source.run()
+proposals are held until the fetched items have been saved and journaled,
+so a failed save never moves a cursor past data that was not kept. A
+fetcher proposes nothing when its result may be incomplete (a page or
+limit was filled, a relay never finished), so the next run asks again
+from the old mark.
+
+Usage:
+    import cursors
+    since = cursors.get_cursor("issues", query)       # None on the first run of the day
+    ...
+    if not truncated:
+        cursors.stage_cursor("issues", query, newest_updated_at)
+"""
+import os
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+CURSOR_PATH = Path(os.getenv("PULSE_CURSOR_DB", "data/cache/cursors.db"))
+
+# (source, query) -> value proposed by the fetch in progress (None: write straight away)
+_staged: ContextVar[Optional[Dict[Tuple[str, str], str]]] = ContextVar("staged_cursors", default=None)
+
+
+@contextmanager
+def _get_connection():
+    """Context manager for cursor store connections"""
+    CURSOR_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CURSOR_PATH, timeout=30.0)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_cursors (
+            source TEXT NOT NULL,
+            query TEXT NOT NULL,
+            value TEXT NOT NULL,
+            cursor_day TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (source, query)
+        )
+    ''')
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def get_cursor(source: str, query: str = "") -> Optional[str]:
+    """High-water mark written today for this source/query, or None"""
+    with _get_connection() as conn:
+        row = conn.execute(
+            'SELECT value FROM ingest_cursors WHERE source = ? AND query = ? AND cursor_day = ?',
+            (source, query, _today())
+        ).fetchone()
+    return row[0] if row else None
+
+
+def set_cursor(source: str, query: str, value) -> None:
+    """Advance the high-water mark; empty values are ignored"""
+    if value in (None, ""):
+        return
+    with _get_connection() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO ingest_cursors (source, query, value, cursor_day, updated_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (source, query, str(value), _today(), datetime.now().isoformat())
+        )
+
+
+def set_cursors(values: Dict[Tuple[str, str], str]) -> None:
+    """Write several (source, query) -> value marks in one transaction"""
+    if not values:
+        return
+    now = datetime.now().isoformat()
+    with _get_connection() as conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO ingest_cursors (source, query, value, cursor_day, updated_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            [(source, query, value, _today(), now) for (source, query), value in values.items()]
+        )
+
+
+def stage_into(staged: Dict[Tuple[str, str], str]):
+    """Collect stage_cursor() proposals of the current context into `staged` (returns a reset token)"""
+    return _staged.set(staged)
+
+
+def reset_staging(token) -> None:
+    _staged.reset(token)
+
+
+def stage_cursor(source: str, query: str, value) -> None:
+    """
+    Propose a new high-water mark for the items just fetched
+
+    Held for Source.run() to commit once the items are saved; written
+    straight away when no source run is collecting (standalone helpers).
+    """
+    if value in (None, ""):
+        return
+    staged = _staged.get()
+    if staged is None:
+        set_cursor(source, query, value)
+    else:
+        staged[(source, query)] = str(value)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Duplicate Detection
+
+Two layers used by the aggregation stage:
+- canonical_url(): one spelling per link, so https://github.com/x/y,
+  github.com/x/y/, http://www.github.com/x/y?utm_source=... and
+  .../y#readme all dedupe to the same key
+- NearDuplicateIndex: 64-bit SimHash fingerprints of title + summary with
+  banded LSH lookup, so items from different sources describing the same
+  thing collapse into one record
+
+Usage:
+    from dedupe import canonical_url, simhash, NearDuplicateIndex
+    index = NearDuplicateIndex()
+    match = index.find(simhash(text))       # id of a near-duplicate, or None
+    index.add(record_id, simhash(text))
+"""
+import hashlib
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never change what a link points to
+TRACKING_PARAMS = {
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "ref", "ref_src", "fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "si",
+}
+
+FINGERPRINT_BITS = 64
+# Fingerprints at most this many bits apart are near-duplicates
+MAX_HAMMING_DISTANCE = 3
+# Shorter texts give unstable fingerprints (e.g. "Ollama v0.12.3" vs "v0.12.4")
+MIN_TOKENS = 8
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-:][a-z0-9]+)*")
+
+
+def canonical_url(url: str) -> str:
+    """Normalise a URL for dedupe: scheme, host case, www., tracking params, slash, fragment"""
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme.lower()
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.endswith(":443") or host.endswith(":80"):
+        host = host.rsplit(":", 1)[0]
+
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def tokens(text: str) -> List[str]:
+    """Lowercased word tokens (keeps version strings like v0.12.3 and qwen3:8b whole)"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _hash64(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    64-bit SimHash over word unigrams and bigrams
+
+    Returns None for texts too short to fingerprint reliably.
+    """
+    words = tokens(text)
+    if len(words) < MIN_TOKENS:
+        return None
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    counts = [0] * FINGERPRINT_BITS
+    for feature in features:
+        h = _hash64(feature)
+        for bit in range(FINGERPRINT_BITS):
+            counts[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, count in enumerate(counts):
+        if count > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicateIndex:
+    """Banded LSH over SimHash fingerprints; lookups only compare same-band candidates"""
+
+    def __init__(self, max_distance: int = MAX_HAMMING_DISTANCE):
+        self.max_distance = max_distance
+        # One more band than the allowed distance: fingerprints within the
+        # distance must agree exactly on at least one band (pigeonhole)
+        self.bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.bands
+        # (band number, band value) -> [(record id, fingerprint)]
+        self.buckets: Dict[Tuple[int, int], List[Tuple[object, int]]] = {}
+
+    def _band_keys(self, fingerprint: int):
+        mask = (1 << self.band_bits) - 1
+        for band in range(self.bands):
+            yield band, (fingerprint >> (band * self.band_bits)) & mask
+
+    def find(self, fingerprint: Optional[int]) -> Optional[object]:
+        """Id of the closest indexed near-duplicate, or None"""
+        if fingerprint is None:
+            return None
+        best, best_distance = None, self.max_distance + 1
+        for key in self._band_keys(fingerprint):
+            for record_id, other in self.buckets.get(key, ()):
+                distance = hamming(fingerprint, other)
+                if distance < best_distance:
+                    best, best_distance = record_id, distance
+        return best
+
+    def add(self, record_id, fingerprint: Optional[int]):
+        if fingerprint is None:
+            return
+        for key in self._band_keys(fingerprint):
+            self.buckets.setdefault(key, []).append((record_id, fingerprint))
+
+    def remove(self, record_id, fingerprint: Optional[int]):
+        if fingerprint is None:
+            return
+        for key in self._band_keys(fingerprint):
+            bucket = self.buckets.get(key)
+            if bucket:
+                bucket[:] = [(rid, fp) for rid, fp in bucket if rid != record_id]
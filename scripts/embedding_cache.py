@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Persistent Embedding Cache
+
+Sentence embeddings keyed by a content hash of the embedded text, so each
+distinct title+summary is encoded once across hourly runs and backfills
+instead of on every mining run. One directory per embedding space, i.e. the
+model and the engine that encodes it (PyTorch and quantized ONNX vectors for
+the same text differ):
+
+    data/cache/embeddings/<model>__<engine>/vectors.f16   float16 matrix (capacity x dim), memory-mapped
+    data/cache/embeddings/<model>__<engine>/index.db      hash -> row and last use, free rows, dim/capacity
+
+Once the cache holds more than max_rows vectors, the least recently used
+ones (never ones used today) are evicted and their rows reused. The model
+itself is only needed when a text is missing from the cache; misses are
+encoded through embedding_service (the resident daemon when one is running,
+in-process otherwise).
+
+Usage:
+    from embedding_cache import EmbeddingCache
+    vectors = EmbeddingCache().embed(texts)     # float32 array (len(texts), dim)
+"""
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+import embedding_service
+
+EMBED_DIR = Path(os.getenv("PULSE_EMBEDDING_DIR", "data/cache/embeddings"))
+DEFAULT_MODEL = embedding_service.DEFAULT_MODEL
+DEFAULT_MAX_ROWS = int(os.getenv("PULSE_EMBEDDING_MAX_ROWS", "100000"))
+
+_INITIAL_CAPACITY = 1024
+_EVICT_TO = 0.9  # Evict down to this fraction of max_rows so eviction isn't per insert
+_QUERY_CHUNK = 500  # Stay below SQLite's bound-parameter limit
+
+
+def text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed float16 embedding store in front of a sentence encoder"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, cache_dir: Path = EMBED_DIR,
+                 max_rows: int = DEFAULT_MAX_ROWS,
+                 encoder: Optional[Callable[[List[str]], np.ndarray]] = None,
+                 engine_id: Optional[str] = None):
+        self.model_name = model_name
+        # A custom encoder is a space of its own unless the caller names its engine
+        self.engine_id = engine_id or ("custom" if encoder else embedding_service.resolve_engine(model_name))
+        self.space = f"{model_name.replace('/', '_')}__{self.engine_id}"
+        self.cache_dir = Path(cache_dir) / self.space
+        self.vectors_path = self.cache_dir / "vectors.f16"
+        self.max_rows = max_rows
+        self._encoder = encoder
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager for index connections (transactions are explicit)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_dir / "index.db", timeout=30.0, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript('''
+            CREATE TABLE IF NOT EXISTS embeddings (
+                hash TEXT PRIMARY KEY,
+                row INTEGER NOT NULL,
+                last_used TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used);
+            CREATE TABLE IF NOT EXISTS free_rows (row INTEGER PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        ''')
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _meta(conn, key: str, default: int = 0) -> int:
+        row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return default if row is None else row[0]
+
+    @staticmethod
+    def _set_meta(conn, key: str, value: int):
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._encoder is None:
+            return embedding_service.encode(texts, self.model_name, self.engine_id)
+        return np.asarray(self._encoder(texts), dtype=np.float32)
+
+    def _open(self, conn, mode: str = 'r') -> Optional[np.memmap]:
+        dim = self._meta(conn, "dim")
+        capacity = self._meta(conn, "capacity")
+        if not dim or not capacity:
+            return None
+        return np.memmap(self.vectors_path, dtype=np.float16, mode=mode, shape=(capacity, dim))
+
+    def _lookup(self, conn, hashes: List[str], today: str) -> Dict[str, int]:
+        """hash -> row for cached hashes, marking them used today"""
+        rows = {}
+        for i in range(0, len(hashes), _QUERY_CHUNK):
+            chunk = hashes[i:i + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows.update(conn.execute(
+                f'SELECT hash, row FROM embeddings WHERE hash IN ({placeholders})', chunk
+            ).fetchall())
+            conn.execute(
+                f'UPDATE embeddings SET last_used = ? WHERE hash IN ({placeholders}) AND last_used < ?',
+                [today, *chunk, today]
+            )
+        return rows
+
+    def _store(self, conn, hashes: List[str], vectors: np.ndarray, today: str) -> Dict[str, int]:
+        """Write new vectors into free or appended rows (caller holds the write lock)"""
+        dim = self._meta(conn, "dim") or vectors.shape[1]
+        if vectors.shape[1] != dim:
+            raise ValueError(f"{self.model_name} cache holds {dim}-d vectors, got {vectors.shape[1]}-d")
+
+        free = [r for (r,) in conn.execute('SELECT row FROM free_rows ORDER BY row LIMIT ?', (len(hashes),))]
+        conn.executemany('DELETE FROM free_rows WHERE row = ?', [(r,) for r in free])
+        used = self._meta(conn, "rows")
+        rows = free + list(range(used, used + len(hashes) - len(free)))
+        used += len(hashes) - len(free)
+
+        capacity = self._meta(conn, "capacity")
+        if used > capacity:
+            capacity = max(_INITIAL_CAPACITY, capacity * 2, used)
+            # Growing the file in place keeps existing rows where they are
+            with open(self.vectors_path, 'ab') as f:
+                f.truncate(capacity * dim * 2)
+        self._set_meta(conn, "dim", dim)
+        self._set_meta(conn, "capacity", capacity)
+        self._set_meta(conn, "rows", used)
+
+        matrix = self._open(conn, mode='r+')
+        matrix[rows] = vectors.astype(np.float16)
+        matrix.flush()
+        del matrix
+
+        conn.executemany('INSERT OR REPLACE INTO embeddings (hash, row, last_used) VALUES (?, ?, ?)',
+                         [(h, r, today) for h, r in zip(hashes, rows)])
+        self._evict(conn, today)
+        return dict(zip(hashes, rows))
+
+    def _evict(self, conn, today: str):
+        count = conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+        if count <= self.max_rows:
+            return
+        victims = conn.execute(
+            'SELECT hash, row FROM embeddings WHERE last_used < ? ORDER BY last_used LIMIT ?',
+            (today, count - int(self.max_rows * _EVICT_TO))
+        ).fetchall()
+        conn.executemany('DELETE FROM embeddings WHERE hash = ?', [(h,) for h, _ in victims])
+        conn.executemany('INSERT OR IGNORE INTO free_rows (row) VALUES (?)', [(r,) for _, r in victims])
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embeddings for `texts` (float32, one row per text), encoding only uncached texts"""
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        today = datetime.now().strftime("%Y-%m-%d")
+        hashes = [text_hash(t) for t in texts]
+        unique = list(dict.fromkeys(hashes))
+
+        with self._get_connection() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = self._lookup(conn, unique, today)
+            conn.execute('COMMIT')
+
+            missing = [h for h in unique if h not in rows]
+            self.hits += len(unique) - len(missing)
+            self.misses += len(missing)
+            if missing:
+                text_of = dict(zip(hashes, texts))
+                vectors = self._encode([text_of[h] for h in missing])
+                # Another process (backfill worker) may have stored some meanwhile
+                conn.execute('BEGIN IMMEDIATE')
+                try:
+                    stored = self._lookup(conn, missing, today)
+                    new = [i for i, h in enumerate(missing) if h not in stored]
+                    stored.update(self._store(conn, [missing[i] for i in new], vectors[new], today))
+                    conn.execute('COMMIT')
+                except Exception:
+                    conn.execute('ROLLBACK')
+                    raise
+                rows.update(stored)
+
+            matrix = self._open(conn)
+            return np.asarray(matrix[[rows[h] for h in hashes]], dtype=np.float32)
+
+    def stats(self) -> Dict[str, int]:
+        with self._get_connection() as conn:
+            return {
+                "vectors": conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0],
+                "capacity": self._meta(conn, "capacity"),
+                "dim": self._meta(conn, "dim"),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
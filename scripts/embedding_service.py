@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Resident Embedding Service
+
+A small local daemon that keeps the sentence-transformers model loaded and
+serves encode requests over a Unix socket, so the model is loaded once per
+workflow instead of once per script. Requests arriving within a few
+milliseconds of each other are coalesced into one batch (duplicate texts
+across callers are encoded once).
+
+Callers use encode(); when no daemon is listening (or it fails) the texts are
+encoded in-process, so the service is always optional.
+
+The encoding engine is picked by PULSE_EMBEDDING_ENGINE: "torch"
+(sentence-transformers), "onnx" (quantized ONNX Runtime, exported on first
+use, see onnx_embedder.py) or "auto" (ONNX when a validated export exists).
+The two engines give slightly different vectors, so the engine actually used
+("torch" or "onnx-int8", see resolve_engine) is part of every request and of
+the embedding cache and cluster state keys; the daemon refuses requests for
+an engine it is not running.
+
+Wire format (both directions): 4-byte big-endian header length, JSON header,
+then for responses the float32 matrix as raw bytes.
+    request   {"model": "...", "engine": "...", "texts": [...]}
+    response  {"shape": [n, dim]} + n*dim*4 bytes, or {"error": "..."}
+
+Usage:
+    python scripts/embedding_service.py serve          # foreground
+    python scripts/embedding_service.py start          # background, returns immediately
+    python scripts/embedding_service.py stop
+
+    from embedding_service import encode
+    vectors = encode(["some text", ...])
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+ENGINE = os.getenv("PULSE_EMBEDDING_ENGINE", "auto")  # auto | onnx | torch
+SOCKET_PATH = Path(os.getenv(
+    "PULSE_EMBEDDING_SOCKET",
+    Path(tempfile.gettempdir()) / f"ollama-pulse-embed-{os.getuid()}.sock"
+))
+BATCH_WINDOW_SECONDS = 0.01  # How long the first request waits for others to join its batch
+MAX_BATCH_TEXTS = 512
+DEFAULT_IDLE_TIMEOUT = 900  # Exit after this long without requests
+
+_HEADER = struct.Struct(">I")
+
+
+@lru_cache(maxsize=None)
+def resolve_engine(model_name: str = DEFAULT_MODEL, engine: str = ENGINE) -> str:
+    """
+    Engine that encodes a model under an engine setting: "onnx-int8" or "torch"
+
+    "auto" means ONNX only when a validated export exists; "onnx" exports and
+    validates one first if needed. Anything that goes wrong with ONNX falls
+    back to PyTorch here, before any vector is produced.
+    """
+    if engine in ("auto", "onnx"):
+        try:
+            import onnx_embedder
+            if engine == "onnx" and not onnx_embedder.is_ready(model_name):
+                onnx_embedder.load(model_name, export_if_missing=True)
+            if onnx_embedder.is_ready(model_name):
+                return f"onnx-{onnx_embedder.QUANTIZATION}"
+        except Exception as e:
+            if engine == "onnx":
+                print(f"⚠️  ONNX engine unavailable ({e}) - falling back to PyTorch")
+    return "torch"
+
+
+def load_encoder(model_name: str, engine_id: str) -> Callable[[List[str]], np.ndarray]:
+    """In-process encoder for a model on a resolved engine (imports the engine on first use)"""
+    if engine_id != "torch":
+        import onnx_embedder
+        encoder = onnx_embedder.load(model_name)
+        print(f"⚡ Encoding {model_name} with quantized ONNX Runtime")
+        return encoder
+
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(model_name)
+    return lambda texts: np.asarray(model.encode(texts, batch_size=64), dtype=np.float32)
+
+
+@lru_cache(maxsize=None)
+def _local_encoder(model_name: str, engine_id: str):
+    return load_encoder(model_name, engine_id)
+
+
+# -- framing ---------------------------------------------------------------
+
+def _send(sock: socket.socket, header: dict, payload: bytes = b""):
+    data = json.dumps(header).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data + payload)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n:
+        chunk = sock.recv(min(n, 1 << 20))
+        if not chunk:
+            raise ConnectionError("embedding service closed the connection")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> dict:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return json.loads(await reader.readexactly(length))
+
+
+def _write_frame(writer: asyncio.StreamWriter, header: dict, payload: bytes = b""):
+    data = json.dumps(header).encode('utf-8')
+    writer.write(_HEADER.pack(len(data)) + data + payload)
+
+
+# -- client ----------------------------------------------------------------
+
+def encode_remote(texts: List[str], model_name: str = DEFAULT_MODEL, engine_id: Optional[str] = None,
+                  socket_path: Path = SOCKET_PATH, timeout: float = 120.0) -> np.ndarray:
+    """Encode through the daemon; raises OSError/ConnectionError when it isn't available"""
+    engine_id = engine_id or resolve_engine(model_name)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        _send(sock, {"model": model_name, "engine": engine_id, "texts": texts})
+        (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+        header = json.loads(_recv_exact(sock, length))
+        if "error" in header:
+            raise ConnectionError(header["error"])
+        rows, dim = header["shape"]
+        payload = _recv_exact(sock, rows * dim * 4)
+    return np.frombuffer(payload, dtype=np.float32).reshape(rows, dim)
+
+
+def encode(texts: List[str], model_name: str = DEFAULT_MODEL, engine_id: Optional[str] = None) -> np.ndarray:
+    """
+    Embeddings for texts: from the resident daemon if one is up, in-process otherwise
+
+    Both paths encode with engine_id (default: resolve_engine() for the
+    PULSE_EMBEDDING_ENGINE setting), so the vectors do not depend on which
+    one served the request.
+    """
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    engine_id = engine_id or resolve_engine(model_name)
+    try:
+        return encode_remote(texts, model_name, engine_id)
+    except (OSError, ConnectionError, ValueError):
+        return _local_encoder(model_name, engine_id)(texts)
+
+
+def is_running(socket_path: Path = SOCKET_PATH) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+
+
+class LocalEmbeddings:
+    """LangChain-style embedding function (embed_documents / embed_query) backed by encode()"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL):
+        self.model_name = model_name
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return encode(texts, self.model_name).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return encode([text], self.model_name)[0].tolist()
+
+
+# -- server ----------------------------------------------------------------
+
+class EmbeddingServer:
+    """Coalesces concurrent encode requests into batches for one resident model"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, socket_path: Path = SOCKET_PATH,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT, engine: str = ENGINE):
+        self.model_name = model_name
+        self.engine = engine
+        self.engine_id = None  # Resolved when the model loads
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self.encoder = None
+        self.last_request = time.monotonic()
+        self.batches = 0
+        self.requests = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    async def _batcher(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + BATCH_WINDOW_SECONDS
+            count = len(batch[0][0])
+            while count < MAX_BATCH_TEXTS:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                count += len(item[0])
+
+            unique = list(dict.fromkeys(t for texts, _ in batch for t in texts))
+            try:
+                vectors = await asyncio.to_thread(self.encoder, unique)
+                row = {text: i for i, text in enumerate(unique)}
+                for texts, future in batch:
+                    future.set_result(vectors[[row[t] for t in texts]])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            self.batches += 1
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await _read_frame(reader)
+            self.last_request = time.monotonic()
+            self.requests += 1
+            if request.get("command") == "stop":
+                _write_frame(writer, {"ok": True})
+                await writer.drain()
+                asyncio.get_running_loop().call_soon(self._stop.set)
+                return
+            if request.get("model", self.model_name) != self.model_name:
+                _write_frame(writer, {"error": f"service runs {self.model_name}, not {request['model']}"})
+            elif request.get("engine", self.engine_id) != self.engine_id:
+                _write_frame(writer, {"error": f"service encodes with {self.engine_id}, not {request['engine']}"})
+            else:
+                texts = [str(t) for t in request.get("texts", [])]
+                future = asyncio.get_running_loop().create_future()
+                await self._queue.put((texts, future))
+                try:
+                    vectors = np.ascontiguousarray(await future, dtype=np.float32)
+                    _write_frame(writer, {"shape": list(vectors.shape)}, vectors.tobytes())
+                except Exception as e:
+                    _write_frame(writer, {"error": str(e)})
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _watch_idle(self):
+        while not self._stop.is_set():
+            await asyncio.sleep(min(30.0, self.idle_timeout))
+            if time.monotonic() - self.last_request > self.idle_timeout:
+                print(f"💤 Idle for {self.idle_timeout:.0f}s, shutting down")
+                self._stop.set()
+
+    async def serve(self):
+        print(f"🧠 Loading {self.model_name}...")
+        start = time.perf_counter()
+        self.engine_id = await asyncio.to_thread(resolve_engine, self.model_name, self.engine)
+        self.encoder = await asyncio.to_thread(load_encoder, self.model_name, self.engine_id)
+        print(f"✅ Model ready on {self.engine_id} in {time.perf_counter() - start:.1f}s")
+
+        self._queue = asyncio.Queue()
+        self._stop = asyncio.Event()
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        print(f"📡 Serving embeddings on {self.socket_path}")
+        tasks = [asyncio.create_task(self._batcher()), asyncio.create_task(self._watch_idle())]
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            self.socket_path.unlink(missing_ok=True)
+            print(f"📊 {self.requests} requests in {self.batches} batches")
+
+
+def start_background(model_name: str = DEFAULT_MODEL, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                     engine: str = ENGINE) -> bool:
+    """Launch the daemon detached (the model loads in the background); False if one is already up"""
+    if is_running():
+        return False
+    log_path = SOCKET_PATH.with_suffix(".log")
+    with open(log_path, 'a') as log:
+        subprocess.Popen(
+            [sys.executable, __file__, "serve", "--model", model_name, "--idle-timeout", str(idle_timeout),
+             "--engine", engine],
+            stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, start_new_session=True,
+        )
+    return True
+
+
+def stop() -> bool:
+    """Ask a running daemon to exit; False if none was listening"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.settimeout(5.0)
+            sock.connect(str(SOCKET_PATH))
+            _send(sock, {"command": "stop"})
+            sock.recv(64)
+            return True
+        except OSError:
+            return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse resident embedding service")
+    parser.add_argument("command", choices=["serve", "start", "stop", "status"])
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"Model to keep loaded (default: {DEFAULT_MODEL})")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help=f"Exit after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT})")
+    parser.add_argument("--engine", choices=["auto", "onnx", "torch"], default=ENGINE,
+                        help=f"Encoding engine (default: {ENGINE}, from PULSE_EMBEDDING_ENGINE)")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        asyncio.run(EmbeddingServer(args.model, idle_timeout=args.idle_timeout, engine=args.engine).serve())
+    elif args.command == "start":
+        started = start_background(args.model, args.idle_timeout, args.engine)
+        print(f"🚀 Embedding service starting on {SOCKET_PATH}" if started else "ℹ️  Embedding service already running")
+    elif args.command == "stop":
+        print("🛑 Embedding service stopped" if stop() else "ℹ️  Embedding service not running")
+    else:
+        running = is_running()
+        print(f"{'✅' if running else '⚠️ '} Embedding service {'running' if running else 'not running'} ({SOCKET_PATH})")
+        return 0 if running else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,21 +2,44 @@
 """
 Enhanced Report Generator - FULL MODEL ACTIVATION
 Uses multi-model pipeline with proper role assignments per benchmarks
+
+All stages share one pooled OllamaTurboClient; independent stages and
+per-item calls run concurrently under a single concurrency limit, so report
+latency follows the slowest chain rather than the sum of every round-trip.
 """
 import asyncio
 import json
-import os
 import random
-from datetime import datetime
-from typing import List, Dict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional
 from ollama_turbo_client import OllamaTurboClient
 from model_registry import select_model_for_task
 
+# LLM calls in flight at once across all stages
+MAX_CONCURRENT_CALLS = 4
+
+
 class EnhancedReportGenerator:
     """Multi-model report generation pipeline using optimal model assignments"""
     
-    def __init__(self):
-        self.client = None
+    def __init__(self, client: Optional[OllamaTurboClient] = None,
+                 max_concurrency: int = MAX_CONCURRENT_CALLS):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def _client(self):
+        """The shared client if one was given, otherwise a client for this call"""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with OllamaTurboClient() as client:
+                yield client
+
+    async def _generate(self, client: OllamaTurboClient, **kwargs) -> str:
+        """client.generate() under the pipeline-wide concurrency limit"""
+        async with self.semaphore:
+            return await client.generate(**kwargs)
     
     async def analyze_breakthrough_discoveries(self, high_turbo_items: List[Dict]) -> List[Dict]:
         """
@@ -25,27 +48,28 @@ class EnhancedReportGenerator:
         """
         print("🔬 ANALYSIS STAGE: DeepSeek-V3.1 analyzing breakthroughs...")
         
-        analyzed_items = []
-        async with OllamaTurboClient() as client:
-            for item in high_turbo_items[:5]:  # Top 5 breakthroughs
-                try:
+        async def analyze(client, item):
+            try:
+                async with self.semaphore:
                     analysis = await client.analyze_ollama_project(
                         project_name=item.get('title', 'Unknown'),
                         description=item.get('summary', ''),
                         stars=item.get('turbo_score', 0) * 1000,  # Approximate
                         language="Unknown"
                     )
-                    
-                    item['llm_analysis'] = analysis
-                    item['analyzed_by'] = 'deepseek-v3.1:671b-cloud'
-                    analyzed_items.append(item)
-                    print(f"  ✓ Analyzed: {item.get('title', '')[:50]}")
-                    
-                except Exception as e:
-                    print(f"  ⚠️  Analysis failed for {item.get('title', '')[:30]}: {e}")
-                    analyzed_items.append(item)  # Include without analysis
+                
+                item['llm_analysis'] = analysis
+                item['analyzed_by'] = 'deepseek-v3.1:671b-cloud'
+                print(f"  ✓ Analyzed: {item.get('title', '')[:50]}")
+                
+            except Exception as e:
+                print(f"  ⚠️  Analysis failed for {item.get('title', '')[:30]}: {e}")
+            return item  # Included with or without analysis
         
-        return analyzed_items
+        async with self._client() as client:
+            return list(await asyncio.gather(
+                *(analyze(client, item) for item in high_turbo_items[:5])  # Top 5 breakthroughs
+            ))
     
     async def synthesize_developer_insights(self, aggregated: List[Dict], insights: Dict) -> str:
         """
@@ -54,7 +78,7 @@ class EnhancedReportGenerator:
         """
         print("🧠 SYNTHESIS STAGE: GPT-OSS 120B generating developer insights...")
         
-        async with OllamaTurboClient() as client:
+        async with self._client() as client:
             # Prepare context
             official_items = [e for e in aggregated if e.get('source') in ['blog', 'cloud_page', 'cloud_api']][:5]
             tool_items = [e for e in aggregated if e.get('source') in ['github', 'reddit']][:10]
@@ -113,11 +137,13 @@ Developer Insights:"""
             model_id = select_model_for_task("synthesis", requires_reasoning=True)
             # Vary temperature for uniqueness (different each day)
             daily_temp = random.uniform(0.75, 0.92)
-            response = await client.generate(
+            response = await self._generate(
+                client,
                 model=model_id,
                 prompt=prompt,
                 max_tokens=3000,
-                temperature=daily_temp
+                temperature=daily_temp,
+                use_cache=False  # meant to read differently every day
             )
             print(f"  ✓ Using temperature: {daily_temp:.2f} for creative variation")
             
@@ -128,6 +154,9 @@ Developer Insights:"""
         """
         PROPHECY STAGE: Kimi-K2:1T (66.1% Tau-Bench - Agentic/Research Leader) + RAG
         Uses historical context to generate confident predictions
+
+        The RAG engine is synchronous, so prophecies are generated one after
+        another in a worker thread while the other stages keep running.
         """
         print("🔮 PROPHECY STAGE: Kimi-K2 + RAG generating prophecies...")
         
@@ -141,7 +170,8 @@ Developer Insights:"""
             past_yield = {"pattern_size": len(items), "items": len(items)}
             
             # Use RAG engine if available
-            prophecy_data = rag_engine.generate_prophecy(
+            prophecy_data = await asyncio.to_thread(
+                rag_engine.generate_prophecy,
                 cluster_summary=cluster_summary,
                 past_yield=past_yield,
                 use_rag=True
@@ -168,7 +198,7 @@ Developer Insights:"""
         """
         print("✨ POLISH STAGE: GLM-4.6 enhancing readability...")
         
-        async with OllamaTurboClient() as client:
+        async with self._client() as client:
             prompt = f"""You are EchoVein's editor. Polish this draft report for maximum readability and engagement.
 
 DRAFT REPORT:
@@ -186,7 +216,8 @@ Return the polished opening sections (first ~3000 chars). Maintain EchoVein's vo
 Polished Report:"""
             
             model_id = select_model_for_task("creative")
-            response = await client.generate(
+            response = await self._generate(
+                client,
                 model=model_id,
                 prompt=prompt,
                 max_tokens=4000,
@@ -201,7 +232,7 @@ Polished Report:"""
         PATTERN ANALYSIS: Kimi-K2 (Long-context research)
         Generates rich analysis of why patterns matter
         """
-        async with OllamaTurboClient() as client:
+        async with self._client() as client:
             items_summary = "\n".join([
                 f"- {item.get('title', 'Unknown')}: {item.get('summary', '')[:100]}"
                 for item in items[:5]
@@ -223,7 +254,8 @@ Keep it concise but insightful. Use ecosystem perspective.
 Analysis:"""
             
             model_id = select_model_for_task("research", requires_long_context=True)
-            response = await client.generate(
+            response = await self._generate(
+                client,
                 model=model_id,
                 prompt=prompt,
                 max_tokens=500,
@@ -235,8 +267,6 @@ Analysis:"""
 # Export for use in generate_report.py
 async def enhance_report_with_models(aggregated, insights, rag_engine=None):
     """Main entry point: enhance report with full model pipeline"""
-    generator = EnhancedReportGenerator()
-    
     results = {
         'breakthrough_analyses': [],
         'developer_insights': '',
@@ -245,29 +275,44 @@ async def enhance_report_with_models(aggregated, insights, rag_engine=None):
     }
     
     try:
-        # Stage 1: Analyze breakthroughs (DeepSeek)
-        high_turbo = sorted(
-            [e for e in aggregated if e.get('turbo_score', 0) >= 0.7],
-            key=lambda x: x.get('turbo_score', 0),
-            reverse=True
-        )[:5]
-        
-        if high_turbo:
-            results['breakthrough_analyses'] = await generator.analyze_breakthrough_discoveries(high_turbo)
-        
-        # Stage 2: Generate developer insights (GPT-OSS)
-        results['developer_insights'] = await generator.synthesize_developer_insights(aggregated, insights)
-        
-        # Stage 3: Generate prophecies with RAG (Kimi-K2)
-        patterns = insights.get('patterns', {})
-        if rag_engine:
-            results['prophecies'] = await generator.generate_rag_powered_prophecies(patterns, rag_engine)
+        async with OllamaTurboClient() as client:
+            generator = EnhancedReportGenerator(client)
+            patterns = insights.get('patterns', {})
+            
+            # Independent stages, keyed by where their result goes
+            tasks = {}
+            
+            # Stage 1: Analyze breakthroughs (DeepSeek)
+            high_turbo = sorted(
+                [e for e in aggregated if e.get('turbo_score', 0) >= 0.7],
+                key=lambda x: x.get('turbo_score', 0),
+                reverse=True
+            )[:5]
+            if high_turbo:
+                tasks[('breakthrough_analyses',)] = generator.analyze_breakthrough_discoveries(high_turbo)
+            
+            # Stage 2: Generate developer insights (GPT-OSS)
+            tasks[('developer_insights',)] = generator.synthesize_developer_insights(aggregated, insights)
+            
+            # Stage 3: Generate prophecies with RAG (Kimi-K2)
+            if rag_engine:
+                tasks[('prophecies',)] = generator.generate_rag_powered_prophecies(patterns, rag_engine)
+            
+            # Stage 4: Enrich pattern analysis (Kimi-K2)
+            for pattern_name, items in list(patterns.items())[:3]:  # Top 3 patterns
+                if len(items) >= 3:
+                    tasks[('pattern_analyses', pattern_name)] = generator.enrich_pattern_analysis(pattern_name, items)
+            
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
         
-        # Stage 4: Enrich pattern analysis (Kimi-K2)
-        for pattern_name, items in list(patterns.items())[:3]:  # Top 3 patterns
-            if len(items) >= 3:
-                analysis = await generator.enrich_pattern_analysis(pattern_name, items)
-                results['pattern_analyses'][pattern_name] = analysis
+        # A failed stage leaves its default; the others keep their results
+        for key, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"⚠️  {' / '.join(key)} failed: {outcome}")
+            elif len(key) == 1:
+                results[key[0]] = outcome
+            else:
+                results[key[0]][key[1]] = outcome
         
         print("✅ Multi-model enhancement complete!")
         return results
@@ -275,5 +320,3 @@ async def enhance_report_with_models(aggregated, insights, rag_engine=None):
     except Exception as e:
         print(f"⚠️  Model enhancement failed: {e}")
         return results  # Return partial results
-
-
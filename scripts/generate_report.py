@@ -3,11 +3,15 @@
 Ollama Pulse - Conversational Daily Report Generation
 Generates engaging, developer-focused reports with actionable insights
 """
+import argparse
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+import backfill
+from pulse_entry import load_entries
+
 # Import review database integration
 try:
     from review_integration import ReviewIntegration
@@ -37,6 +41,9 @@ DOCS_DIR = Path("../docs")
 REPORTS_DIR = DOCS_DIR / "reports"
 ROOT_REPORTS_DIR = Path("../reports")  # Root level reports directory
 
+# Set by --date / backfill workers to generate a past day's report
+REPORT_DATE = None
+
 
 def ensure_reports_dir():
     """Create docs/reports and root/reports directories if they don't exist"""
@@ -47,7 +54,8 @@ def ensure_reports_dir():
 
 def get_today_date_str():
     """Get today's date in UTC to match GitHub Actions timezone"""
-    from datetime import datetime
+    if REPORT_DATE:
+        return REPORT_DATE
     import pytz
     # Use UTC for consistency with GitHub Actions
     utc = pytz.UTC
@@ -60,10 +68,7 @@ def load_data():
     agg_file = f"../data/aggregated/{today}.json"
     insights_file = f"../data/insights/{today}.json"
 
-    aggregated = []
-    if os.path.exists(agg_file):
-        with open(agg_file, 'r', encoding='utf-8') as f:
-            aggregated = json.load(f)
+    aggregated = list(load_entries(agg_file))
 
     insights = {}
     if os.path.exists(insights_file):
@@ -283,7 +288,6 @@ def generate_report_md(aggregated, insights, historical_context=None):
     today = get_today_date_str()
 
     # Get current time in both UTC and CST
-    from datetime import datetime
     import pytz
     utc = pytz.UTC
     cst = pytz.timezone('America/Chicago')
@@ -803,7 +807,7 @@ def get_all_reports():
     return reports
 
 
-def save_report(report_md):
+def save_report(report_md, update_index_page=True):
     """Save the report to docs/reports with Jekyll front matter and comprehensive SEO"""
     ensure_reports_dir()
     today = get_today_date_str()
@@ -922,6 +926,12 @@ title: Pulse {today}
         f.write(md_front_matter + report_md)
     print(f"💾 Saved Markdown report to {md_path}")
 
+    if update_index_page:
+        update_index()
+
+
+def update_index():
+    """Rewrite docs/index.html listing every saved report"""
     # Update index.html with Jekyll front matter
     index_front_matter = """---
 layout: default
@@ -935,7 +945,6 @@ title: Ollama Pulse - Daily Ecosystem Intelligence
     reports_html = ""
     
     # Get current time in CST for latest report
-    from datetime import datetime
     import pytz
     cst = pytz.timezone('America/Chicago')
     current_time_cst = datetime.now(cst).strftime('%I:%M %p CST')
@@ -1017,10 +1026,8 @@ title: Ollama Pulse - Daily Ecosystem Intelligence
     print(f"💾 Updated index.html with {len(all_reports_list)} reports")
 
 
-def main():
-    print("🚀 Starting ENHANCED conversational report generation...")
-    print("🤖 Multi-model pipeline: DeepSeek → GPT-OSS → Kimi-K2 → GLM-4.6")
-
+def run_pipeline(use_rag=True, update_index_page=True):
+    """Generate, save and record the report for get_today_date_str()"""
     # Initialize review integration if available
     integration = None
     if REVIEW_DB_AVAILABLE:
@@ -1032,15 +1039,16 @@ def main():
 
     # Initialize RAG engine if available (NOW CLOUD-COMPATIBLE!)
     rag_engine = None
-    try:
-        from langchain_adaptive import AdaptiveProphecyEngine
-        rag_engine = AdaptiveProphecyEngine()  # Uses cloud by default now
-        if rag_engine.initialize():
-            print("✅ RAG engine initialized with Ollama Cloud + ChromaDB vectors")
-        else:
-            rag_engine = None
-    except Exception as e:
-        print(f"⚠️  RAG engine unavailable: {e}")
+    if use_rag:
+        try:
+            from langchain_adaptive import AdaptiveProphecyEngine
+            rag_engine = AdaptiveProphecyEngine()  # Uses cloud by default now
+            if rag_engine.initialize():
+                print("✅ RAG engine initialized with Ollama Cloud + ChromaDB vectors")
+            else:
+                rag_engine = None
+        except Exception as e:
+            print(f"⚠️  RAG engine unavailable: {e}")
 
     aggregated, insights = load_data()
 
@@ -1057,8 +1065,15 @@ def main():
         except Exception as e:
             print(f"⚠️  Error getting historical context: {e}")
 
-    # Get returning projects using RAG
-    if rag_engine:
+    # Returning projects: the aggregator's seen-index annotations answer this directly
+    if aggregated and 'is_new' in aggregated[0]:
+        from seen_index import returning_items
+        returning_projects = returning_items(aggregated, days_back=7)
+        if returning_projects:
+            historical_context['returning_projects'] = returning_projects
+            print(f"🔄 Found {len(returning_projects)} returning projects")
+    # Older aggregated files without annotations: ask the RAG engine
+    elif rag_engine:
         try:
             # Extract project names from aggregated data
             current_projects = [item.get('title', '') for item in aggregated if item.get('title')]
@@ -1095,7 +1110,7 @@ def main():
             print(f"⚠️  RAG cleanup warning: {e}")
 
     report_md = generate_report_md(aggregated, insights, historical_context)
-    save_report(report_md)
+    save_report(report_md, update_index_page=update_index_page)
     
     # Store new reviews
     if integration:
@@ -1113,6 +1128,44 @@ def main():
             print(f"💾 Stored {stored_count} reviews in database")
         except Exception as e:
             print(f"⚠️  Error storing reviews: {e}")
+
+
+def backfill_inputs(day):
+    return [f"../data/aggregated/{day}.json", f"../data/insights/{day}.json",
+            f"../data/insights/{day}_yield.json", f"../data/nostr/{day}.json"]
+
+
+def backfill_outputs(day):
+    return [REPORTS_DIR / f"pulse-{day}.md"]
+
+
+def process_day(day):
+    """Generate one past day's report (backfill worker)"""
+    global REPORT_DATE
+    REPORT_DATE = day
+    # ChromaDB is not safe for concurrent writers, and returning projects come
+    # from the aggregator's novelty fields; the index page is rebuilt once at the end
+    run_pipeline(use_rag=False, update_index_page=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse report generation")
+    backfill.add_date_arguments(parser)
+    args = parser.parse_args()
+    days = backfill.resolve_days(args)
+
+    print("🚀 Starting ENHANCED conversational report generation...")
+    print("🤖 Multi-model pipeline: DeepSeek → GPT-OSS → Kimi-K2 → GLM-4.6")
+
+    if days:
+        done = backfill.run_days("generate_report", process_day, days, backfill_inputs, backfill_outputs,
+                                 code=["generate_report.py", "enhanced_report_generator.py",
+                                       "bounty_section.py", "navigation_menu.py"],
+                                 workers=args.workers, force=args.force)
+        if done:
+            update_index()
+    else:
+        run_pipeline()
     
     print("✅ Report generation complete!")
 
@@ -8,6 +8,8 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from pulse_entry import load_entries
+
 DOCS_DIR = Path("../docs")
 REPORTS_DIR = DOCS_DIR / "reports"
 
@@ -18,10 +20,7 @@ def load_data():
     agg_file = f"../data/aggregated/{today}.json"
     insights_file = f"../data/insights/{today}.json"
 
-    aggregated = []
-    if os.path.exists(agg_file):
-        with open(agg_file, 'r', encoding='utf-8') as f:
-            aggregated = json.load(f)
+    aggregated = list(load_entries(agg_file))
 
     insights = {}
     if os.path.exists(insights_file):
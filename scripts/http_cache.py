@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Conditional Request Cache
+
+Persistent HTTP validator cache for feeds and REST APIs that rarely change
+between hourly runs. For every URL we keep the last ETag / Last-Modified and
+the last parsed result; the next request sends If-None-Match /
+If-Modified-Since and a 304 reply is answered from the cache without
+re-downloading or re-parsing the payload.
+
+Requests go through http_transport, so revalidation reuses pooled connections.
+
+Usage:
+    import http_cache
+    data = http_cache.get_json("https://api.github.com/repos/ollama/ollama/releases")
+    entries = http_cache.fetch_feed("https://dev.to/feed/tag/ollama")
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+import http_transport
+
+CACHE_PATH = Path(os.getenv("PULSE_HTTP_CACHE", "data/cache/http_cache.db"))
+
+
+@contextmanager
+def _get_connection():
+    """Context manager for cache connections"""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=30.0)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS http_validators (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        )
+    ''')
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _lookup(url: str) -> Optional[Tuple[str, str, str]]:
+    with _get_connection() as conn:
+        return conn.execute(
+            'SELECT etag, last_modified, body FROM http_validators WHERE url = ?', (url,)
+        ).fetchone()
+
+
+def _store(url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+    with _get_connection() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO http_validators (url, etag, last_modified, body, fetched_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (url, etag, last_modified, body, time.time())
+        )
+
+
+def _cache_key(url: str, params: Optional[Dict]) -> str:
+    """Full request URL, so the same endpoint with different queries is cached separately"""
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def conditional_get(url: str, parse: Callable[[requests.Response], Any],
+                    params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                    **kwargs) -> Tuple[Any, bool]:
+    """
+    GET with revalidation
+
+    Args:
+        url: Request URL
+        parse: Turns a 200 response into a JSON-serialisable result
+        params, headers, kwargs: Passed through to http_transport.get()
+
+    Returns:
+        (parsed result, served_from_cache)
+
+    Raises requests.HTTPError for error statuses, like raise_for_status().
+    """
+    key = _cache_key(url, params)
+    cached = _lookup(key)
+
+    request_headers = dict(headers or {})
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
+
+    response = http_transport.get(url, params=params, headers=request_headers, **kwargs)
+
+    if response.status_code == 304 and cached:
+        return json.loads(cached[2]), True
+
+    response.raise_for_status()
+    result = parse(response)
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        _store(key, etag, last_modified, json.dumps(result, default=str))
+
+    return result, False
+
+
+def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, **kwargs):
+    """GET a JSON API with ETag/Last-Modified revalidation"""
+    data, from_cache = conditional_get(url, lambda r: r.json(), params=params, headers=headers, **kwargs)
+    if from_cache:
+        print(f"  ♻️  Not modified, using cached response: {url}")
+    return data
+
+
+def fetch_feed(url: str, **kwargs) -> List:
+    """
+    Fetch and parse an RSS/Atom feed with revalidation
+
+    Returns feedparser-style entries (attribute access works as usual).
+    On 304 the cached entries are returned without touching feedparser.
+    """
+    import feedparser
+
+    def parse(response):
+        return [dict(entry) for entry in feedparser.parse(response.content).entries]
+
+    entries, from_cache = conditional_get(url, parse, **kwargs)
+    if from_cache:
+        print(f"  ♻️  Feed not modified, using cached entries: {url}")
+    return [feedparser.FeedParserDict(entry) for entry in entries]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Shared HTTP Transport
+
+One pooled transport for every ingester instead of bare requests.get():
+- Sync: a process-wide requests.Session with keep-alive connection pools,
+  so repeat calls to api.github.com, reddit.com, hn.algolia.com, ... reuse
+  the same TCP+TLS connection
+- Async: a reference-counted aiohttp.ClientSession per event loop, shared by
+  every OllamaTurboClient running in that loop
+- Per-host concurrency caps, consistent default timeouts, gzip everywhere
+- Request rates governed by the shared token buckets in rate_limiter
+
+Usage:
+    import http_transport
+    response = http_transport.get("https://api.github.com/...", params={...})
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import rate_limiter
+
+USER_AGENT = "OllamaPulse/1.0"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (5, 15)
+
+# Simultaneous requests allowed per host across all threads of this process
+HOST_CONCURRENCY = {
+    "api.github.com": 4,
+    "www.reddit.com": 2,
+    "hn.algolia.com": 4,
+    "api.stackexchange.com": 2,
+    "huggingface.co": 2,
+    "ollama.com": 4,
+}
+DEFAULT_HOST_CONCURRENCY = 6
+
+POOL_SIZE = 16
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Process-wide pooled requests.Session (created on first use)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["GET", "HEAD"],
+                )
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+
+
+def _host_slot_for(host: str) -> threading.BoundedSemaphore:
+    with _host_slots_lock:
+        if host not in _host_slots:
+            limit = HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+            _host_slots[host] = threading.BoundedSemaphore(limit)
+        return _host_slots[host]
+
+
+@contextmanager
+def host_slot(url: str):
+    """Hold one of the host's concurrency slots for the duration of a request"""
+    slot = _host_slot_for(urlparse(url).netloc.lower())
+    with slot:
+        yield
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session
+
+    Accepts the same keyword arguments as requests.request(); a default
+    timeout is applied when none is given. Waits for a rate-limit token first
+    and reports the server's rate-limit headers back afterwards.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    rate_limiter.acquire(url)
+    with host_slot(url):
+        response = get_session().request(method, url, **kwargs)
+    rate_limiter.observe(url, response.status_code, response.headers)
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session"""
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared session"""
+    return request("POST", url, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Async (aiohttp) side
+# ---------------------------------------------------------------------------
+
+# event loop -> [session, reference count]
+_client_sessions: Dict[asyncio.AbstractEventLoop, list] = {}
+
+
+def _create_client_session():
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=POOL_SIZE * 2,
+        limit_per_host=DEFAULT_HOST_CONCURRENCY,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=DEFAULT_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=300, sock_connect=DEFAULT_TIMEOUT[0]),
+    )
+
+
+async def acquire_client_session():
+    """Get the loop's shared aiohttp session, creating it if needed"""
+    loop = asyncio.get_running_loop()
+    entry = _client_sessions.get(loop)
+    if entry is None or entry[0].closed:
+        entry = [_create_client_session(), 0]
+        _client_sessions[loop] = entry
+    entry[1] += 1
+    return entry[0]
+
+
+async def release_client_session():
+    """Drop a reference; the session closes when the last user releases it"""
+    loop = asyncio.get_running_loop()
+    entry = _client_sessions.get(loop)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _client_sessions[loop]
+        await entry[0].close()
+
+
+@asynccontextmanager
+async def client_session():
+    """
+    Hold the loop's shared aiohttp session open
+
+    Wrapping a batch of work in this keeps connections warm between
+    OllamaTurboClient instances that would otherwise each open and close
+    their own pool.
+    """
+    session = await acquire_client_session()
+    try:
+        yield session
+    finally:
+        await release_client_session()
@@ -1,16 +1,8 @@
 #!/usr/bin/env python3
-import json, re, time, random, requests
-from datetime import datetime
-from pathlib import Path
+import re, requests
+import http_cache
 
-def ensure_data_dir():
-    Path("data/bounties").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    return f"data/bounties/{datetime.now().strftime('%Y-%m-%d')}.json"
-
-def ethical_delay():
-    time.sleep(1 + random.random() * 4)
+from sources import Source, register_source, run_blocking, run_standalone
 
 def extract_reward_amount(text):
     if not text:
@@ -25,16 +17,18 @@ def fetch_github_bounties():
         all_bounties = []
         
         for query in ['ollama bounty is:open', 'ollama reward is:open']:
-            ethical_delay()
-            response = requests.get(
-                "https://api.github.com/search/issues",
-                params={"q": query, "per_page": 20},
-                headers=headers,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                for item in response.json().get('items', []):
+            try:
+                data = http_cache.get_json(
+                    "https://api.github.com/search/issues",
+                    params={"q": query, "per_page": 20},
+                    headers=headers,
+                    timeout=10
+                )
+            except requests.HTTPError:
+                continue
+
+            if data:
+                for item in data.get('items', []):
                     combined = f"{item.get('title', '')} {item.get('body', '')}"
                     if 'ollama' in combined.lower():
                         all_bounties.append({
@@ -54,15 +48,19 @@ def fetch_github_bounties():
         print(f"❌ Error: {e}")
         return []
 
+@register_source
+class BountiesSource(Source):
+    name = "bounties"
+    description = "Bounty opportunities"
+    save_empty = True
+
+    async def fetch(self):
+        return await run_blocking(fetch_github_bounties)
+
 def main():
     print("🎯 Starting bounty ingestion...")
-    ensure_data_dir()
-    bounties = fetch_github_bounties()
-    
-    with open(get_today_filename(), 'w') as f:
-        json.dump(bounties, f, indent=2)
-    
-    print(f"✅ Saved {len(bounties)} bounties")
+    result = run_standalone(BountiesSource())
+    print(f"✅ Saved {result.entries} bounties")
 
 if __name__ == "__main__":
     main()
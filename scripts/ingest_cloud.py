@@ -6,26 +6,10 @@ Polls Ollama Cloud API endpoints for Turbo model details and changelogs
 PRIMARY: Uses Ollama web_search API for cloud model discovery
 FALLBACK: Direct scraping if web_search fails
 """
-import asyncio
-import json
-import os
 from datetime import datetime
-from pathlib import Path
-
-import requests
 
 from ollama_turbo_client import OllamaTurboClient
-
-
-def ensure_data_dir():
-    """Create data/cloud directory if it doesn't exist"""
-    Path("data/cloud").mkdir(parents=True, exist_ok=True)
-
-
-def get_today_filename():
-    """Get filename for today's data"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"data/cloud/{today}.json"
+from sources import Source, register_source, run_standalone
 
 
 def fetch_ollama_tags(filter_type="turbo", depth="full"):
@@ -119,31 +103,6 @@ def fetch_ollama_tags(filter_type="turbo", depth="full"):
     return entries
 
 
-def save_data(entries):
-    """Save entries to JSON file, merging with existing data"""
-    if not entries:
-        print("⚠️  No data to save")
-        return
-    
-    filename = get_today_filename()
-    
-    # Load existing data if file exists
-    existing = []
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            existing = json.load(f)
-    
-    # Merge and deduplicate by URL
-    all_entries = existing + entries
-    unique_entries = {e['url']: e for e in all_entries}.values()
-    
-    # Save
-    with open(filename, 'w') as f:
-        json.dump(list(unique_entries), f, indent=2)
-    
-    print(f"💾 Saved {len(unique_entries)} entries to {filename}")
-
-
 async def fetch_via_web_search(filter_type="turbo"):
     """
     PRIMARY: Use Ollama web_search API for cloud model discovery
@@ -169,6 +128,26 @@ async def fetch_via_web_search(filter_type="turbo"):
         return []
 
 
+@register_source
+class CloudSource(Source):
+    """Official Ollama Cloud model list"""
+    name = "cloud"
+    description = "Ollama Cloud models"
+    merge = True
+
+    def __init__(self, filter_type="turbo", depth="full"):
+        super().__init__()
+        self.filter_type = filter_type
+        self.depth = depth
+
+    async def fetch(self):
+        # PRIMARY: Use DIRECT API (no LLM hallucinations!)
+        print("📡 PRIMARY: Using REAL Ollama /api/tags for FACTUAL cloud models...")
+        entries = fetch_ollama_tags(filter_type=self.filter_type, depth=self.depth)
+        print(f"✅ Collected {len(entries)} VERIFIED cloud models from API")
+        return entries
+
+
 def main():
     """Main ingestion function"""
     import argparse
@@ -182,18 +161,7 @@ def main():
     args = parser.parse_args()
 
     print("🚀 Starting cloud sources deep ingestion...")
-    ensure_data_dir()
-
-    # PRIMARY: Use DIRECT API (no LLM hallucinations!)
-    print("📡 PRIMARY: Using REAL Ollama /api/tags for FACTUAL cloud models...")
-    cloud_entries = fetch_ollama_tags(filter_type=args.filter, depth=args.depth)
-    all_entries = cloud_entries
-    
-    print(f"✅ Collected {len(all_entries)} VERIFIED cloud models from API")
-
-    # Save
-    save_data(all_entries)
-
+    run_standalone(CloudSource(filter_type=args.filter, depth=args.depth))
     print("✅ Cloud sources ingestion complete!")
 
 
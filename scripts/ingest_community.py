@@ -6,43 +6,44 @@ Polls X/Twitter, Reddit, Product Hunt for community activity
 PRIMARY: Uses Ollama web_search API for intelligent discovery
 FALLBACK: Direct API calls if web_search fails
 """
-import asyncio
-import json
-import os
 from datetime import datetime
-from pathlib import Path
 
-import requests
+import cursors
+import http_cache
+import http_transport
 
 from searxng_client import OllamaWebSearchClient
 from ollama_turbo_client import OllamaTurboClient
+from sources import Source, register_source, run_blocking, run_standalone
 
-
-def ensure_data_dir():
-    """Create data/community directory if it doesn't exist"""
-    Path("data/community").mkdir(parents=True, exist_ok=True)
-
-
-def get_today_filename():
-    """Get filename for today's data"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"data/community/{today}.json"
+REDDIT_PAGE_SIZE = 20
+HN_PAGE_SIZE = 20
 
 
 def fetch_reddit():
     """Fetch Reddit r/ollama posts (using public JSON API)"""
     print("📡 Fetching Reddit r/ollama...")
     try:
-        response = requests.get(
+        # `before` = newest post seen earlier today, so only newer posts come back
+        newest_seen = cursors.get_cursor("reddit", "r/ollama/new")
+        params = {"limit": REDDIT_PAGE_SIZE}
+        if newest_seen:
+            params["before"] = newest_seen
+        data = http_cache.get_json(
             "https://www.reddit.com/r/ollama/new.json",
+            params=params,
             headers={"User-Agent": "OllamaPulse/1.0"},
             timeout=10
         )
-        response.raise_for_status()
-        data = response.json()
+
+        children = data['data']['children']
+        # Without a cursor this page is the same window a plain fetch covers; with one,
+        # a full page may not reach back to it, so hold the cursor until a partial page
+        if children and (not newest_seen or len(children) < REDDIT_PAGE_SIZE):
+            cursors.stage_cursor("reddit", "r/ollama/new", children[0]['data']['name'])
 
         entries = []
-        for post in data['data']['children'][:20]:  # Last 20 posts
+        for post in children[:REDDIT_PAGE_SIZE]:  # Last 20 posts
             post_data = post['data']
             entries.append({
                 "title": post_data['title'],
@@ -53,7 +54,7 @@ def fetch_reddit():
                 "highlights": [f"upvotes: {post_data['ups']}"]
             })
 
-        print(f"✅ Found {len(entries)} Reddit posts")
+        print(f"✅ Found {len(entries)} {'new ' if newest_seen else ''}Reddit posts")
         return entries
     except Exception as e:
         print(f"❌ Error fetching Reddit: {e}")
@@ -84,15 +85,13 @@ def fetch_youtube_transcripts():
     try:
         # Use YouTube RSS feed (no API key required)
         # Search for Ollama channel or specific queries
-        import feedparser
-
         # Try Ollama-related search results via RSS (limited but free)
         # Note: Full implementation would use yt-dlp for transcripts
         feed_url = "https://www.youtube.com/feeds/videos.xml?q=ollama+turbo+cloud"
 
-        feed = feedparser.parse(feed_url)
+        feed_entries = http_cache.fetch_feed(feed_url)
 
-        for entry in feed.entries[:5]:  # Last 5 videos
+        for entry in feed_entries[:5]:  # Last 5 videos
             video_entry = {
                 "title": f"[Video] {entry.title}",
                 "date": entry.get('published', datetime.now().isoformat()),
@@ -122,14 +121,23 @@ def fetch_hackernews():
         params = {
             "query": "ollama cloud",
             "tags": "story",
-            "hitsPerPage": 20
+            "hitsPerPage": HN_PAGE_SIZE
         }
+        since = cursors.get_cursor("hackernews", params["query"])
+        if since:
+            params["numericFilters"] = f"created_at_i>{since}"
 
-        response = requests.get(url, params=params, timeout=10)
+        response = http_transport.get(url, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
 
-        for hit in data.get('hits', []):
+        hits = data.get('hits', [])
+        # First run covers the plain window; after that only advance when this page held every new match
+        if hits and (not since or data.get('nbHits', 0) <= len(hits)):
+            cursors.stage_cursor("hackernews", params["query"],
+                                 max(hit.get('created_at_i', 0) for hit in hits))
+
+        for hit in hits:
             if not hit.get('url'):
                 continue
 
@@ -143,7 +151,7 @@ def fetch_hackernews():
             }
             entries.append(entry)
 
-        print(f"✅ Found {len(entries)} Hacker News posts")
+        print(f"✅ Found {len(entries)} {'new ' if since else ''}Hacker News posts")
 
     except Exception as e:
         print(f"⚠️  Could not fetch Hacker News: {e}")
@@ -164,7 +172,7 @@ def fetch_huggingface_discussions():
             "limit": 20
         }
 
-        response = requests.get(url, params=params, timeout=10, headers={"User-Agent": "OllamaPulse/1.0"})
+        response = http_transport.get(url, params=params, timeout=10, headers={"User-Agent": "OllamaPulse/1.0"})
 
         if response.status_code == 200:
             data = response.json()
@@ -195,8 +203,6 @@ def fetch_newsletters():
     entries = []
 
     try:
-        import feedparser
-
         # Try common newsletter RSS feeds
         # Note: Adjust URLs based on actual newsletter sources
         newsletter_feeds = [
@@ -205,8 +211,7 @@ def fetch_newsletters():
 
         for feed_url in newsletter_feeds:
             try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:5]:
+                for entry in http_cache.fetch_feed(feed_url)[:5]:
                     newsletter_entry = {
                         "title": f"[Newsletter] {entry.title}",
                         "date": entry.get('published', datetime.now().isoformat()),
@@ -227,31 +232,6 @@ def fetch_newsletters():
     return entries
 
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    if not entries:
-        print("⚠️  No data to save")
-        return
-
-    filename = get_today_filename()
-
-    # Load existing data if file exists
-    existing = []
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            existing = json.load(f)
-
-    # Merge and deduplicate by URL
-    all_entries = existing + entries
-    unique_entries = {e['url']: e for e in all_entries}.values()
-
-    # Save
-    with open(filename, 'w') as f:
-        json.dump(list(unique_entries), f, indent=2)
-
-    print(f"💾 Saved {len(unique_entries)} entries to {filename}")
-
-
 async def fetch_via_web_search():
     """
     PRIMARY: Use Ollama web_search API for intelligent discovery
@@ -289,35 +269,46 @@ async def fetch_via_web_search():
         return []
 
 
-def main():
-    """Main ingestion function"""
-    print("🚀 Starting community sources ingestion...")
-    ensure_data_dir()
+@register_source
+class CommunitySource(Source):
+    """Community discussions: web_search first, direct APIs as fallback"""
+    name = "community"
+    description = "Community discussions"
+    merge = True
 
-    # PRIMARY: Try Ollama web_search first
-    web_search_entries = asyncio.run(fetch_via_web_search())
+    async def fetch(self):
+        # PRIMARY: Try Ollama web_search first
+        web_search_entries = await fetch_via_web_search()
+        self.checkpoint("web_search", web_search_entries)
 
-    # FALLBACK: Use direct API calls if web_search failed or returned few results
-    if len(web_search_entries) < 10:
-        print("📡 FALLBACK: Using direct API calls...")
-        reddit_entries = fetch_reddit()
-        twitter_entries = fetch_twitter_placeholder()
-        ph_entries = fetch_producthunt_placeholder()
-        youtube_entries = fetch_youtube_transcripts()
-        hn_entries = fetch_hackernews()
-        hf_entries = fetch_huggingface_discussions()
-        newsletter_entries = fetch_newsletters()
+        # FALLBACK: Use direct API calls if web_search failed or returned few results
+        if len(web_search_entries) >= 10:
+            print("✅ Web search provided sufficient results, skipping fallback")
+            return web_search_entries
 
-        fallback_entries = (reddit_entries + twitter_entries + ph_entries +
-                           youtube_entries + hn_entries + hf_entries + newsletter_entries)
+        print("📡 FALLBACK: Using direct API calls...")
+        # Each fallback is checkpointed as it lands; stragglers are cut at the deadline
+        fallback_results = await self.gather_parts({
+            "reddit": run_blocking(fetch_reddit),
+            "twitter": run_blocking(fetch_twitter_placeholder),
+            "producthunt": run_blocking(fetch_producthunt_placeholder),
+            "youtube": run_blocking(fetch_youtube_transcripts),
+            "hackernews": run_blocking(fetch_hackernews),
+            "huggingface": run_blocking(fetch_huggingface_discussions),
+            "newsletters": run_blocking(fetch_newsletters),
+        })
 
         # Combine web_search + fallback
-        all_entries = web_search_entries + fallback_entries
-    else:
-        print("✅ Web search provided sufficient results, skipping fallback")
-        all_entries = web_search_entries
+        all_entries = list(web_search_entries)
+        for entries in fallback_results.values():
+            all_entries.extend(entries)
+        return all_entries
+
 
-    save_data(all_entries)
+def main():
+    """Main ingestion function"""
+    print("🚀 Starting community sources ingestion...")
+    run_standalone(CommunitySource())
     print("✅ Community sources ingestion complete!")
 
 
@@ -3,33 +3,26 @@
 Ollama Pulse - Dev Blogs Ingestion (14th Data Source)
 Tracks Ollama tutorials, guides, and case studies from Dev.to, Hashnode, Medium
 """
-import requests
-import feedparser
-import json
+import http_cache
+import http_transport
 from datetime import datetime
-from pathlib import Path
-import time
+
+from sources import Source, register_source, run_blocking, run_standalone
 
 # RSS feeds for developer blogs
 DEV_TO_RSS = "https://dev.to/feed/tag/ollama"
 HASHNODE_SEARCH = "https://api.hashnode.com/graphql"
 MEDIUM_RSS = "https://medium.com/feed/tag/ollama"
 
-def ensure_data_dir():
-    Path("data/devblogs").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    return f"data/devblogs/{datetime.now().strftime('%Y-%m-%d')}.json"
-
 def fetch_devto():
     """Fetch Ollama posts from Dev.to"""
     print("📡 Fetching Dev.to posts...")
     entries = []
     
     try:
-        feed = feedparser.parse(DEV_TO_RSS)
+        feed_entries = http_cache.fetch_feed(DEV_TO_RSS)
         
-        for entry in feed.entries[:15]:
+        for entry in feed_entries[:15]:
             item = {
                 "title": entry.title,
                 "date": entry.get('published', datetime.now().isoformat()),
@@ -78,7 +71,7 @@ def fetch_hashnode():
         }
         """
         
-        response = requests.post(
+        response = http_transport.post(
             HASHNODE_SEARCH,
             json={"query": query},
             timeout=15,
@@ -119,9 +112,9 @@ def fetch_medium():
     entries = []
     
     try:
-        feed = feedparser.parse(MEDIUM_RSS)
+        feed_entries = http_cache.fetch_feed(MEDIUM_RSS)
         
-        for entry in feed.entries[:15]:
+        for entry in feed_entries[:15]:
             item = {
                 "title": entry.title,
                 "date": entry.get('published', datetime.now().isoformat()),
@@ -143,34 +136,24 @@ def fetch_medium():
     
     return entries
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    filename = get_today_filename()
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Saved {len(entries)} entries to {filename}")
+@register_source
+class DevBlogsSource(Source):
+    name = "devblogs"
+    description = "Dev.to, Hashnode and Medium posts"
+
+    async def fetch(self):
+        # Three unrelated hosts - fetch them side by side
+        results = await self.gather_parts({
+            "devto": run_blocking(fetch_devto),
+            "hashnode": run_blocking(fetch_hashnode),
+            "medium": run_blocking(fetch_medium),
+        })
+        return [entry for entries in results.values() for entry in entries]
 
 def main():
     """Main ingestion function"""
     print("🚀 Starting dev blogs ingestion...")
-    ensure_data_dir()
-    
-    all_entries = []
-    
-    # Fetch from all sources
-    all_entries.extend(fetch_devto())
-    time.sleep(1)
-    
-    all_entries.extend(fetch_hashnode())
-    time.sleep(1)
-    
-    all_entries.extend(fetch_medium())
-    
-    if all_entries:
-        save_data(all_entries)
-    
+    run_standalone(DevBlogsSource())
     print("✅ Dev blogs ingestion complete!")
 
 if __name__ == "__main__":
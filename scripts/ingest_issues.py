@@ -6,27 +6,15 @@ Fetches GitHub issues and pull requests mentioning Ollama Turbo Cloud
 PRIMARY: Uses Ollama web_search API for issue discovery
 FALLBACK: Direct GitHub API if web_search fails
 """
-import asyncio
-import json
 import os
-import time
-from datetime import datetime
-from pathlib import Path
 
 import requests
 
-from ollama_turbo_client import OllamaTurboClient
-
-
-def ensure_data_dir():
-    """Create data/community directory if it doesn't exist"""
-    Path("data/community").mkdir(parents=True, exist_ok=True)
+import cursors
+import http_cache
 
-
-def get_today_filename():
-    """Get filename for today's data"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"data/issues/{today}.json"
+from ollama_turbo_client import OllamaTurboClient
+from sources import Source, register_source, run_blocking, run_standalone
 
 
 def search_github_issues(query="ollama turbo cloud", max_results=50):
@@ -42,8 +30,11 @@ def search_github_issues(query="ollama turbo cloud", max_results=50):
     try:
         # Use GitHub search API (public, no auth required but rate limited)
         url = "https://api.github.com/search/issues"
+        # Only ask for items updated since the last run today
+        search_query = f"{query} is:issue is:open"
+        since = cursors.get_cursor("github_issues", search_query)
         params = {
-            "q": f"{query} is:issue is:open",
+            "q": f"{search_query} updated:>{since}" if since else search_query,
             "sort": "updated",
             "order": "desc",
             "per_page": min(max_results, 100)
@@ -59,15 +50,14 @@ def search_github_issues(query="ollama turbo cloud", max_results=50):
         if github_token:
             headers["Authorization"] = f"token {github_token}"
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        
-        # Check rate limit
-        if response.status_code == 403:
-            print("⚠️  GitHub API rate limit reached, using cached data")
-            return []
-        
-        response.raise_for_status()
-        data = response.json()
+        try:
+            data = http_cache.get_json(url, params=params, headers=headers, timeout=10)
+        except requests.HTTPError as e:
+            # Check rate limit
+            if e.response is not None and e.response.status_code == 403:
+                print("⚠️  GitHub API rate limit reached, using cached data")
+                return []
+            raise
         
         # Process results
         for item in data.get('items', [])[:max_results]:
@@ -85,10 +75,12 @@ def search_github_issues(query="ollama turbo cloud", max_results=50):
             }
             entries.append(entry)
         
-        print(f"✅ Found {len(entries)} GitHub issues/PRs")
-        
-        # Respect rate limiting
-        time.sleep(2)
+        # First run covers the plain window; after that only advance when this one page
+        # held every match (desc order: the rest are older)
+        if entries and (not since or (not data.get('incomplete_results')
+                                      and data.get('total_count', 0) <= len(entries))):
+            cursors.stage_cursor("github_issues", search_query, max(e['date'] for e in entries))
+        print(f"✅ Found {len(entries)} {'new ' if since else ''}GitHub issues/PRs")
         
     except Exception as e:
         print(f"❌ Error searching GitHub issues: {e}")
@@ -103,8 +95,11 @@ def search_github_prs(query="ollama turbo service", max_results=30):
     
     try:
         url = "https://api.github.com/search/issues"
+        # Only ask for items updated since the last run today
+        search_query = f"{query} is:pr is:open"
+        since = cursors.get_cursor("github_prs", search_query)
         params = {
-            "q": f"{query} is:pr is:open",
+            "q": f"{search_query} updated:>{since}" if since else search_query,
             "sort": "updated",
             "order": "desc",
             "per_page": min(max_results, 100)
@@ -120,14 +115,13 @@ def search_github_prs(query="ollama turbo service", max_results=30):
         if github_token:
             headers["Authorization"] = f"token {github_token}"
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        
-        if response.status_code == 403:
-            print("⚠️  GitHub API rate limit reached")
-            return []
-        
-        response.raise_for_status()
-        data = response.json()
+        try:
+            data = http_cache.get_json(url, params=params, headers=headers, timeout=10)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 403:
+                print("⚠️  GitHub API rate limit reached")
+                return []
+            raise
         
         for item in data.get('items', [])[:max_results]:
             entry = {
@@ -144,8 +138,12 @@ def search_github_prs(query="ollama turbo service", max_results=30):
             }
             entries.append(entry)
         
-        print(f"✅ Found {len(entries)} GitHub PRs")
-        time.sleep(2)
+        # First run covers the plain window; after that only advance when this one page
+        # held every match (desc order: the rest are older)
+        if entries and (not since or (not data.get('incomplete_results')
+                                      and data.get('total_count', 0) <= len(entries))):
+            cursors.stage_cursor("github_prs", search_query, max(e['date'] for e in entries))
+        print(f"✅ Found {len(entries)} {'new ' if since else ''}GitHub PRs")
         
     except Exception as e:
         print(f"❌ Error searching GitHub PRs: {e}")
@@ -153,31 +151,6 @@ def search_github_prs(query="ollama turbo service", max_results=30):
     return entries
 
 
-def save_data(entries):
-    """Save entries to JSON file, merging with existing"""
-    if not entries:
-        print("⚠️  No data to save")
-        return
-    
-    filename = get_today_filename()
-    
-    # Load existing data
-    existing = []
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            existing = json.load(f)
-    
-    # Merge and deduplicate by URL
-    all_entries = existing + entries
-    unique_entries = {e['url']: e for e in all_entries}.values()
-    
-    # Save
-    with open(filename, 'w') as f:
-        json.dump(list(unique_entries), f, indent=2)
-    
-    print(f"💾 Saved {len(unique_entries)} entries to {filename}")
-
-
 async def fetch_via_web_search():
     """
     PRIMARY: Use Ollama web_search API for GitHub issue/PR discovery
@@ -202,28 +175,35 @@ async def fetch_via_web_search():
         return []
 
 
-def main():
-    """Main ingestion function"""
-    print("🚀 Starting GitHub issues/PRs ingestion...")
-    ensure_data_dir()
+@register_source
+class IssuesSource(Source):
+    """GitHub issues/PRs: web_search first, GitHub search API as fallback"""
+    name = "issues"
+    description = "GitHub issues & PRs"
+    merge = True
+
+    async def fetch(self):
+        # PRIMARY: Try Ollama web_search first
+        web_search_entries = await fetch_via_web_search()
 
-    # PRIMARY: Try Ollama web_search first
-    web_search_entries = asyncio.run(fetch_via_web_search())
+        # FALLBACK: Use direct GitHub API if web_search failed or returned few results
+        if len(web_search_entries) >= 10:
+            print("✅ Web search provided sufficient results, skipping fallback")
+            return web_search_entries
 
-    # FALLBACK: Use direct GitHub API if web_search failed or returned few results
-    if len(web_search_entries) < 10:
         print("📡 FALLBACK: Using direct GitHub API...")
-        issues = search_github_issues("ollama turbo cloud", max_results=30)
-        prs = search_github_prs("ollama service cloud", max_results=20)
-        fallback_entries = issues + prs
-        all_entries = web_search_entries + fallback_entries
-    else:
-        print("✅ Web search provided sufficient results, skipping fallback")
-        all_entries = web_search_entries
+        self.checkpoint("web_search", web_search_entries)
+        results = await self.gather_parts({
+            "issues": run_blocking(search_github_issues, "ollama turbo cloud", max_results=30),
+            "prs": run_blocking(search_github_prs, "ollama service cloud", max_results=20),
+        })
+        return web_search_entries + [entry for entries in results.values() for entry in entries]
 
-    # Save
-    save_data(all_entries)
 
+def main():
+    """Main ingestion function"""
+    print("🚀 Starting GitHub issues/PRs ingestion...")
+    run_standalone(IssuesSource())
     print("✅ GitHub issues/PRs ingestion complete!")
 
 
@@ -7,13 +7,9 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-TRACKED_PROJECTS_FILE = "tracked_projects.json"
-
-def ensure_data_dir():
-    Path("data/manual").mkdir(parents=True, exist_ok=True)
+from sources import Source, register_source, run_standalone
 
-def get_today_filename():
-    return f"data/manual/{datetime.now().strftime('%Y-%m-%d')}.json"
+TRACKED_PROJECTS_FILE = "tracked_projects.json"
 
 def load_tracked_projects():
     """Load manually tracked projects from JSON file"""
@@ -69,27 +65,21 @@ def create_template():
     
     print(f"✅ Created template: {TRACKED_PROJECTS_FILE}")
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    filename = get_today_filename()
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Saved {len(entries)} entries to {filename}")
+@register_source
+class ManualSource(Source):
+    name = "manual"
+    description = "Manually tracked projects"
+
+    async def fetch(self):
+        entries = load_tracked_projects()
+        if not entries:
+            print("ℹ️  No manually tracked projects found")
+        return entries
 
 def main():
     """Main ingestion function"""
     print("🚀 Starting manual tracking ingestion...")
-    ensure_data_dir()
-    
-    entries = load_tracked_projects()
-    
-    if entries:
-        save_data(entries)
-    else:
-        print("ℹ️  No manually tracked projects found")
-    
+    run_standalone(ManualSource())
     print("✅ Manual tracking ingestion complete!")
 
 if __name__ == "__main__":
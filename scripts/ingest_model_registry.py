@@ -3,20 +3,14 @@
 Ollama Pulse - Model Registry Ingestion (12th Data Source)
 Tracks new models, updates, and popularity from ollama.com/library
 """
-import requests
+import http_transport
 from bs4 import BeautifulSoup
-import json
 from datetime import datetime
-from pathlib import Path
 import time
 
-OLLAMA_LIBRARY_URL = "https://ollama.com/library"
-
-def ensure_data_dir():
-    Path("data/model_registry").mkdir(parents=True, exist_ok=True)
+from sources import Source, register_source, run_blocking, run_standalone
 
-def get_today_filename():
-    return f"data/model_registry/{datetime.now().strftime('%Y-%m-%d')}.json"
+OLLAMA_LIBRARY_URL = "https://ollama.com/library"
 
 def fetch_model_library():
     """Scrape Ollama model library for new/updated models"""
@@ -24,7 +18,7 @@ def fetch_model_library():
     entries = []
     
     try:
-        response = requests.get(
+        response = http_transport.get(
             OLLAMA_LIBRARY_URL,
             timeout=15,
             headers={"User-Agent": "OllamaPulse/1.0"}
@@ -87,25 +81,18 @@ def fetch_model_library():
     
     return entries
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    filename = get_today_filename()
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Saved {len(entries)} entries to {filename}")
+@register_source
+class ModelRegistrySource(Source):
+    name = "model_registry"
+    description = "Ollama model library"
+
+    async def fetch(self):
+        return await run_blocking(fetch_model_library)
 
 def main():
     """Main ingestion function"""
     print("🚀 Starting model registry ingestion...")
-    ensure_data_dir()
-    
-    entries = fetch_model_library()
-    
-    if entries:
-        save_data(entries)
-    
+    run_standalone(ModelRegistrySource())
     print("✅ Model registry ingestion complete!")
 
 if __name__ == "__main__":
@@ -2,12 +2,23 @@
 """
 Ollama Pulse - Nostr Ingestion (10th Data Source)
 Uses direct WebSocket connection to query NIP-23 long-form content
+
+All relays are queried concurrently; each relay finishes on EOSE or when its
+own deadline expires, so total time is bounded by the slowest healthy relay
+and a dead relay never holds up the others.
 """
+import asyncio
 import json
+import os
 import time
-import websocket
 from datetime import datetime, timedelta
-from pathlib import Path
+
+import aiohttp
+
+import cursors
+import http_transport
+from relevance import NOSTR_TURBO
+from sources import Source, ensure_data_dir, get_today_filename, register_source, run_standalone
 
 RELAYS = [
     "wss://relay.damus.io",
@@ -17,130 +28,174 @@ RELAYS = [
 
 OLLAMA_KEYWORDS = ["ollama", "turbo", "cloud", "llm", "ai", "models"]
 NIP23_KIND = 30023
-
-def ensure_data_dir():
-    Path("data/nostr").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    return f"data/nostr/{datetime.now().strftime('%Y-%m-%d')}.json"
+SUBSCRIPTION_ID = "ollama-pulse"
+RELAY_DEADLINE = 8  # seconds per relay, connect included
+RELAY_LIMIT = 100  # events per relay and query; a relay may send no more than this
 
 def calculate_turbo_score(content, tags):
-    score = 0.0
-    content_lower = content.lower()
-    for kw in ["ollama turbo", "ollama cloud", "cloud api", "turbo api"]:
-        if kw in content_lower: score += 0.3
-    for kw in ["turbo", "cloud", "api", "performance", "optimization"]:
-        if kw in content_lower: score += 0.15
+    score = NOSTR_TURBO.score(content)
     for tag in [t.lower() for t in tags]:
         if tag in OLLAMA_KEYWORDS: score += 0.1
     return min(score, 1.0)
 
-def query_relay(relay_url, since_timestamp):
-    events = []
-    try:
-        ws = websocket.create_connection(relay_url, timeout=10)
-        
+async def collect_relay_events(session, relay_url, since_timestamp, events):
+    """Append raw events from one relay to `events`; True if the relay reached EOSE"""
+    eose = False
+    async with session.ws_connect(relay_url) as ws:
         # Send REQ message for NIP-23 events
         req_filter = {
             "kinds": [NIP23_KIND],
             "since": since_timestamp,
-            "limit": 100
+            "limit": RELAY_LIMIT
         }
-        req_msg = json.dumps(["REQ", "ollama-pulse", req_filter])
-        ws.send(req_msg)
-        
-        # Collect events for 5 seconds
-        start = time.time()
-        while time.time() - start < 5:
-            try:
-                msg = ws.recv()
-                data = json.loads(msg)
-                
-                if data[0] == "EVENT" and data[1] == "ollama-pulse":
-                    event = data[2]
-                    
-                    # Extract metadata
-                    title = "Untitled"
-                    summary = ""
-                    tags = []
-                    
-                    for tag in event.get("tags", []):
-                        if len(tag) > 1:
-                            if tag[0] in ["title", "subject"]: title = tag[1]
-                            elif tag[0] == "summary": summary = tag[1]
-                            elif tag[0] == "t": tags.append(tag[1])
-                    
-                    content = event.get("content", "")
-                    if not summary:
-                        summary = content[:500]
-                    
-                    # Filter for Ollama-related content
-                    content_lower = content.lower()
-                    if any(kw in content_lower for kw in OLLAMA_KEYWORDS):
-                        turbo_score = calculate_turbo_score(content, tags)
-                        
-                        events.append({
-                            "title": title,
-                            "summary": summary,
-                            "content": content,
-                            "url": f"https://njump.me/{event.get('id', '')}",
-                            "source": "nostr_nip23",
-                            "author_npub": event.get("pubkey", "")[:16],
-                            "tags": tags,
-                            "turbo_score": round(turbo_score, 2),
-                            "created_at": event.get("created_at", int(time.time()))
-                        })
-                
-                elif data[0] == "EOSE":
-                    break
-                    
-            except websocket.WebSocketTimeoutError:
+        await ws.send_str(json.dumps(["REQ", SUBSCRIPTION_ID, req_filter]))
+
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
                 break
-        
-        ws.close()
-        
+            data = json.loads(msg.data)
+
+            if data[0] == "EVENT" and data[1] == SUBSCRIPTION_ID:
+                events.append(data[2])
+            elif data[0] == "EOSE":
+                eose = True
+                break
+
+        await ws.send_str(json.dumps(["CLOSE", SUBSCRIPTION_ID]))
+    return eose
+
+async def query_relay(session, relay_url, since_timestamp, deadline=RELAY_DEADLINE):
+    """
+    Raw events from one relay; whatever arrived before the deadline is kept
+
+    Returns (events, complete): complete only when the relay reached EOSE
+    without filling RELAY_LIMIT, i.e. it sent everything since `since_timestamp`.
+    """
+    events = []
+    eose = False
+    try:
+        eose = await asyncio.wait_for(
+            collect_relay_events(session, relay_url, since_timestamp, events),
+            timeout=deadline
+        )
+    except asyncio.TimeoutError:
+        print(f"  Warning: {relay_url} hit the {deadline}s deadline ({len(events)} events kept)")
     except Exception as e:
         print(f"  Warning: {relay_url} failed: {e}")
-    
-    return events
+
+    print(f"  {relay_url}: {len(events)} events")
+    return events, eose and len(events) < RELAY_LIMIT
+
+async def query_all_relays(since_timestamp):
+    """Query every relay at once; (raw events merged by event id, True if every relay was complete)"""
+    async with http_transport.client_session() as session:
+        results = await asyncio.gather(
+            *(query_relay(session, relay, since_timestamp) for relay in RELAYS)
+        )
+
+    unique_events = {}
+    for events, _ in results:
+        for event in events:
+            unique_events.setdefault(event.get("id", ""), event)
+    return list(unique_events.values()), all(complete for _, complete in results)
+
+def parse_event(event):
+    """Turn a raw NIP-23 event into an entry, or None if not Ollama-related"""
+    # Extract metadata
+    title = "Untitled"
+    summary = ""
+    tags = []
+
+    for tag in event.get("tags", []):
+        if len(tag) > 1:
+            if tag[0] in ["title", "subject"]: title = tag[1]
+            elif tag[0] == "summary": summary = tag[1]
+            elif tag[0] == "t": tags.append(tag[1])
+
+    content = event.get("content", "")
+    if not summary:
+        summary = content[:500]
+
+    # Filter for Ollama-related content
+    content_lower = content.lower()
+    if not any(kw in content_lower for kw in OLLAMA_KEYWORDS):
+        return None
+
+    turbo_score = calculate_turbo_score(content, tags)
+    return {
+        "title": title,
+        "summary": summary,
+        "content": content,
+        "url": f"https://njump.me/{event.get('id', '')}",
+        "source": "nostr_nip23",
+        "author_npub": event.get("pubkey", "")[:16],
+        "tags": tags,
+        "turbo_score": round(turbo_score, 2),
+        "created_at": event.get("created_at", int(time.time()))
+    }
+
+@register_source
+class NostrSource(Source):
+    name = "nostr"
+    description = "Nostr NIP-23 long-form posts"
+    merge = True  # save() always merges posts by URL
+
+    async def fetch(self):
+        # After the first run of the day, ask relays only for newer events
+        cursor = cursors.get_cursor(self.name, "nip23")
+        since = int(cursor) + 1 if cursor else int((datetime.now() - timedelta(days=1)).timestamp())
+        print(f"Querying {len(RELAYS)} relays concurrently...")
+        raw_events, complete = await query_all_relays(since)
+        if raw_events and complete:
+            cursors.stage_cursor(self.name, "nip23", max(e.get("created_at", 0) for e in raw_events))
+        elif raw_events:
+            # A relay timed out or hit its limit: older events may still be missing
+            print("  Keeping the Nostr cursor: not every relay sent all events")
+
+        # Events are already unique by id - parse each one once
+        entries = [entry for entry in map(parse_event, raw_events) if entry]
+        print(f"  Found {len(entries)} Ollama-related events ({len(raw_events)} unique)")
+        return entries
+
+    def save(self, entries, merge=None):
+        # Posts are always merged by URL (see `merge`), so the argument needs no handling here
+        ensure_data_dir(self.name)
+        filename = get_today_filename(self.name)
+
+        # Merge this run's delta into posts saved earlier today
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    existing = json.load(f).get("posts", [])
+                merged = {post.get("url"): post for post in existing}
+                merged.update((post.get("url"), post) for post in entries)
+                entries = list(merged.values())
+            except (json.JSONDecodeError, AttributeError):
+                pass
+
+        data = {
+            "timestamp": datetime.now().isoformat(),
+            "source": "nostr",
+            "count": len(entries),
+            "posts": entries
+        }
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+        print(f"\nSaved {len(entries)} unique posts to {filename}")
+
+        if entries:
+            sorted_posts = sorted(entries, key=lambda x: x.get('turbo_score', 0), reverse=True)
+            print("\nTop 3 by Turbo Score:")
+            for i, post in enumerate(sorted_posts[:3], 1):
+                print(f"  {i}. [{post['turbo_score']}] {post['title']}")
+        return len(entries)
 
 def main():
     print("Ollama Pulse - Nostr Ingestion")
     print("=" * 50)
-    
-    since = int((datetime.now() - timedelta(days=1)).timestamp())
-    all_events = []
-    
-    for relay in RELAYS:
-        print(f"Querying {relay}...")
-        events = query_relay(relay, since)
-        all_events.extend(events)
-        print(f"  Found {len(events)} Ollama-related events")
-    
-    # Deduplicate by URL
-    unique_events = {e["url"]: e for e in all_events}.values()
-    unique_events = list(unique_events)
-    
-    # Save
-    ensure_data_dir()
-    filename = get_today_filename()
-    data = {
-        "timestamp": datetime.now().isoformat(),
-        "source": "nostr",
-        "count": len(unique_events),
-        "posts": unique_events
-    }
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
-    print(f"\nSaved {len(unique_events)} unique posts to {filename}")
-    
-    if unique_events:
-        sorted_posts = sorted(unique_events, key=lambda x: x.get('turbo_score', 0), reverse=True)
-        print("\nTop 3 by Turbo Score:")
-        for i, post in enumerate(sorted_posts[:3], 1):
-            print(f"  {i}. [{post['turbo_score']}] {post['title']}")
+    run_standalone(NostrSource())
 
 if __name__ == "__main__":
     main()
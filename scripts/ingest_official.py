@@ -3,20 +3,10 @@
 Official Sources Ingestion - FIXED to use CURRENT data only
 NO MORE old blog posts from 2024!
 """
-import json
-import os
-import requests
+import http_cache
 from datetime import datetime, timedelta
-from pathlib import Path
 
-def ensure_data_dir():
-    """Create data/official directory if it doesn't exist"""
-    Path("data/official").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    """Get filename for today's data"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"data/official/{today}.json"
+from sources import Source, register_source, run_blocking, run_standalone
 
 def fetch_recent_ollama_releases():
     """Fetch ONLY recent Ollama releases from GitHub (last 30 days)"""
@@ -27,13 +17,11 @@ def fetch_recent_ollama_releases():
     
     try:
         # Get recent releases from official ollama/ollama repo
-        response = requests.get(
+        releases = http_cache.get_json(
             'https://api.github.com/repos/ollama/ollama/releases',
             params={'per_page': 10},
             timeout=10
         )
-        response.raise_for_status()
-        releases = response.json()
         
         for release in releases:
             # Only include releases from last 30 days
@@ -67,43 +55,25 @@ def fetch_current_ollama_blog():
     print("⚠️  Skipping blog RSS to avoid old posts - using releases only")
     return []
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    if not entries:
-        print("⚠️  No current data to save - this is OK, we're filtering out old posts")
-        # Save empty file so artifact upload doesn't fail
-        ensure_data_dir()
-        filename = get_today_filename()
-        with open(filename, 'w') as f:
-            json.dump([], f)
-        return
-    
-    ensure_data_dir()
-    filename = get_today_filename()
-    
-    with open(filename, 'w') as f:
-        json.dump(entries, f, indent=2)
-    
-    print(f"💾 Saved {len(entries)} CURRENT entries to {filename}")
+@register_source
+class OfficialSource(Source):
+    """GitHub releases of ollama/ollama from the last 30 days"""
+    name = "official"
+    description = "Official Ollama releases"
+    save_empty = True  # Empty file so artifact upload doesn't fail
+
+    async def fetch(self):
+        # Get ONLY recent releases (no old blog posts!)
+        # NO blog scraping - it returns old 2024 posts!
+        # We'll rely on GitHub releases and the official cloud model list instead
+        entries = await run_blocking(fetch_recent_ollama_releases)
+        print(f"✅ Collected {len(entries)} CURRENT official entries (filtered out old 2024 posts)")
+        return entries
 
 def main():
     """Main ingestion function - ONLY current data!"""
     print("🚀 Starting official sources ingestion (CURRENT data only)...")
-    ensure_data_dir()
-
-    # Get ONLY recent releases (no old blog posts!)
-    recent_releases = fetch_recent_ollama_releases()
-    
-    # NO blog scraping - it returns old 2024 posts!
-    # We'll rely on GitHub releases and the official cloud model list instead
-    
-    all_entries = recent_releases
-    
-    print(f"✅ Collected {len(all_entries)} CURRENT official entries (filtered out old 2024 posts)")
-
-    # Save
-    save_data(all_entries)
-
+    run_standalone(OfficialSource())
     print("✅ Official sources ingestion complete!")
 
 
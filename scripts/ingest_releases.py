@@ -3,19 +3,11 @@
 Ollama Pulse - GitHub Releases Ingestion (13th Data Source)
 Tracks official Ollama releases, changelogs, and version updates
 """
-import requests
-import json
-from datetime import datetime
-from pathlib import Path
-import time
+import http_cache
 
-OLLAMA_RELEASES_API = "https://api.github.com/repos/ollama/ollama/releases"
-
-def ensure_data_dir():
-    Path("data/releases").mkdir(parents=True, exist_ok=True)
+from sources import Source, register_source, run_blocking, run_standalone
 
-def get_today_filename():
-    return f"data/releases/{datetime.now().strftime('%Y-%m-%d')}.json"
+OLLAMA_RELEASES_API = "https://api.github.com/repos/ollama/ollama/releases"
 
 def fetch_github_releases():
     """Fetch recent Ollama releases from GitHub"""
@@ -23,7 +15,7 @@ def fetch_github_releases():
     entries = []
     
     try:
-        response = requests.get(
+        releases = http_cache.get_json(
             OLLAMA_RELEASES_API,
             params={"per_page": 20},
             timeout=15,
@@ -33,9 +25,6 @@ def fetch_github_releases():
             }
         )
         
-        response.raise_for_status()
-        releases = response.json()
-        
         for release in releases:
             # Calculate turbo score (higher for recent releases)
             is_prerelease = release.get('prerelease', False)
@@ -62,33 +51,23 @@ def fetch_github_releases():
         
         print(f"✅ Found {len(entries)} Ollama releases")
         
-        # Respect GitHub rate limiting
-        time.sleep(1)
-        
     except Exception as e:
         print(f"❌ Error fetching releases: {e}")
     
     return entries
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    filename = get_today_filename()
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Saved {len(entries)} entries to {filename}")
+@register_source
+class ReleasesSource(Source):
+    name = "releases"
+    description = "Ollama GitHub releases"
+
+    async def fetch(self):
+        return await run_blocking(fetch_github_releases)
 
 def main():
     """Main ingestion function"""
     print("🚀 Starting GitHub releases ingestion...")
-    ensure_data_dir()
-    
-    entries = fetch_github_releases()
-    
-    if entries:
-        save_data(entries)
-    
+    run_standalone(ReleasesSource())
     print("✅ GitHub releases ingestion complete!")
 
 if __name__ == "__main__":
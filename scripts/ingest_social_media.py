@@ -3,19 +3,11 @@
 Comprehensive Social Media Ingestion - ALL platforms with Ollama content
 Combines Ollama web_search + direct public APIs for maximum coverage
 """
-import asyncio
-import requests
+import http_transport
 from datetime import datetime
-from pathlib import Path
-import json
 
 from ollama_turbo_client import OllamaTurboClient
-
-def ensure_data_dir():
-    Path("data/social_media").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    return f"data/social_media/{datetime.now().strftime('%Y-%m-%d')}.json"
+from sources import Source, register_source, run_blocking, run_standalone
 
 async def search_via_ollama_web_search():
     """
@@ -73,7 +65,7 @@ def fetch_mastodon_direct():
     
     try:
         # Public hashtag timeline - completely open!
-        response = requests.get(
+        response = http_transport.get(
             'https://mastodon.social/api/v1/timelines/tag/ollama',
             params={'limit': 20},
             timeout=10
@@ -111,7 +103,7 @@ def fetch_bluesky_direct():
     
     try:
         # Public search endpoint - completely open!
-        response = requests.get(
+        response = http_transport.get(
             'https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts',
             params={'q': 'ollama', 'limit': 20},
             timeout=10
@@ -142,61 +134,52 @@ def fetch_bluesky_direct():
     
     return entries
 
-def save_data(entries):
-    """Save all social media entries"""
-    if not entries:
-        print("⚠️  No social media data found")
-        ensure_data_dir()
-        with open(get_today_filename(), 'w') as f:
-            json.dump([], f)
-        return
-    
-    ensure_data_dir()
-    
-    # Deduplicate by URL
-    unique_entries = list({e.get('url', e.get('title', '')): e for e in entries}.values())
-    
-    with open(get_today_filename(), 'w') as f:
-        json.dump(unique_entries, f, indent=2)
-    
-    print(f"💾 Saved {len(unique_entries)} unique social media entries")
-
-def main():
+@register_source
+class SocialMediaSource(Source):
     """
     Comprehensive social media ingestion
     11 platforms total: X, Instagram, Facebook, LinkedIn, TikTok, Threads, 
                         Pinterest, Tumblr, Medium, Mastodon, Bluesky
     """
-    print("🚀 Starting COMPREHENSIVE social media ingestion...")
-    print("   Platforms: X, Instagram, Facebook, LinkedIn, TikTok, Threads,")
-    print("             Pinterest, Tumblr, Medium, Mastodon, Bluesky")
-    print()
-    
-    try:
-        # Part 1: Use web_search for closed platforms (9 platforms)
-        web_search_entries = asyncio.run(search_via_ollama_web_search())
-        
-        # Part 2: Direct API for open platforms (2 platforms)
-        mastodon_entries = fetch_mastodon_direct()
-        bluesky_entries = fetch_bluesky_direct()
-        
+    name = "social_media"
+    description = "Social media platforms"
+    save_empty = True  # Save empty to prevent workflow failure
+
+    async def fetch(self):
+        # Part 1: web_search for closed platforms (9 platforms)
+        # Part 2: Direct API for open platforms (2 platforms), in parallel
+        results = await self.gather_parts({
+            "web_search": search_via_ollama_web_search(),
+            "mastodon": run_blocking(fetch_mastodon_direct),
+            "bluesky": run_blocking(fetch_bluesky_direct),
+        })
+        web_search_entries = results.get("web_search", [])
+        mastodon_entries = results.get("mastodon", [])
+        bluesky_entries = results.get("bluesky", [])
+
         # Combine all
         all_entries = web_search_entries + mastodon_entries + bluesky_entries
-        
+
         print(f"\n✅ Total from all platforms: {len(all_entries)} entries")
         print(f"   - Web search: {len(web_search_entries)}")
         print(f"   - Mastodon: {len(mastodon_entries)}")
         print(f"   - Bluesky: {len(bluesky_entries)}")
-        
-        save_data(all_entries)
+        return all_entries
+
+def main():
+    """Comprehensive social media ingestion"""
+    print("🚀 Starting COMPREHENSIVE social media ingestion...")
+    print("   Platforms: X, Instagram, Facebook, LinkedIn, TikTok, Threads,")
+    print("             Pinterest, Tumblr, Medium, Mastodon, Bluesky")
+    print()
+
+    result = run_standalone(SocialMediaSource())
+    if result.success:
         print("\n✅ Social media ingestion complete!")
-        
-    except Exception as e:
-        print(f"❌ Social media ingestion failed: {e}")
-        import traceback
-        traceback.print_exc()
+    else:
+        print(f"❌ Social media ingestion failed: {result.error_message}")
         # Save empty to prevent workflow failure
-        save_data([])
+        SocialMediaSource().save([])
 
 if __name__ == "__main__":
     main()
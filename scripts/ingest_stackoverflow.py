@@ -3,21 +3,14 @@
 Ollama Pulse - Stack Overflow Ingestion (11th Data Source)
 Tracks Ollama-related questions, answers, and discussions
 """
-import requests
-import json
+import http_transport
 from datetime import datetime
-from pathlib import Path
-import time
+
+from sources import Source, register_source, run_blocking, run_standalone
 
 STACK_OVERFLOW_API = "https://api.stackexchange.com/2.3/search/advanced"
 OLLAMA_TAGS = ["ollama", "ollama-cloud", "ollama-turbo", "llm"]
 
-def ensure_data_dir():
-    Path("data/stackoverflow").mkdir(parents=True, exist_ok=True)
-
-def get_today_filename():
-    return f"data/stackoverflow/{datetime.now().strftime('%Y-%m-%d')}.json"
-
 def fetch_stackoverflow_questions():
     """Fetch recent Ollama-related Stack Overflow questions"""
     print("📡 Fetching Stack Overflow questions...")
@@ -33,7 +26,7 @@ def fetch_stackoverflow_questions():
             "pagesize": 30
         }
 
-        response = requests.get(
+        response = http_transport.get(
             STACK_OVERFLOW_API,
             params=params,
             timeout=15,
@@ -74,33 +67,23 @@ def fetch_stackoverflow_questions():
         
         print(f"✅ Found {len(entries)} Stack Overflow questions")
         
-        # Respect rate limiting (10,000 requests/day)
-        time.sleep(1)
-        
     except Exception as e:
         print(f"❌ Error fetching Stack Overflow: {e}")
     
     return entries
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    filename = get_today_filename()
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
-    
-    print(f"💾 Saved {len(entries)} entries to {filename}")
+@register_source
+class StackOverflowSource(Source):
+    name = "stackoverflow"
+    description = "Stack Overflow questions"
+
+    async def fetch(self):
+        return await run_blocking(fetch_stackoverflow_questions)
 
 def main():
     """Main ingestion function"""
     print("🚀 Starting Stack Overflow ingestion...")
-    ensure_data_dir()
-    
-    entries = fetch_stackoverflow_questions()
-    
-    if entries:
-        save_data(entries)
-    
+    run_standalone(StackOverflowSource())
     print("✅ Stack Overflow ingestion complete!")
 
 if __name__ == "__main__":
@@ -6,33 +6,17 @@ Polls GitHub, n8n marketplace for Ollama integrations
 PRIMARY: Uses Ollama web_search API for intelligent discovery
 FALLBACK: Direct GitHub API calls if web_search fails
 """
-import asyncio
-import json
-import os
-from datetime import datetime
-from pathlib import Path
-
-import requests
+import http_cache
 
 from ollama_turbo_client import OllamaTurboClient
-
-
-def ensure_data_dir():
-    """Create data/tools directory if it doesn't exist"""
-    Path("data/tools").mkdir(parents=True, exist_ok=True)
-
-
-def get_today_filename():
-    """Get filename for today's data"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"data/tools/{today}.json"
+from sources import Source, register_source, run_blocking, run_standalone
 
 
 def fetch_github_repos():
     """Fetch GitHub repos with 'ollama' topic"""
     print("📡 Fetching GitHub repos with 'ollama' topic...")
     try:
-        response = requests.get(
+        data = http_cache.get_json(
             "https://api.github.com/search/repositories",
             params={
                 "q": "ollama in:topics",
@@ -42,8 +26,6 @@ def fetch_github_repos():
             headers={"Accept": "application/vnd.github.v3+json"},
             timeout=10
         )
-        response.raise_for_status()
-        data = response.json()
         
         entries = []
         for repo in data['items']:
@@ -66,31 +48,6 @@ def fetch_github_repos():
         return []
 
 
-def save_data(entries):
-    """Save entries to JSON file"""
-    if not entries:
-        print("⚠️  No data to save")
-        return
-    
-    filename = get_today_filename()
-    
-    # Load existing data if file exists
-    existing = []
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            existing = json.load(f)
-    
-    # Merge and deduplicate by URL
-    all_entries = existing + entries
-    unique_entries = {e['url']: e for e in all_entries}.values()
-    
-    # Save
-    with open(filename, 'w') as f:
-        json.dump(list(unique_entries), f, indent=2)
-    
-    print(f"💾 Saved {len(unique_entries)} entries to {filename}")
-
-
 async def fetch_via_web_search():
     """
     PRIMARY: Use Ollama web_search API for intelligent tool discovery
@@ -115,26 +72,31 @@ async def fetch_via_web_search():
         return []
 
 
-def main():
-    """Main ingestion function"""
-    print("🚀 Starting tools & integrations ingestion...")
-    ensure_data_dir()
+@register_source
+class ToolsSource(Source):
+    """Ollama tools & integrations: web_search first, GitHub API as fallback"""
+    name = "tools"
+    description = "Tools & integrations"
+    merge = True
+
+    async def fetch(self):
+        # PRIMARY: Try Ollama web_search first
+        web_search_entries = await fetch_via_web_search()
 
-    # PRIMARY: Try Ollama web_search first
-    web_search_entries = asyncio.run(fetch_via_web_search())
+        # FALLBACK: Use direct GitHub API if web_search failed or returned few results
+        if len(web_search_entries) >= 10:
+            print("✅ Web search provided sufficient results, skipping fallback")
+            return web_search_entries
 
-    # FALLBACK: Use direct GitHub API if web_search failed or returned few results
-    if len(web_search_entries) < 10:
         print("📡 FALLBACK: Using direct GitHub API...")
-        github_entries = fetch_github_repos()
-        all_entries = web_search_entries + github_entries
-    else:
-        print("✅ Web search provided sufficient results, skipping fallback")
-        all_entries = web_search_entries
+        github_entries = await run_blocking(fetch_github_repos)
+        return web_search_entries + github_entries
 
-    # Save
-    save_data(all_entries)
 
+def main():
+    """Main ingestion function"""
+    print("🚀 Starting tools & integrations ingestion...")
+    run_standalone(ToolsSource())
     print("✅ Tools & integrations ingestion complete!")
 
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Ingestion Delta Journal
+
+Append-only, per-source and per-day log of the records each ingestion run
+added or changed: data/cache/journal/<source>/<YYYY-MM-DD>.jsonl, one JSON
+object per line. A sidecar <YYYY-MM-DD>.keys.json maps each record's dedupe
+key to a digest of its content, so a record is journaled again only when it
+actually changes. When a save replaced the file rather than merging into it,
+the keys it no longer lists are journaled as removals: {"_removed": key}.
+
+Source.run() appends after every save; aggregate.py remembers the position
+it has read up to per source and applies only what came after it.
+
+A position is [journal id, byte offset]. Each journal file gets a random id
+(<YYYY-MM-DD>.id) when it is created, so a reader notices when the file
+behind a saved position was replaced, e.g. by a fresh journal after a CI
+cache miss, even once the new file has grown past the old offset.
+
+Usage:
+    import journal
+    journal.append("tools", entries)                    # ingestion side
+    records, pos = journal.read_since("tools", day, pos)
+    if records is None:
+        ...                                             # journal replaced: rebuild
+"""
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+JOURNAL_DIR = Path(os.getenv("PULSE_JOURNAL_DIR", "data/cache/journal"))
+
+# Marker field of a removal record; its value is the removed record's key
+REMOVED = "_removed"
+
+
+def journal_path(source: str, day: str) -> Path:
+    return JOURNAL_DIR / source / f"{day}.jsonl"
+
+
+def _keys_path(source: str, day: str) -> Path:
+    return JOURNAL_DIR / source / f"{day}.keys.json"
+
+
+def _id_path(source: str, day: str) -> Path:
+    return JOURNAL_DIR / source / f"{day}.id"
+
+
+def _record_key(entry: Dict) -> str:
+    """URL when present, title otherwise (same rule as sources.dedupe_key)"""
+    return entry.get('url') or entry.get('title', '')
+
+
+def append(source: str, entries: List[Dict], day: Optional[str] = None, replace: bool = False) -> int:
+    """
+    Journal the entries that are new or changed since the last append today; returns how many lines
+
+    replace: the save wrote exactly `entries`, so records journaled earlier
+    today that are not among them are journaled as removed
+    """
+    day = day or datetime.now().strftime("%Y-%m-%d")
+    path = journal_path(source, day)
+    keys_path = _keys_path(source, day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    known = {}
+    if keys_path.exists():
+        with open(keys_path, 'r', encoding='utf-8') as f:
+            known = json.load(f)
+
+    lines = []
+    current = set()
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        line = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+        digest = hashlib.blake2b(line.encode('utf-8'), digest_size=8).hexdigest()
+        key = _record_key(entry)
+        current.add(key)
+        if known.get(key) == digest:
+            continue
+        known[key] = digest
+        lines.append(line + "\n")
+
+    if replace:
+        for key in [key for key in known if key not in current]:
+            del known[key]
+            lines.append(json.dumps({REMOVED: key}, ensure_ascii=False) + "\n")
+
+    if lines:
+        if not path.exists():
+            _id_path(source, day).write_text(uuid.uuid4().hex, encoding='utf-8')
+        with open(path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+        tmp = keys_path.with_suffix(".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(known, f)
+        tmp.replace(keys_path)
+    return len(lines)
+
+
+def size(source: str, day: str) -> int:
+    """Current journal length in bytes (0 if there is none)"""
+    path = journal_path(source, day)
+    return path.stat().st_size if path.exists() else 0
+
+
+def journal_id(source: str, day: str) -> Optional[str]:
+    """Id of the current journal file (None for journals written before ids existed)"""
+    path = _id_path(source, day)
+    return path.read_text(encoding='utf-8').strip() if path.exists() else None
+
+
+def position(source: str, day: str) -> List:
+    """[journal id, byte offset] of the current end of the journal"""
+    return [journal_id(source, day), size(source, day)]
+
+
+def read_since(source: str, day: str, pos: Optional[List] = None) -> Tuple[Optional[List[Dict]], List]:
+    """
+    Records appended after `pos`, and the position to resume from next time
+
+    `pos` comes from position() or an earlier read (None: from the start).
+    Returns (None, current end) when `pos` does not belong to this journal:
+    the file was replaced or is shorter than the offset. The records in
+    between are unknown, so the caller has to rebuild from the source files.
+    """
+    current = journal_id(source, day)
+    offset = 0
+    if pos is not None:
+        saved_id, offset = pos
+        # Nothing was read yet at offset 0, so any journal continues from there
+        if offset and (saved_id != current or offset > size(source, day)):
+            return None, position(source, day)
+
+    path = journal_path(source, day)
+    if not path.exists():
+        return [], [current, offset]
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    # Leave a partially written last line for the next read
+    end = data.rfind(b"\n") + 1
+    records = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+    return records, [current, offset + end]
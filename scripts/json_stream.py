@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Streaming JSON Records
+
+Reads and writes the pipeline's JSON files one record at a time, so memory
+use depends on the largest single record rather than the size of the file.
+
+Understands the layouts the ingesters write:
+- a list of records:                       [ {...}, {...} ]
+- a dict wrapping the list:                {"entries": [...]} / {"posts": [...]}
+- a single record:                         {...}
+
+Usage:
+    from json_stream import iter_records, JSONArrayWriter
+    for entry in iter_records("data/nostr/2025-01-01.json"):
+        ...
+    with JSONArrayWriter("data/aggregated/2025-01-01.json") as writer:
+        writer.write(entry)
+"""
+import json
+import os
+from typing import Any, Iterator, Optional
+
+CHUNK_SIZE = 64 * 1024
+
+# Keys of a wrapping dict whose list holds the records
+RECORD_LIST_KEYS = ("entries", "posts")
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Incremental buffer over a text file with raw_decode-based value parsing"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer only holds the current record
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Next non-whitespace character (not consumed), or None at EOF"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number or literal ending at the buffer edge may continue in the next chunk
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                obj, self.pos = _decoder.raw_decode(self.buf, self.pos)
+                return obj
+
+    def array_items(self) -> Iterator[Any]:
+        """Yield the elements of the array starting at the cursor"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {self.pos - 1}")
+
+
+def iter_records(path) -> Iterator[dict]:
+    """
+    Stream the records of a pipeline JSON file
+
+    Yields nothing for a missing or empty file. A dict without a record list
+    is yielded as a single record, matching aggregate.load_source_data().
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f)
+        first = reader.peek()
+
+        if first == "[":
+            yield from reader.array_items()
+            return
+        if first != "{":
+            return
+
+        # Walk the top-level dict, streaming the record list if there is one
+        reader.expect("{")
+        others = {}
+        while reader.peek() not in ("}", None):
+            key = reader.value()
+            reader.expect(":")
+            if key in RECORD_LIST_KEYS and reader.peek() == "[":
+                yield from reader.array_items()
+                return
+            others[key] = reader.value()
+            if reader.peek() == ",":
+                reader.pos += 1
+        yield others
+
+
+class JSONArrayWriter:
+    """
+    Write a JSON array one record at a time
+
+    Output is identical to json.dump(records, f, indent=2). The file is
+    written to a temporary path and moved into place on close, so readers
+    never see a half-written array.
+    """
+
+    def __init__(self, path, ensure_ascii: bool = True):
+        self.path = str(path)
+        self.tmp_path = f"{self.path}.tmp"
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        self.f = None
+
+    def __enter__(self):
+        self.f = open(self.tmp_path, "w", encoding="utf-8")
+        self.f.write("[")
+        return self
+
+    def write(self, record: Any):
+        body = json.dumps(record, indent=2, ensure_ascii=self.ensure_ascii)
+        self.f.write(",\n  " if self.count else "\n  ")
+        self.f.write(body.replace("\n", "\n  "))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.f.write("\n]" if self.count else "]")
+            self.f.close()
+            os.replace(self.tmp_path, self.path)
+        else:
+            self.f.close()
+            os.remove(self.tmp_path)
+        return False
@@ -29,17 +29,19 @@ class AdaptiveProphecyEngine:
                  ollama_url="https://ollama.com", 
                  api_key=None,
                  model="gpt-oss:120b-cloud",  # Cloud model for prophecy generation
-                 embedding_model="nomic-embed-text",  # Cloud embedding model
+                 embedding_model=None,  # Cloud model, or "local" for the resident MiniLM service
                  db_path="data/review_history.db"):
         self.ollama_url = ollama_url
         self.api_key = api_key or os.getenv("OLLAMA_API_KEY") or os.getenv("OLLAMA_TURBO_CLOUD_API_KEY")
         self.model = model
-        self.embedding_model = embedding_model
+        self.embedding_model = embedding_model or os.getenv("PULSE_RAG_EMBEDDINGS", "nomic-embed-text")
         self.db_path = Path(db_path)
         self.llm = None
         self.embeddings = None
         self.vectorstore = None
-        self.persist_directory = Path("data/chroma_db")
+        # Vectors from different models can't share a store
+        self.persist_directory = Path("data/chroma_db" if self.embedding_model == "nomic-embed-text"
+                                      else f"data/chroma_db_{self.embedding_model}")
 
     def initialize(self):
         """Initialize components with Ollama Cloud API (official client)"""
@@ -59,13 +61,18 @@ class AdaptiveProphecyEngine:
             )
             print(f"✅ Ollama Cloud client initialized: {self.ollama_url}")
 
-            # For embeddings, use the OllamaEmbeddings wrapper but configure for cloud
-            # Note: This uses the ollama library under the hood
-            self.embeddings = OllamaEmbeddings(
-                base_url=self.ollama_url,
-                model=self.embedding_model,
-                # Pass API key via environment (OllamaEmbeddings reads OLLAMA_HOST)
-            )
+            if self.embedding_model == "local":
+                # Same resident MiniLM service mine_insights uses (in-process fallback)
+                from embedding_service import LocalEmbeddings
+                self.embeddings = LocalEmbeddings()
+            else:
+                # For embeddings, use the OllamaEmbeddings wrapper but configure for cloud
+                # Note: This uses the ollama library under the hood
+                self.embeddings = OllamaEmbeddings(
+                    base_url=self.ollama_url,
+                    model=self.embedding_model,
+                    # Pass API key via environment (OllamaEmbeddings reads OLLAMA_HOST)
+                )
             print(f"✅ Embeddings initialized: {self.embedding_model}")
             
             # Ensure API key is in environment for embeddings
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - LLM Response Cache
+
+Opt-in, content-addressed on-disk cache for OllamaTurboClient.generate().
+A response is keyed by the SHA-256 of the request that produced it (model,
+messages, options, format, web_search), so retrying the daily workflow or
+re-running a report on the same inputs is answered locally instead of paying
+for the same DeepSeek / GPT-OSS / Kimi call twice.
+
+- Entries expire after PULSE_LLM_CACHE_TTL_HOURS (default 72)
+- Total size is capped at PULSE_LLM_CACHE_MAX_MB (default 64); least recently
+  used entries are evicted first
+
+Enable with PULSE_LLM_CACHE=1 or OllamaTurboClient(cache=True). Calls that are
+meant to differ every time pass use_cache=False to generate().
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+# Anchored to the repo root: report generation runs from scripts/
+CACHE_PATH = Path(os.getenv(
+    "PULSE_LLM_CACHE_DB",
+    Path(__file__).resolve().parent.parent / "data" / "cache" / "llm_cache.db"
+))
+TTL_SECONDS = float(os.getenv("PULSE_LLM_CACHE_TTL_HOURS", "72")) * 3600
+MAX_BYTES = int(float(os.getenv("PULSE_LLM_CACHE_MAX_MB", "64")) * 1024 * 1024)
+
+
+def enabled_by_default() -> bool:
+    """Whether the cache is switched on through the environment"""
+    return os.getenv("PULSE_LLM_CACHE", "").lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def _get_connection():
+    """Context manager for cache connections"""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH, timeout=30.0)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS llm_responses (
+            key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            response TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_llm_accessed ON llm_responses(accessed_at)')
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def make_key(payload: Dict) -> str:
+    """Content hash of the parts of a chat request that determine its answer"""
+    identity = {
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "options": payload.get("options"),
+        "format": payload.get("format"),
+        "web_search": payload.get("web_search", False),
+    }
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Cached response for a key, or None if missing or expired"""
+    now = time.time()
+    with _get_connection() as conn:
+        row = conn.execute(
+            'SELECT response, created_at FROM llm_responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        response, created_at = row
+        if now - created_at > TTL_SECONDS:
+            conn.execute('DELETE FROM llm_responses WHERE key = ?', (key,))
+            return None
+        conn.execute('UPDATE llm_responses SET accessed_at = ? WHERE key = ?', (now, key))
+    return response
+
+
+def put(key: str, model: str, response: str):
+    """Store a response, then drop expired entries and evict LRU entries over the size cap"""
+    now = time.time()
+    size = len(response.encode("utf-8"))
+    with _get_connection() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO llm_responses (key, model, response, size, created_at, accessed_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, model, response, size, now, now)
+        )
+        conn.execute('DELETE FROM llm_responses WHERE created_at < ?', (now - TTL_SECONDS,))
+
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM llm_responses').fetchone()[0]
+        if total <= MAX_BYTES:
+            return
+        for old_key, old_size in conn.execute(
+            'SELECT key, size FROM llm_responses ORDER BY accessed_at ASC'
+        ).fetchall():
+            if total <= MAX_BYTES:
+                break
+            conn.execute('DELETE FROM llm_responses WHERE key = ?', (old_key,))
+            total -= old_size
@@ -3,20 +3,35 @@
 Ollama Pulse - Insights Mining
 Uses embeddings + clustering to detect patterns and infer implications
 """
+import argparse
 import json
 import os
 import re
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
 
+import backfill
+from pulse_entry import load_entries
+
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.cluster import KMeans
-    import numpy as np
-    EMBEDDINGS_AVAILABLE = True
+    from cluster_labels import label_clusters
+    from embedding_cache import EmbeddingCache
+    from pattern_clusters import OnlineClusters, item_key
+    # Not imported here: EmbeddingCache loads the model only when it has texts
+    # to encode, pattern_clusters imports KMeans only to split a cluster
+    EMBEDDINGS_AVAILABLE = find_spec("sentence_transformers") is not None and find_spec("sklearn") is not None
 except ImportError:
-    print("⚠️  sentence-transformers or scikit-learn not available - using fallback mode")
     EMBEDDINGS_AVAILABLE = False
+if not EMBEDDINGS_AVAILABLE:
+    print("⚠️  sentence-transformers or scikit-learn not available - using fallback mode")
+
+MIN_PATTERN_SIZE = 2
+
+# Keyword membership for the combo rules in infer_implications (ML patterns are
+# named after their distinctive terms, simple-mode patterns after their category)
+MULTIMODAL_TERMS = {"multimodal", "vision", "image", "images", "qwen3-vl", "llava"}
+NO_CODE_TERMS = {"n8n", "zapier", "no-code", "nocode"}
 
 
 def ensure_data_dir():
@@ -24,23 +39,22 @@ def ensure_data_dir():
     Path("data/insights").mkdir(parents=True, exist_ok=True)
 
 
-def get_today_filename():
-    """Get filename for today's insights"""
-    today = datetime.now().strftime("%Y-%m-%d")
+def get_today_filename(day=None):
+    """Get filename for today's (or `day`'s) insights"""
+    today = day or datetime.now().strftime("%Y-%m-%d")
     return f"data/insights/{today}.json"
 
 
-def load_aggregated_data():
-    """Load today's aggregated data"""
-    today = datetime.now().strftime("%Y-%m-%d")
+def load_aggregated_data(day=None):
+    """Load today's (or `day`'s) aggregated data as PulseEntry records"""
+    today = day or datetime.now().strftime("%Y-%m-%d")
     filename = f"data/aggregated/{today}.json"
     
     if not os.path.exists(filename):
         print(f"❌ No aggregated data found for {today}")
         return []
     
-    with open(filename, 'r') as f:
-        return json.load(f)
+    return list(load_entries(filename))
 
 
 def generate_dynamic_queries(entries):
@@ -118,60 +132,64 @@ def detect_patterns_simple(entries):
     return significant_patterns
 
 
-def detect_patterns_ml(entries):
-    """Advanced pattern detection using embeddings + clustering"""
+def detect_patterns_ml(entries, day=None):
+    """Advanced pattern detection using embeddings + persistent cross-day clusters"""
     print("🔍 Detecting patterns (ML mode)...")
     
     # Extract text for embedding
     texts = [e.get('title', '') + ' ' + e.get('summary', '') for e in entries]
     
-    # Generate embeddings
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    embeddings = model.encode(texts)
+    # Generate embeddings (only texts not seen on earlier runs are encoded)
+    cache = EmbeddingCache()
+    embeddings = cache.embed(texts)
+    print(f"   Embeddings: {cache.hits} cached, {cache.misses} encoded")
     
-    # Cluster (3-5 clusters based on data size)
-    n_clusters = min(5, max(3, len(entries) // 10))
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-    labels = kmeans.fit_predict(embeddings)
+    # Place new items into the clusters carried over from earlier days
+    day = day or datetime.now().strftime("%Y-%m-%d")
+    engine = OnlineClusters(space=cache.space)
+    labels, drift, events = engine.update(day, [item_key(e) for e in entries], embeddings)
+    if events["read_only"]:
+        print("   Clusters: past day, matched against existing clusters only")
+    else:
+        print(f"   Clusters: {len(drift)} active, {len(events['created'])} new, "
+              f"{len(events['merged'])} merged, {len(events['split'])} split")
     
-    # Group by cluster
+    # Group by cluster (largest first); on past days items no cluster fits are left out
     clusters = {}
-    for i, label in enumerate(labels):
-        if label not in clusters:
-            clusters[label] = []
-        clusters[label].append(entries[i])
+    for entry, label in zip(entries, labels):
+        if label is not None:
+            clusters.setdefault(label, []).append(entry)
+    clusters = dict(sorted(clusters.items(), key=lambda kv: -len(kv[1])))
+    
+    # Name clusters after their distinctive terms (single items aren't a pattern)
+    clusters = {cid: members for cid, members in clusters.items() if len(members) >= MIN_PATTERN_SIZE}
+    themes, keywords = label_clusters({
+        cid: [e.get('title', '') + ' ' + e.get('summary', '') for e in members]
+        for cid, members in clusters.items()
+    })
+    if not events["read_only"]:
+        engine.set_labels(themes)
     
-    # Tag clusters
     tagged_patterns = {}
+    cluster_stats = {}
     for cluster_id, cluster_entries in clusters.items():
-        # Analyze cluster content
-        combined_text = ' '.join([e.get('title', '') + ' ' + e.get('summary', '') for e in cluster_entries]).lower()
-        
-        # Determine cluster theme
-        if 'multimodal' in combined_text or 'vision' in combined_text:
-            theme = "multimodal_hybrids"
-        elif 'cloud' in combined_text:
-            theme = "cloud_models"
-        elif 'n8n' in combined_text or 'zapier' in combined_text:
-            theme = "no_code_wrappers"
-        elif 'voice' in combined_text or 'stt' in combined_text:
-            theme = "voice_integration"
-        else:
-            theme = f"cluster_{cluster_id}"
-        
+        theme = themes[cluster_id]
         tagged_patterns[theme] = cluster_entries
+        cluster_stats[theme] = {**drift.get(cluster_id, {"id": cluster_id}), "keywords": keywords[cluster_id]}
     
     print(f"✅ Found {len(tagged_patterns)} ML-detected patterns")
-    return tagged_patterns
+    return tagged_patterns, cluster_stats
 
 
-def infer_implications(patterns):
-    """Apply heuristic rules to infer implications"""
+def infer_implications(patterns, keywords=None):
+    """Apply heuristic rules to infer implications (keywords: pattern -> distinctive terms)"""
     print("💡 Inferring implications...")
     
     inferences = []
+    keywords = keywords or {}
     
     for pattern_name, entries in patterns.items():
+        terms = set(keywords.get(pattern_name, []))
         # Density rule: >3 items = emerging trend
         if len(entries) >= 3:
             inferences.append({
@@ -182,7 +200,7 @@ def infer_implications(patterns):
             })
         
         # Combo rules
-        if pattern_name == "multimodal_hybrids" or pattern_name == "multimodal":
+        if pattern_name == "multimodal" or terms & MULTIMODAL_TERMS:
             inferences.append({
                 "pattern": pattern_name,
                 "observation": "Multimodal cloud models available",
@@ -190,7 +208,7 @@ def infer_implications(patterns):
                 "confidence": "high"
             })
         
-        if pattern_name == "no_code_wrappers" or pattern_name == "no_code":
+        if pattern_name == "no_code" or terms & NO_CODE_TERMS:
             inferences.append({
                 "pattern": pattern_name,
                 "observation": "No-code integrations growing",
@@ -202,12 +220,13 @@ def infer_implications(patterns):
     return inferences
 
 
-def save_insights(patterns, inferences, dynamic_queries=None):
+def save_insights(patterns, inferences, dynamic_queries=None, day=None, clusters=None):
     """Save insights to JSON"""
-    filename = get_today_filename()
+    filename = get_today_filename(day)
     
     insights = {
-        "date": datetime.now().isoformat(),
+        # Backfilled days are stamped with their own date so reruns are reproducible
+        "date": f"{day}T00:00:00" if day else datetime.now().isoformat(),
         "patterns": {k: [{"title": e.get('title'), "url": e.get('url')} for e in v] for k, v in patterns.items()},
         "inferences": inferences,
         "dynamic_queries": dynamic_queries or [],
@@ -218,19 +237,20 @@ def save_insights(patterns, inferences, dynamic_queries=None):
         }
     }
     
+    if clusters:
+        # Persistent cluster id and drift per ML pattern (see pattern_clusters.py)
+        insights["clusters"] = clusters
+    
     with open(filename, 'w') as f:
         json.dump(insights, f, indent=2)
     
     print(f"💾 Saved insights to {filename}")
 
 
-def main():
-    """Main mining function"""
-    print("🚀 Starting insights mining...")
-    ensure_data_dir()
-    
+def mine(day=None):
+    """Mine today's (or `day`'s) aggregated entries into an insights file"""
     # Load data
-    entries = load_aggregated_data()
+    entries = load_aggregated_data(day)
     if not entries:
         print("⚠️  No data to mine")
         return
@@ -241,16 +261,50 @@ def main():
     dynamic_queries = generate_dynamic_queries(entries)
     
     # Detect patterns
+    clusters = None
     if EMBEDDINGS_AVAILABLE and len(entries) >= 10:
-        patterns = detect_patterns_ml(entries)
+        patterns, clusters = detect_patterns_ml(entries, day)
     else:
         patterns = detect_patterns_simple(entries)
     
     # Infer implications
-    inferences = infer_implications(patterns)
+    keywords = {name: stats["keywords"] for name, stats in (clusters or {}).items()}
+    inferences = infer_implications(patterns, keywords)
     
     # Save
-    save_insights(patterns, inferences, dynamic_queries)
+    save_insights(patterns, inferences, dynamic_queries, day, clusters)
+
+
+def backfill_inputs(day):
+    return [f"data/aggregated/{day}.json"]
+
+
+def backfill_outputs(day):
+    return [get_today_filename(day)]
+
+
+# Scripts whose changes alter mined insights (embeddings, clustering, labels, entry parsing)
+BACKFILL_CODE = ["mine_insights.py", "embedding_cache.py", "embedding_service.py", "onnx_embedder.py",
+                 "pattern_clusters.py", "cluster_labels.py", "pulse_entry.py"]
+
+
+def main():
+    """Main mining function"""
+    parser = argparse.ArgumentParser(description="Ollama Pulse insights mining")
+    backfill.add_date_arguments(parser)
+    args = parser.parse_args()
+    days = backfill.resolve_days(args)
+
+    print("🚀 Starting insights mining...")
+    ensure_data_dir()
+
+    if days:
+        # One worker, oldest day first: each day's clustering builds on the
+        # cluster state left by the days before it (--workers is ignored)
+        backfill.run_days("mine_insights", mine, days, backfill_inputs, backfill_outputs,
+                          code=BACKFILL_CODE, workers=1, force=args.force)
+    else:
+        mine()
     
     print("✅ Insights mining complete!")
 
@@ -6,6 +6,7 @@ Enhanced with capabilities for reliable data gathering:
 - Web Search: Fallback when GitHub API fails
 - Structured Outputs: Clean JSON for model/tool metadata
 - Rate limiting: Avoid API throttling
+- Response cache: Opt-in on-disk cache for repeated generate() calls
 
 Author: Ollama Pulse Intelligence Team
 """
@@ -16,6 +17,12 @@ import json
 import os
 from typing import List, Dict, Optional
 from datetime import datetime
+
+import numpy as np
+
+import http_transport
+import llm_cache
+import rate_limiter
 from model_registry import select_model_for_task, select_model_by_complexity, TaskComplexity
 
 
@@ -25,25 +32,34 @@ class OllamaTurboClient:
 
     Works in GitHub Actions and locally
     Uses Ollama API (https://ollama.com)
+
+    Connections come from the event loop's shared pool in http_transport, so
+    several clients in one loop reuse the same keep-alive connections.
+
+    With cache=True (or PULSE_LLM_CACHE=1) generate() answers repeated
+    requests from llm_cache instead of calling the API again.
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://ollama.com"):
+    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://ollama.com",
+                 cache: Optional[bool] = None):
         self.api_key = api_key or os.getenv("OLLAMA_API_KEY") or os.getenv("OLLAMA_TURBO_CLOUD_API_KEY") or os.getenv("OLLAMA_TURBO_CLOUD_API_KEY_1") or os.getenv("OLLAMA_TURBO_CLOUD_API_KEY_2")
         self.base_url = base_url
         self.session: Optional[aiohttp.ClientSession] = None
+        # Sent per request - the pooled session is shared with other clients
+        self.headers = {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+        self.cache = llm_cache.enabled_by_default() if cache is None else cache
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-        )
+        self.session = await http_transport.acquire_client_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            self.session = None
+            await http_transport.release_client_session()
 
     async def check_model_availability(self) -> List[str]:
         """
@@ -54,7 +70,7 @@ class OllamaTurboClient:
         """
         try:
             url = f"{self.base_url}/api/tags"
-            async with self.session.get(url) as response:
+            async with self.session.get(url, headers=self.headers) as response:
                 response.raise_for_status()
                 data = await response.json()
                 models = data.get("models", [])
@@ -135,7 +151,8 @@ class OllamaTurboClient:
         max_tokens: int = 1000,
         temperature: float = 0.7,
         web_search: bool = False,
-        structured_output: Optional[Dict] = None
+        structured_output: Optional[Dict] = None,
+        use_cache: bool = True
     ) -> str:
         """
         Generate text using Ollama Cloud
@@ -147,6 +164,8 @@ class OllamaTurboClient:
             temperature: Sampling temperature
             web_search: Enable web search capability (fallback)
             structured_output: JSON schema for structured response
+            use_cache: Set False for deliberately non-deterministic calls so
+                they always reach the API (only relevant when caching is on)
 
         Returns:
             Generated text or JSON string
@@ -172,10 +191,21 @@ class OllamaTurboClient:
         if structured_output:
             payload['format'] = structured_output
 
-        async with self.session.post(url, json=payload) as response:
+        cache_key = llm_cache.make_key(payload) if self.cache and use_cache else None
+        if cache_key:
+            # SQLite lookups may wait on the cache's write lock; keep them off the loop
+            cached = await asyncio.to_thread(llm_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        async with self.session.post(url, json=payload, headers=self.headers) as response:
             response.raise_for_status()
             data = await response.json()
-            return data['message']['content']
+            content = data['message']['content']
+
+        if cache_key:
+            await asyncio.to_thread(llm_cache.put, cache_key, model, content)
+        return content
 
     async def web_search_fallback(
         self,
@@ -339,7 +369,7 @@ CRITICAL RULES:
                 }
             }
 
-            async with self.session.post(url, json=payload) as response:
+            async with self.session.post(url, json=payload, headers=self.headers) as response:
                 response.raise_for_status()
                 data = await response.json()
                 return data['message']['content']
@@ -499,34 +529,51 @@ Show your work at each step."""
         self,
         model: str,
         texts: List[str],
-        delay: float = 0.5
-    ) -> List[List[float]]:
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        max_retries: int = 5
+    ) -> np.ndarray:
         """
-        Generate embeddings with rate limiting
+        Generate embeddings in batches through /api/embed
+
+        Texts are sent `batch_size` at a time with at most `max_concurrency`
+        batches in flight. Requests are paced by the shared rate limiter; a 429
+        blocks the limiter's bucket (Retry-After / X-RateLimit headers, or its
+        default backoff), so the retry simply waits for the next token.
 
         Args:
             model: Embedding model (e.g., 'nomic-embed-text')
             texts: List of texts to embed
-            delay: Delay between requests (seconds)
+            batch_size: Texts per request
+            max_concurrency: Batches in flight at once
+            max_retries: Retries per batch on 429
 
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dim), in input order
         """
-        embeddings = []
-
-        for text in texts:
-            url = f"{self.base_url}/api/embeddings"
-            payload = {'model': model, 'prompt': text}
-
-            async with self.session.post(url, json=payload) as response:
-                response.raise_for_status()
-                data = await response.json()
-                embeddings.append(data['embedding'])
-
-            # Rate limiting
-            await asyncio.sleep(delay)
-
-        return embeddings
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        url = f"{self.base_url}/api/embed"
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_one(batch: List[str]) -> np.ndarray:
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    await rate_limiter.acquire_async(url)
+                    async with self.session.post(
+                        url, json={'model': model, 'input': batch}, headers=self.headers
+                    ) as response:
+                        await rate_limiter.observe_async(url, response.status, response.headers)
+                        if response.status == 429 and attempt < max_retries:
+                            continue
+                        response.raise_for_status()
+                        data = await response.json()
+                        return np.asarray(data['embeddings'], dtype=np.float32)
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        results = await asyncio.gather(*(embed_one(batch) for batch in batches))
+        return np.ascontiguousarray(np.concatenate(results), dtype=np.float32)
 
 
 # Recommended models for Ollama Pulse (Based on verified 2025 benchmarks + capabilities)
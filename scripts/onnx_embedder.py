@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Quantized ONNX Sentence Encoder
+
+CPU-only alternative to SentenceTransformer.encode for the insight
+embeddings: the model's transformer is exported to ONNX, weights are
+quantized to int8 (dynamic quantization) and inference runs through ONNX
+Runtime with a configurable number of intra-op threads. Pooling and
+normalisation are done in numpy, mirroring the sentence-transformers
+pipeline (mean pooling + L2 normalise for all-MiniLM-L6-v2).
+
+An export is only used after it has been validated against the PyTorch
+embeddings (minimum cosine agreement >= MIN_COSINE over real titles and
+summaries); the result is recorded next to the model:
+
+    data/cache/onnx/<model>/model.int8.onnx
+    data/cache/onnx/<model>/pulse_onnx.json     pooling, max length, validation result
+    data/cache/onnx/<model>/tokenizer files
+
+Select the engine with PULSE_EMBEDDING_ENGINE=auto|onnx|torch (see
+embedding_service.resolve_engine); a model without a validated export is
+encoded with PyTorch.
+
+Requires: pip install onnx onnxruntime (export also needs torch/transformers,
+which sentence-transformers already pulls in)
+
+Usage:
+    python scripts/onnx_embedder.py export              # export, quantize, validate
+    python scripts/onnx_embedder.py validate
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+ONNX_DIR = Path(os.getenv("PULSE_ONNX_DIR", "data/cache/onnx"))
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_THREADS = int(os.getenv("PULSE_ONNX_THREADS", "0"))  # 0: let ONNX Runtime decide
+MIN_COSINE = 0.98
+CONFIG_NAME = "pulse_onnx.json"
+QUANTIZATION = "int8"
+MODEL_FILE = f"model.{QUANTIZATION}.onnx"
+
+SAMPLE_TEXTS = [
+    "Ollama adds support for vision models in the cloud API",
+    "New n8n workflow node for local LLM agents",
+    "Voice assistant built on Whisper STT and llama3",
+    "How do I run qwen2.5-coder with a 32k context window?",
+    "Release v0.4.2: faster model loading and structured outputs",
+]
+
+
+def model_dir(model_name: str = DEFAULT_MODEL) -> Path:
+    return ONNX_DIR / model_name.replace("/", "_")
+
+
+def validation_texts(limit: int = 256) -> List[str]:
+    """Titles and summaries from the most recent aggregated days (samples if there are none)"""
+    texts = []
+    for path in sorted(Path("data/aggregated").glob("????-??-??.json"), reverse=True):
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        texts.extend(f"{e.get('title', '')} {e.get('summary', '')}" for e in entries if isinstance(e, dict))
+        if len(texts) >= limit:
+            break
+    return texts[:limit] or SAMPLE_TEXTS
+
+
+def _cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.clip(np.linalg.norm(a, axis=1, keepdims=True), 1e-12, None)
+    b = b / np.clip(np.linalg.norm(b, axis=1, keepdims=True), 1e-12, None)
+    return (a * b).sum(axis=1)
+
+
+class OnnxEncoder:
+    """Sentence encoder over an exported, int8-quantized transformer"""
+
+    def __init__(self, path: Path, threads: int = DEFAULT_THREADS):
+        from transformers import AutoTokenizer
+
+        self.path = Path(path)
+        with open(self.path / CONFIG_NAME, 'r', encoding='utf-8') as f:
+            self.config = json.load(f)
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(str(self.path / MODEL_FILE), options,
+                                            providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.path))
+
+    def __call__(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        # Length-sorted batches pad less
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        chunks = []
+        for i in range(0, len(texts), batch_size):
+            batch = [texts[j] for j in order[i:i + batch_size]]
+            encoded = self.tokenizer(batch, padding=True, truncation=True,
+                                     max_length=self.config["max_seq_length"], return_tensors="np")
+            feeds = {k: v.astype(np.int64) for k, v in encoded.items() if k in self.input_names}
+            hidden = self.session.run(None, feeds)[0]
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if self.config["normalize"]:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            chunks.append(pooled)
+
+        vectors = np.empty((len(texts), chunks[0].shape[1]), dtype=np.float32)
+        vectors[order] = np.concatenate(chunks)
+        return vectors
+
+
+def export(model_name: str = DEFAULT_MODEL) -> Path:
+    """Export the model's transformer to ONNX and quantize its weights to int8"""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+
+    st_model = SentenceTransformer(model_name, device="cpu")
+    modules = [type(m).__name__ for m in st_model]
+    pooling = st_model[1].get_pooling_mode_str() if len(st_model) > 1 else None
+    if pooling != "mean":
+        raise ValueError(f"{model_name}: only mean pooling is supported, got {pooling}")
+
+    out = model_dir(model_name)
+    out.mkdir(parents=True, exist_ok=True)
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    sample = tokenizer(SAMPLE_TEXTS[:2], padding=True, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    fp32_path = out / "model.fp32.onnx"
+    print(f"📦 Exporting {model_name} ({' -> '.join(modules)}) to ONNX...")
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes={name: {0: "batch", 1: "sequence"} for name in input_names + ["last_hidden_state"]},
+            opset_version=14,
+        )
+
+    print("🗜️  Quantizing weights to int8...")
+    quantize_dynamic(str(fp32_path), str(out / MODEL_FILE), weight_type=QuantType.QInt8)
+    fp32_path.unlink()
+
+    tokenizer.save_pretrained(str(out))
+    with open(out / CONFIG_NAME, 'w', encoding='utf-8') as f:
+        json.dump({
+            "source_model": model_name,
+            "max_seq_length": st_model.max_seq_length,
+            "normalize": "Normalize" in modules,
+            "exported_at": datetime.now().isoformat(),
+        }, f, indent=2)
+    return out
+
+
+def validate(model_name: str = DEFAULT_MODEL, texts: Optional[List[str]] = None,
+             threads: int = DEFAULT_THREADS) -> dict:
+    """Compare the ONNX encoder to PyTorch by cosine agreement and record the result"""
+    from sentence_transformers import SentenceTransformer
+
+    path = model_dir(model_name)
+    texts = texts or validation_texts()
+    reference = SentenceTransformer(model_name, device="cpu").encode(texts, batch_size=64)
+    candidate = OnnxEncoder(path, threads)(texts)
+    cosines = _cosines(np.asarray(reference, dtype=np.float32), candidate)
+
+    result = {
+        "texts": len(texts),
+        "min_cosine": round(float(cosines.min()), 5),
+        "mean_cosine": round(float(cosines.mean()), 5),
+        "passed": bool(cosines.min() >= MIN_COSINE),
+        "validated_at": datetime.now().isoformat(),
+    }
+    config_path = path / CONFIG_NAME
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config["validation"] = result
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    return result
+
+
+def is_ready(model_name: str = DEFAULT_MODEL) -> bool:
+    """True when load() would succeed without exporting or validating first"""
+    path = model_dir(model_name)
+    if not ONNX_AVAILABLE or not (path / MODEL_FILE).exists():
+        return False
+    try:
+        with open(path / CONFIG_NAME, 'r', encoding='utf-8') as f:
+            validation = json.load(f).get("validation")
+    except (OSError, ValueError):
+        return False
+    return bool(validation and validation["passed"])
+
+
+def load(model_name: str = DEFAULT_MODEL, export_if_missing: bool = False,
+         threads: int = DEFAULT_THREADS) -> OnnxEncoder:
+    """Validated ONNX encoder for a model; raises RuntimeError when there is none"""
+    if not ONNX_AVAILABLE:
+        raise RuntimeError("onnxruntime is not installed")
+    path = model_dir(model_name)
+    if not (path / MODEL_FILE).exists():
+        if not export_if_missing:
+            raise RuntimeError(f"no ONNX export at {path}")
+        export(model_name)
+    with open(path / CONFIG_NAME, 'r', encoding='utf-8') as f:
+        validation = json.load(f).get("validation")
+    if validation is None:
+        validation = validate(model_name, threads=threads)
+    if not validation["passed"]:
+        raise RuntimeError(f"ONNX export failed validation (min cosine {validation['min_cosine']})")
+    return OnnxEncoder(path, threads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantized ONNX encoder for Ollama Pulse embeddings")
+    parser.add_argument("command", choices=["export", "validate"])
+    parser.add_argument("--model", default=DEFAULT_MODEL, help=f"Sentence-transformers model (default: {DEFAULT_MODEL})")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help="ONNX Runtime intra-op threads (default: PULSE_ONNX_THREADS or runtime default)")
+    args = parser.parse_args()
+
+    if not ONNX_AVAILABLE:
+        print("❌ onnxruntime not installed - pip install onnx onnxruntime")
+        return 1
+
+    if args.command == "export":
+        path = export(args.model)
+        print(f"💾 Saved quantized model to {path}")
+    result = validate(args.model, threads=args.threads)
+    status = "✅" if result["passed"] else "❌"
+    print(f"{status} Cosine agreement with PyTorch over {result['texts']} texts: "
+          f"min {result['min_cosine']:.4f}, mean {result['mean_cosine']:.4f} (threshold {MIN_COSINE})")
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Incremental Cross-Day Pattern Clustering
+
+Online clustering of entry embeddings with centroids that persist across
+days, so a pattern keeps its id from one day to the next and trends can be
+read off its history instead of re-clustering all of it.
+
+Each run only places items it has not seen before:
+    - a new item joins the most similar centroid (cosine >= ASSIGN_THRESHOLD,
+      running mean update) or starts a new cluster
+    - clusters whose centroids converge (cosine >= MERGE_THRESHOLD) are merged
+      into the older one
+    - a cluster whose members today are spread out (cohesion < SPLIT_COHESION)
+      is split in two with 2-means over those members
+    - clusters without new items for RETIRE_DAYS are retired
+
+Per-cluster drift for the day: new items, growth against the trailing week,
+centroid shift since the start of the day, cohesion and a trend label.
+
+State (data/cache/clusters/, restored in CI with the embeddings cache):
+    state.json      clusters (created, last seen, weight, daily counts),
+                    item memberships, last processed day, embedding space
+    centroids.npz   current centroids and the snapshot taken at the day's first run
+
+Centroids only make sense in the embedding space (model + engine, see
+EmbeddingCache.space) they were built in: loading the state for another
+space starts a fresh one.
+
+Days before the last processed day are assigned read-only (no drift), so a
+backfill never rewrites later history; `rebuild` replays all days in order.
+
+Usage:
+    python scripts/pattern_clusters.py rebuild [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+    python scripts/pattern_clusters.py show
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+STATE_DIR = Path(os.getenv("PULSE_CLUSTER_DIR", "data/cache/clusters"))
+STATE_VERSION = 1
+
+ASSIGN_THRESHOLD = 0.45
+MERGE_THRESHOLD = 0.80
+SPLIT_COHESION = 0.50
+MIN_SPLIT_MEMBERS = 6
+MAX_WEIGHT = 200  # Caps a centroid's inertia so long-lived clusters can still drift
+RETIRE_DAYS = 60
+MEMBERSHIP_DAYS = 90
+DAILY_HISTORY_DAYS = 60
+TREND_WINDOW_DAYS = 7
+
+
+def item_key(entry) -> str:
+    """Stable identity of an entry across runs (URL, title as fallback)"""
+    key = entry.get('url') or entry.get('title', '')
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.clip(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-12, None)
+
+
+def _days_between(start: str, end: str) -> int:
+    return (date.fromisoformat(end) - date.fromisoformat(start)).days
+
+
+class OnlineClusters:
+    """Persistent centroid clustering with split/merge and per-day drift"""
+
+    def __init__(self, state_dir: Path = STATE_DIR, space: Optional[str] = None):
+        self.state_dir = Path(state_dir)
+        self.space = space  # None: accept whatever space the state was built in (read-only use)
+        self.state = None
+        self.centroids: Dict[int, np.ndarray] = {}
+        self.start_centroids: Dict[int, np.ndarray] = {}
+
+    # -- storage -----------------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        """Hold the state lock (backfill workers share one state)"""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.state_dir / ".lock", 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _load(self):
+        path = self.state_dir / "state.json"
+        state = None
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        if (not state or state.get("version") != STATE_VERSION
+                or (self.space is not None and state.get("space") != self.space)):
+            state = {"version": STATE_VERSION, "space": self.space, "next_id": 0, "last_day": None,
+                     "clusters": {}, "memberships": {}}
+        self.state = state
+        self.centroids, self.start_centroids = {}, {}
+        arrays_path = self.state_dir / "centroids.npz"
+        if arrays_path.exists() and state["clusters"]:
+            with np.load(arrays_path) as arrays:
+                self.centroids = dict(zip(arrays["ids"].tolist(), arrays["centroids"]))
+                self.start_centroids = dict(zip(arrays["start_ids"].tolist(), arrays["start_centroids"]))
+
+    def _save(self):
+        dim = next(iter(self.centroids.values())).shape[0] if self.centroids else 0
+
+        def pack(centroids):
+            ids = np.array(sorted(centroids), dtype=np.int64)
+            matrix = np.array([centroids[i] for i in ids], dtype=np.float32).reshape(len(ids), dim)
+            return ids, matrix
+
+        ids, centroids = pack(self.centroids)
+        start_ids, start_centroids = pack(self.start_centroids)
+        tmp = self.state_dir / "centroids.tmp.npz"
+        np.savez(tmp, ids=ids, centroids=centroids, start_ids=start_ids, start_centroids=start_centroids)
+        tmp.replace(self.state_dir / "centroids.npz")
+
+        tmp = self.state_dir / "state.json.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, separators=(',', ':'))
+        tmp.replace(self.state_dir / "state.json")
+
+    # -- clustering --------------------------------------------------------
+
+    def _matrix(self) -> Tuple[List[int], np.ndarray]:
+        ids = sorted(self.centroids)
+        if not ids:
+            return ids, np.empty((0, 0), dtype=np.float32)
+        return ids, np.stack([self.centroids[i] for i in ids])
+
+    def _new_cluster(self, vector: np.ndarray, day: str) -> int:
+        cid = self.state["next_id"]
+        self.state["next_id"] += 1
+        self.state["clusters"][str(cid)] = {
+            "created": day, "last_seen": day, "weight": 0.0, "total": 0, "daily": {},
+        }
+        self.centroids[cid] = vector.copy()
+        return cid
+
+    def _add(self, cid: int, vector: np.ndarray, day: str):
+        meta = self.state["clusters"][str(cid)]
+        weight = min(meta["weight"], MAX_WEIGHT)
+        self.centroids[cid] = _normalize(self.centroids[cid] * weight + vector)
+        meta["weight"] += 1
+        meta["total"] += 1
+        meta["last_seen"] = day
+        meta["daily"][day] = meta["daily"].get(day, 0) + 1
+
+    def _merge(self, events: Dict) -> Dict[int, int]:
+        """Fold converged clusters into the older one; returns old id -> surviving id"""
+        moved = {}
+        ids, matrix = self._matrix()
+        if len(ids) < 2:
+            return moved
+        sims = matrix @ matrix.T
+        np.fill_diagonal(sims, -1.0)
+        for a, b in zip(*np.nonzero(np.triu(sims >= MERGE_THRESHOLD))):
+            # Ids grow over time, so the smaller one is the older cluster
+            keep, drop = sorted((moved.get(ids[a], ids[a]), moved.get(ids[b], ids[b])))
+            if keep == drop:
+                continue
+            kept, dropped = self.state["clusters"][str(keep)], self.state["clusters"].pop(str(drop))
+            self.centroids[keep] = _normalize(self.centroids[keep] * min(kept["weight"], MAX_WEIGHT)
+                                              + self.centroids.pop(drop) * min(dropped["weight"], MAX_WEIGHT))
+            self.start_centroids.pop(drop, None)
+            kept["weight"] += dropped["weight"]
+            kept["total"] += dropped["total"]
+            kept["created"] = min(kept["created"], dropped["created"])
+            kept["last_seen"] = max(kept["last_seen"], dropped["last_seen"])
+            for day, count in dropped["daily"].items():
+                kept["daily"][day] = kept["daily"].get(day, 0) + count
+            moved = {old: (keep if new == drop else new) for old, new in moved.items()}
+            moved[drop] = keep
+            events["merged"].append([drop, keep])
+        return moved
+
+    def _split(self, members: Dict[int, List[int]], vectors: np.ndarray, day: str, events: Dict) -> Dict[int, int]:
+        """Split clusters whose members today are spread out; returns item index -> new cluster id"""
+        from sklearn.cluster import KMeans
+
+        moved = {}
+        for cid, indices in members.items():
+            if len(indices) < MIN_SPLIT_MEMBERS:
+                continue
+            cohesion = float((vectors[indices] @ self.centroids[cid]).mean())
+            if cohesion >= SPLIT_COHESION:
+                continue
+            halves = KMeans(n_clusters=2, n_init=4, random_state=42).fit(vectors[indices])
+            sub_centroids = _normalize(halves.cluster_centers_)
+            if float(sub_centroids[0] @ sub_centroids[1]) >= MERGE_THRESHOLD:
+                continue  # Loose but not bimodal - the halves would merge right back
+            # The half closest to the existing centroid keeps the cluster's identity
+            stay = int(np.argmax(sub_centroids @ self.centroids[cid]))
+            leaving = [i for i, label in zip(indices, halves.labels_) if label != stay]
+            new_id = self._new_cluster(sub_centroids[1 - stay], day)
+            self.centroids[cid] = sub_centroids[stay]
+            meta, new_meta = self.state["clusters"][str(cid)], self.state["clusters"][str(new_id)]
+            share = len(leaving) / len(indices)
+            new_meta["weight"] = meta["weight"] * share
+            meta["weight"] -= new_meta["weight"]
+            new_meta["total"] = new_meta["daily"][day] = len(leaving)
+            meta["total"] = max(0, meta["total"] - len(leaving))
+            meta["daily"][day] = max(0, meta["daily"].get(day, 0) - len(leaving))
+            moved.update((i, new_id) for i in leaving)
+            events["split"].append([cid, new_id])
+        return moved
+
+    # -- drift -------------------------------------------------------------
+
+    def _drift(self, cid: int, indices: List[int], vectors: np.ndarray, day: str) -> Dict:
+        meta = self.state["clusters"][str(cid)]
+        today = meta["daily"].get(day, 0)
+        previous = [
+            meta["daily"].get((date.fromisoformat(day) - timedelta(days=d)).isoformat(), 0)
+            for d in range(1, TREND_WINDOW_DAYS + 1)
+            if d <= _days_between(meta["created"], day)
+        ]
+        baseline = sum(previous) / len(previous) if previous else 0.0
+        start = self.start_centroids.get(cid)
+        shift = 0.0 if start is None else max(0.0, 1.0 - float(start @ self.centroids[cid]))
+
+        if meta["created"] == day:
+            trend = "new"
+        elif today >= 3 and today >= 2 * max(baseline, 0.5):
+            trend = "growing"
+        elif baseline >= 1 and today < 0.5 * baseline:
+            trend = "fading"
+        else:
+            trend = "stable"
+
+        return {
+            "id": cid,
+            "items_today": len(indices),
+            "new_today": today,
+            "total": meta["total"],
+            "age_days": _days_between(meta["created"], day),
+            "growth": round(today / baseline, 2) if baseline else None,
+            "centroid_shift": round(shift, 4),
+            "cohesion": round(float((vectors[indices] @ self.centroids[cid]).mean()), 4),
+            "trend": trend,
+        }
+
+    # -- public API --------------------------------------------------------
+
+    def assign(self, vectors: np.ndarray) -> List[Optional[int]]:
+        """Nearest existing cluster per vector without changing the state (None below threshold)"""
+        if self.state is None:
+            self._load()
+        ids, matrix = self._matrix()
+        if not ids:
+            return [None] * len(vectors)
+        sims = _normalize(vectors) @ matrix.T
+        best = sims.argmax(axis=1)
+        return [ids[b] if sims[i, b] >= ASSIGN_THRESHOLD else None for i, b in enumerate(best)]
+
+    def update(self, day: str, keys: List[str], vectors: np.ndarray) -> Tuple[List[Optional[int]], Dict[int, Dict], Dict]:
+        """
+        Place one day's items and update the persistent clusters
+
+        Args:
+            day: Day the items belong to (YYYY-MM-DD)
+            keys: Stable item identities (item_key), parallel to vectors
+            vectors: Item embeddings
+
+        Returns:
+            (cluster id per item, drift per cluster with items today, events)
+            Days older than the last processed day are assigned read-only:
+            drift is then empty and unassignable items get None.
+        """
+        events = {"created": [], "merged": [], "split": [], "read_only": False}
+        vectors = _normalize(vectors)
+        with self._locked():
+            self._load()
+            last_day = self.state["last_day"]
+            if last_day and day < last_day:
+                events["read_only"] = True
+                return self.assign(vectors), {}, events
+            if day != last_day:
+                # First run of the day: drift is measured against this snapshot
+                self.start_centroids = {cid: c.copy() for cid, c in self.centroids.items()}
+                self.state["last_day"] = day
+
+            memberships = self.state["memberships"]
+            assignments: List[Optional[int]] = []
+            for key, vector in zip(keys, vectors):
+                known = memberships.get(key)
+                if known and str(known[0]) in self.state["clusters"]:
+                    known[1] = day
+                    assignments.append(known[0])
+                    continue
+                ids, matrix = self._matrix()
+                sims = matrix @ vector if ids else np.empty(0)
+                if len(sims) and sims.max() >= ASSIGN_THRESHOLD:
+                    cid = ids[int(sims.argmax())]
+                else:
+                    cid = self._new_cluster(vector, day)
+                    events["created"].append(cid)
+                self._add(cid, vector, day)
+                memberships[key] = [cid, day]
+                assignments.append(cid)
+
+            merged = self._merge(events)
+            assignments = [merged.get(cid, cid) for cid in assignments]
+            members: Dict[int, List[int]] = {}
+            for i, cid in enumerate(assignments):
+                members.setdefault(cid, []).append(i)
+            split = self._split(members, vectors, day, events)
+            assignments = [split.get(i, cid) for i, cid in enumerate(assignments)]
+            for key, cid in zip(keys, assignments):
+                memberships[key][0] = cid
+            if merged:
+                for membership in memberships.values():
+                    membership[0] = merged.get(membership[0], membership[0])
+
+            members = {}
+            for i, cid in enumerate(assignments):
+                members.setdefault(cid, []).append(i)
+            drift = {cid: self._drift(cid, indices, vectors, day) for cid, indices in members.items()}
+
+            self._prune(day)
+            self._save()
+        return assignments, drift, events
+
+    def set_labels(self, labels: Dict[int, str]):
+        """Remember the current theme label of clusters (shown by `show`)"""
+        with self._locked():
+            self._load()
+            for cid, label in labels.items():
+                meta = self.state["clusters"].get(str(cid))
+                if meta is not None:
+                    meta["label"] = label
+            self._save()
+
+    def _prune(self, day: str):
+        for cid, meta in list(self.state["clusters"].items()):
+            if _days_between(meta["last_seen"], day) > RETIRE_DAYS:
+                del self.state["clusters"][cid]
+                self.centroids.pop(int(cid), None)
+                self.start_centroids.pop(int(cid), None)
+                continue
+            oldest = (date.fromisoformat(day) - timedelta(days=DAILY_HISTORY_DAYS)).isoformat()
+            meta["daily"] = {d: n for d, n in meta["daily"].items() if d >= oldest}
+        self.state["memberships"] = {
+            key: m for key, m in self.state["memberships"].items()
+            if str(m[0]) in self.state["clusters"] and _days_between(m[1], day) <= MEMBERSHIP_DAYS
+        }
+
+
+def rebuild(start: Optional[str] = None, end: Optional[str] = None, state_dir: Path = STATE_DIR) -> int:
+    """Replay aggregated days in order into a fresh state; returns the number of days replayed"""
+    from embedding_cache import EmbeddingCache
+    from pulse_entry import load_entries
+
+    for name in ("state.json", "centroids.npz"):
+        (Path(state_dir) / name).unlink(missing_ok=True)
+    cache = EmbeddingCache()
+    engine = OnlineClusters(state_dir, space=cache.space)
+    days = 0
+    for path in sorted(Path("data/aggregated").glob("????-??-??.json")):
+        day = path.stem
+        if (start and day < start) or (end and day > end):
+            continue
+        entries = list(load_entries(path))
+        if not entries:
+            continue
+        vectors = cache.embed([f"{e.get('title', '')} {e.get('summary', '')}" for e in entries])
+        _, drift, events = engine.update(day, [item_key(e) for e in entries], vectors)
+        days += 1
+        print(f"  {day}: {len(entries)} items, {len(drift)} clusters active, "
+              f"{len(events['created'])} new, {len(events['merged'])} merged, {len(events['split'])} split")
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse incremental pattern clustering")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild_cmd = sub.add_parser("rebuild", help="Replay aggregated history into a fresh cluster state")
+    rebuild_cmd.add_argument("--from", dest="start", help="First day (YYYY-MM-DD)")
+    rebuild_cmd.add_argument("--to", dest="end", help="Last day (YYYY-MM-DD)")
+    sub.add_parser("show", help="List the current clusters")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        print("🔁 Rebuilding pattern clusters from aggregated history...")
+        days = rebuild(args.start, args.end)
+        print(f"✅ Replayed {days} days")
+        return 0
+
+    engine = OnlineClusters()
+    engine._load()
+    clusters = engine.state["clusters"]
+    print(f"🧭 {len(clusters)} clusters (last day: {engine.state['last_day']}, "
+          f"space: {engine.state.get('space')})")
+    for cid, meta in sorted(clusters.items(), key=lambda kv: -kv[1]["total"]):
+        label = meta.get("label") or f"cluster_{cid}"
+        print(f"  #{cid:<5} {label:<32} {meta['total']:5d} items  since {meta['created']}  last {meta['last_seen']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Typed Entry Record
+
+PulseEntry is the in-memory form of one pulse item from aggregation
+onwards (aggregate -> mine_insights -> generate_report -> review DB).
+
+- __slots__ instead of a per-item dict: fixed fields, no hash table
+- numeric metrics ("stars: 6", "comments: 12", ...) are parsed out of the
+  highlights once, when the record is built, and saved alongside them
+  under "metrics" so later stages never re-parse the strings
+- source-specific keys (Nostr `content`/`tags`, bounty `reward`, ...) are
+  kept in a small `extra` dict and round-trip unchanged
+
+Records still answer the dict calls the pipeline already uses
+(entry.get('title'), entry['turbo_score'] = ..., 'url' in entry), so
+stages can adopt them without rewriting every access.
+
+Usage:
+    from pulse_entry import PulseEntry, load_entries
+    entries = list(load_entries("data/aggregated/2026-08-22.json"))
+    entries[0].stars, entries[0].metrics
+    json.dumps(entries[0].to_dict())
+"""
+import re
+from typing import Dict, Iterator, List, Optional
+
+from json_stream import iter_records
+
+# Numeric metrics carried in highlight strings, in output order
+METRIC_FIELDS = ("stars", "forks", "downloads", "citations", "comments", "points", "views", "answers", "score")
+
+# Not preceded by a letter: "github_stars: 120" and "⭐stars: 5" count, "superstars: 3" doesn't
+# (a \b would miss the first, as "_" is a word character)
+_METRIC_RE = re.compile(r"(?<![A-Za-z])(" + "|".join(METRIC_FIELDS) + r"):\s*(-?\d+)", re.IGNORECASE)
+
+# Serialized fields, in the order they are written
+FIELDS = (
+    "title", "date", "summary", "url", "source", "highlights", "turbo_score",
+    # Added by aggregation (merged duplicates) and the seen-items index
+    "sources", "duplicate_urls", "is_new", "days_since_seen", "first_seen", "times_seen",
+)
+_FIELD_SET = frozenset(FIELDS)
+_METRIC_SET = frozenset(METRIC_FIELDS)
+
+
+def parse_metrics(highlights) -> Dict[str, int]:
+    """Numeric metrics from highlight strings such as "stars: 1234" (last one wins)"""
+    metrics = {}
+    for highlight in highlights or ():
+        if isinstance(highlight, str) and ':' in highlight:
+            for name, value in _METRIC_RE.findall(highlight):
+                metrics[name.lower()] = int(value)
+    return metrics
+
+
+class PulseEntry:
+    """One pulse item with typed fields and parsed metrics"""
+
+    __slots__ = FIELDS + METRIC_FIELDS + ("extra",)
+
+    def __init__(self, title: str = "", url: Optional[str] = None, summary: str = "",
+                 source: Optional[str] = None, date: Optional[str] = None,
+                 highlights: Optional[List[str]] = None, turbo_score: Optional[float] = None,
+                 metrics: Optional[Dict[str, int]] = None, extra: Optional[Dict] = None):
+        self.title = title or ""
+        self.url = url
+        self.summary = summary or ""
+        self.source = source
+        self.date = date
+        self.highlights = highlights if highlights is not None else []
+        self.turbo_score = turbo_score
+        self.sources = self.duplicate_urls = None
+        self.is_new = self.days_since_seen = self.first_seen = self.times_seen = None
+        self._set_metrics(parse_metrics(self.highlights) if metrics is None else metrics)
+        self.extra = extra or None
+
+    def _set_metrics(self, metrics: Dict[str, int]):
+        for name in METRIC_FIELDS:
+            setattr(self, name, metrics.get(name))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PulseEntry":
+        """Build from a source/aggregated JSON object (metrics are reused if already parsed)"""
+        entry = cls.__new__(cls)
+        extra = None
+        for name in FIELDS:
+            setattr(entry, name, None)
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                setattr(entry, key, value)
+            elif key != "metrics":
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        entry.title = entry.title or ""
+        entry.summary = entry.summary or ""
+        if entry.highlights is None:
+            entry.highlights = []
+        metrics = data.get("metrics")
+        entry._set_metrics(metrics if isinstance(metrics, dict) else parse_metrics(entry.highlights))
+        entry.extra = extra
+        return entry
+
+    def to_dict(self) -> Dict:
+        """JSON-ready dict; unset optional fields are omitted"""
+        data = {}
+        for name in FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        metrics = self.metrics
+        if metrics:
+            data["metrics"] = metrics
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Parsed numeric metrics that are present"""
+        return {name: getattr(self, name) for name in METRIC_FIELDS if getattr(self, name) is not None}
+
+    # -- dict-style access used throughout the pipeline --------------------
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_SET or key in _METRIC_SET:
+            value = getattr(self, key)
+            return default if value is None else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None and key not in self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        if key in _FIELD_SET or key in _METRIC_SET:
+            setattr(self, key, value)
+            if key == "highlights":
+                self._set_metrics(parse_metrics(value))
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET or key in _METRIC_SET:
+            setattr(self, key, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        if key in _FIELD_SET or key in _METRIC_SET:
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self.get(key)
+
+    def update(self, values: Dict):
+        for key, value in values.items():
+            self[key] = value
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def __repr__(self) -> str:
+        return f"PulseEntry(source={self.source!r}, title={self.title[:40]!r})"
+
+
+def load_entries(path) -> Iterator[PulseEntry]:
+    """Stream PulseEntry records from a daily JSON file (list, {"entries"|"posts": [...]} or one object)"""
+    for record in iter_records(path):
+        if isinstance(record, dict):
+            yield PulseEntry.from_dict(record)
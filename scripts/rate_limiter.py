@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Shared Rate Limiter
+
+Per-API token buckets stored in SQLite, so every ingester process, thread
+and event loop sharing one data/cache directory draws from the same budget
+instead of sleeping a fixed, worst-case interval between calls.
+
+Coordination is per machine (per process group sharing the database), not
+global: in CI each matrix job of ingest.yml restores its own copy of
+data/cache, so parallel jobs each get a private bucket. Across jobs only the
+server feedback below (which reflects the real remaining quota) limits them;
+run the sources in one job (run_sources.py) to share one bucket.
+
+Buckets are also fed by the servers themselves:
+- Retry-After (429/503) blocks the bucket for the requested time
+- X-RateLimit-Remaining / X-RateLimit-Reset (GitHub style) caps the tokens
+  to what the server says is left and blocks until the reset when it hits 0
+
+Usage:
+    import rate_limiter
+    rate_limiter.acquire(url)              # blocks until a token is free
+    response = session.get(url)
+    rate_limiter.observe(url, response.status_code, response.headers)
+"""
+import asyncio
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+LIMITER_PATH = Path(os.getenv("PULSE_RATE_LIMIT_DB", "data/cache/rate_limits.db"))
+
+# bucket -> (tokens refilled per second, burst size)
+# Buckets are a host, or host + path prefix where an API has a separate quota.
+RATE_LIMITS = {
+    "api.github.com/search": (0.5, 5),     # search: 10-30 req/min depending on auth
+    "api.github.com": (2.0, 10),
+    "www.reddit.com": (0.5, 2),
+    "hn.algolia.com": (2.0, 5),
+    "api.stackexchange.com": (5.0, 10),
+    "huggingface.co": (2.0, 5),
+    "ollama.com": (5.0, 10),
+}
+DEFAULT_RATE_LIMIT = (5.0, 10)
+
+# Block applied on a 429 that carries no Retry-After
+DEFAULT_BACKOFF_SECONDS = 5.0
+
+# Longer waits (e.g. an exhausted hourly quota) are not slept through: the
+# request goes out and the caller's usual error handling deals with the 403/429
+MAX_WAIT_SECONDS = 60.0
+
+
+@contextmanager
+def _get_connection():
+    """Context manager for bucket store connections (autocommit, explicit transactions)"""
+    LIMITER_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(LIMITER_PATH, timeout=30.0, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS rate_buckets (
+            bucket TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            blocked_until REAL NOT NULL DEFAULT 0
+        )
+    ''')
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def bucket_for(url: str) -> str:
+    """Most specific configured bucket for a URL (falls back to its host)"""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    for bucket in RATE_LIMITS:
+        prefix_host, _, prefix_path = bucket.partition("/")
+        if prefix_host == host and prefix_path and parsed.path.lstrip("/").startswith(prefix_path):
+            return bucket
+    return host
+
+
+def _load(conn, bucket: str, now: float) -> Tuple[float, float]:
+    """Current (tokens, blocked_until) for a bucket, refilled up to `now`"""
+    rate, burst = RATE_LIMITS.get(bucket, DEFAULT_RATE_LIMIT)
+    row = conn.execute(
+        'SELECT tokens, updated_at, blocked_until FROM rate_buckets WHERE bucket = ?', (bucket,)
+    ).fetchone()
+    if row is None:
+        return float(burst), 0.0
+    tokens, updated_at, blocked_until = row
+    return min(float(burst), tokens + max(0.0, now - updated_at) * rate), blocked_until
+
+
+def _save(conn, bucket: str, tokens: float, now: float, blocked_until: float):
+    conn.execute(
+        'INSERT OR REPLACE INTO rate_buckets (bucket, tokens, updated_at, blocked_until) '
+        'VALUES (?, ?, ?, ?)',
+        (bucket, tokens, now, blocked_until)
+    )
+
+
+def try_acquire(url: str) -> float:
+    """
+    Take one token for the URL's bucket if available
+
+    Returns:
+        0.0 when the token was taken, otherwise seconds to wait before retrying
+    """
+    bucket = bucket_for(url)
+    rate, _ = RATE_LIMITS.get(bucket, DEFAULT_RATE_LIMIT)
+
+    with _get_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            tokens, blocked_until = _load(conn, bucket, now)
+            if blocked_until > now:
+                wait = blocked_until - now
+            elif tokens >= 1.0:
+                _save(conn, bucket, tokens - 1.0, now, blocked_until)
+                wait = 0.0
+            else:
+                wait = (1.0 - tokens) / rate
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+    return wait
+
+
+def acquire(url: str):
+    """Block until a token is available for the URL's bucket"""
+    while True:
+        wait = try_acquire(url)
+        if wait <= 0:
+            return
+        if wait > MAX_WAIT_SECONDS:
+            print(f"⚠️  Rate limit for {bucket_for(url)} resets in {wait:.0f}s - not waiting")
+            return
+        time.sleep(wait)
+
+
+async def acquire_async(url: str):
+    """Async version of acquire() that yields to the event loop while waiting"""
+    while True:
+        # try_acquire may wait on SQLite's write lock; keep that off the loop
+        wait = await asyncio.to_thread(try_acquire, url)
+        if wait <= 0:
+            return
+        if wait > MAX_WAIT_SECONDS:
+            print(f"⚠️  Rate limit for {bucket_for(url)} resets in {wait:.0f}s - not waiting")
+            return
+        await asyncio.sleep(wait)
+
+
+def _retry_after_seconds(value: str, now: float) -> Optional[float]:
+    """Retry-After as seconds; it may be delta-seconds or an HTTP date"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+
+def observe(url: str, status: int, headers: Mapping[str, str]):
+    """Feed a response's status and rate-limit headers back into the bucket"""
+    retry_after = headers.get("Retry-After")
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if status != 429 and retry_after is None and remaining is None:
+        return
+
+    bucket = bucket_for(url)
+    with _get_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            tokens, blocked_until = _load(conn, bucket, now)
+
+            if retry_after is not None:
+                delay = _retry_after_seconds(retry_after, now)
+                if delay is not None:
+                    blocked_until = max(blocked_until, now + delay)
+            elif status == 429:
+                blocked_until = max(blocked_until, now + DEFAULT_BACKOFF_SECONDS)
+
+            if remaining is not None:
+                try:
+                    tokens = min(tokens, float(remaining))
+                    if float(remaining) <= 0 and reset:
+                        blocked_until = max(blocked_until, float(reset))
+                except ValueError:
+                    pass
+
+            _save(conn, bucket, tokens, now, blocked_until)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+
+async def observe_async(url: str, status: int, headers: Mapping[str, str]):
+    """observe() without blocking the event loop on the bucket's write lock"""
+    await asyncio.to_thread(observe, url, status, dict(headers))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Keyword Relevance Scoring
+
+One compiled scoring engine behind every "turbo score" in the pipeline
+(aggregation, Nostr ingestion, bounty ranking).
+
+A scorer is a weighted rule table: each rule adds its weight once if any of
+its keywords occurs in the (lowercased) text. The table is compiled once
+into a deduplicated keyword list and a keyword x rule membership matrix.
+score_many() lowercases each text once and works column-wise: every distinct
+keyword is tested against the whole batch in one tight loop, the hit columns
+are OR-ed into rule columns through the membership matrix, and the weights
+are summed with NumPy.
+
+Weights are added in rule order, which keeps scores bit-identical to the
+hand-written `score += ...` chains they replace.
+
+Usage:
+    from relevance import TURBO_RELEVANCE
+    score = TURBO_RELEVANCE.score(text)
+    scores = TURBO_RELEVANCE.score_many(texts)    # numpy array
+"""
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+Rule = Tuple[float, Sequence[str]]
+
+
+class KeywordScorer:
+    """Weighted keyword rules compiled for single-text and batch scoring"""
+
+    def __init__(self, rules: Sequence[Rule], cap: Optional[float] = 1.0):
+        self.weights = np.array([weight for weight, _ in rules], dtype=np.float64)
+        self.rules = [tuple(kw.lower() for kw in kws) for _, kws in rules]
+        self.cap = cap
+        self._weight_list = self.weights.tolist()
+        self._rule_sets = [frozenset(kws) for kws in self.rules]
+
+        self.keywords = sorted({kw for kws in self.rules for kw in kws})
+        # membership[k, r]: keyword k satisfies rule r
+        self.membership = np.zeros((len(self.keywords), len(self.rules)), dtype=np.uint8)
+        for r, kws in enumerate(self.rules):
+            for kw in kws:
+                self.membership[self.keywords.index(kw), r] = 1
+
+    def score(self, text: str) -> float:
+        """Score one text (lowercased here)"""
+        text = text.lower()
+        present = {kw for kw in self.keywords if kw in text}
+        score = 0.0
+        if present:
+            for weight, kws in zip(self._weight_list, self._rule_sets):
+                if not present.isdisjoint(kws):
+                    score += weight
+        return min(score, self.cap) if self.cap is not None else score
+
+    def score_many(self, texts: Iterable[str]) -> np.ndarray:
+        """Score many texts; returns a float64 array in input order"""
+        lowered = [text.lower() for text in texts]
+        n = len(lowered)
+
+        # hits[i, k]: text i contains keyword k
+        hits = np.empty((n, len(self.keywords)), dtype=np.uint8)
+        for k, kw in enumerate(self.keywords):
+            hits[:, k] = np.fromiter((kw in text for text in lowered), dtype=bool, count=n)
+        rule_hits = (hits @ self.membership) > 0
+
+        # Column by column, in rule order, to match score() exactly
+        scores = np.zeros(n, dtype=np.float64)
+        for r, weight in enumerate(self.weights):
+            scores += np.where(rule_hits[:, r], weight, 0.0)
+        return np.minimum(scores, self.cap) if self.cap is not None else scores
+
+
+# aggregate.score_turbo_relevance
+TURBO_RELEVANCE = KeywordScorer([
+    # Core Turbo/Cloud keywords (high weight)
+    (0.3, ["turbo"]),
+    (0.3, ["cloud"]),
+    (0.2, ["-cloud"]),  # Model suffix
+    # Related features
+    (0.15, ["voice", "stt", "tts", "speech"]),
+    (0.15, ["multimodal", "vision", "image"]),
+    (0.1, ["api", "integration", "service"]),
+    # Model mentions
+    (0.1, ["gpt-oss", "qwen3", "glm", "mixtral"]),
+])
+
+# ingest_nostr.calculate_turbo_score (uncapped: tag bonuses are added before the cap)
+NOSTR_TURBO = KeywordScorer(
+    [(0.3, [kw]) for kw in ["ollama turbo", "ollama cloud", "cloud api", "turbo api"]] +
+    [(0.15, [kw]) for kw in ["turbo", "cloud", "api", "performance", "optimization"]],
+    cap=None,
+)
+
+# bounty_section.score_bounty_turbo_relevance
+BOUNTY_TURBO = KeywordScorer([
+    (0.4, ["ollama"]),
+    (0.3, ["turbo", "cloud"]),
+    (0.2, ["llm", "ai"]),
+])
@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+from pulse_entry import PulseEntry, parse_metrics
+
 # Try Supabase first, fallback to SQLite
 try:
     if os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_KEY'):
@@ -69,35 +71,8 @@ class ReviewIntegration:
         return url
     
     def extract_metrics_from_highlights(self, highlights: List[str]) -> Dict:
-        """Extract numeric metrics from highlight strings"""
-        metrics = {}
-        
-        for highlight in highlights:
-            # Stars: "stars: 1234"
-            if 'stars:' in highlight.lower():
-                match = re.search(r'stars:\s*(\d+)', highlight, re.IGNORECASE)
-                if match:
-                    metrics['stars'] = int(match.group(1))
-            
-            # Forks: "forks: 123"
-            if 'forks:' in highlight.lower():
-                match = re.search(r'forks:\s*(\d+)', highlight, re.IGNORECASE)
-                if match:
-                    metrics['forks'] = int(match.group(1))
-            
-            # Downloads: "downloads: 5000"
-            if 'downloads:' in highlight.lower():
-                match = re.search(r'downloads:\s*(\d+)', highlight, re.IGNORECASE)
-                if match:
-                    metrics['downloads'] = int(match.group(1))
-            
-            # Citations: "citations: 42"
-            if 'citations:' in highlight.lower():
-                match = re.search(r'citations:\s*(\d+)', highlight, re.IGNORECASE)
-                if match:
-                    metrics['citations'] = int(match.group(1))
-        
-        return metrics
+        """Extract numeric metrics ("stars: 1234", "forks: 12", ...) from highlight strings"""
+        return parse_metrics(highlights)
     
     def determine_project_type(self, item: Dict) -> str:
         """Determine project type from item data"""
@@ -137,9 +112,9 @@ class ReviewIntegration:
         project_name = item.get('title', 'Unknown Project')
         project_type = self.determine_project_type(item)
         
-        # Extract metrics
+        # Extract metrics (already parsed on PulseEntry records)
         highlights = item.get('highlights', [])
-        metrics = self.extract_metrics_from_highlights(highlights)
+        metrics = item.metrics if isinstance(item, PulseEntry) else self.extract_metrics_from_highlights(highlights)
         
         # Extract tags
         tags = []
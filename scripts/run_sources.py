@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - In-Process Source Runner
+Drives every registered Source in a single interpreter and event loop
+
+Replaces one Python process per ingest_* script: heavy imports (requests,
+aiohttp, bs4, feedparser, the Ollama client) happen once, and all sources
+share the same process-wide HTTP pools and caches.
+
+Each source runs within its own budget, further capped by --deadline for the
+whole run. Exit code: 0 all complete, 3 some sources partial, 1 any failed.
+
+Usage:
+    python scripts/run_sources.py                      # all sources
+    python scripts/run_sources.py --only nostr,tools   # a subset
+    python scripts/run_sources.py --deadline 110       # finish within 110s
+    python scripts/run_sources.py --salvage            # save checkpoints of a killed run
+"""
+import argparse
+import asyncio
+import importlib
+import sys
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import http_transport
+from sources import SOURCE_REGISTRY, Source, SourceResult, salvage_checkpoints, set_deadline
+
+# Modules that register the production sources (see .github/workflows/ingest.yml)
+INGEST_MODULES = [
+    "ingest_official",
+    "ingest_cloud",
+    "ingest_community",
+    "ingest_issues",
+    "ingest_tools",
+    "ingest_bounties",
+    "ingest_nostr",
+    "ingest_stackoverflow",
+    "ingest_model_registry",
+    "ingest_releases",
+    "ingest_devblogs",
+    "ingest_social_media",
+    "ingest_manual",
+]
+
+DEFAULT_CONCURRENCY = 8
+
+# Exit code for "finished, but some sources only partially" (see run_full_workflow.py)
+EXIT_PARTIAL = 3
+
+
+def load_sources(only: Optional[List[str]] = None) -> List[Source]:
+    """Import ingest modules (which registers their sources) and instantiate them"""
+    for module_name in INGEST_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"⚠️  Could not load {module_name}: {e}")
+
+    names = only or list(SOURCE_REGISTRY)
+    unknown = [n for n in names if n not in SOURCE_REGISTRY]
+    if unknown:
+        print(f"⚠️  Unknown sources skipped: {', '.join(unknown)}")
+
+    return [SOURCE_REGISTRY[n]() for n in names if n in SOURCE_REGISTRY]
+
+
+async def run_all(sources: List[Source], concurrency: int = DEFAULT_CONCURRENCY,
+                  deadline: Optional[float] = None) -> List[SourceResult]:
+    """Run all sources concurrently, at most `concurrency` at a time, all done within `deadline` seconds"""
+    set_deadline(deadline)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(source: Source) -> SourceResult:
+        async with semaphore:
+            print(f"📡 [{source.name}] {source.description}")
+            return await source.run()
+
+    # Keep the loop's pooled aiohttp session open across all sources
+    async with http_transport.client_session():
+        return await asyncio.gather(*(run_one(s) for s in sources))
+
+
+def record_metrics(results: List[SourceResult]):
+    """Record per-source timing through the shared metrics collector"""
+    try:
+        from monitoring import MetricsCollector, WorkflowOperation
+    except ImportError:
+        return
+
+    collector = MetricsCollector()
+    collector.start_workflow("hourly_ingestion")
+    for result in results:
+        collector.record_operation(WorkflowOperation(
+            operation_type="ingestion",
+            source=result.source,
+            status={"complete": "success", "partial": "warning"}.get(result.status, "failure"),
+            timestamp=datetime.now().isoformat(),
+            duration_seconds=round(result.duration_seconds, 3),
+            details={"entries": result.entries},
+            error_message=result.error_message,
+            error_category="deadline" if result.status == "partial" else None,
+        ))
+    all_ok = all(r.status == "complete" for r in results)
+    collector.end_workflow("hourly_ingestion", "success" if all_ok else "partial")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Ollama Pulse sources in one event loop")
+    parser.add_argument("--only", help="Comma-separated source names (default: all)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Sources running at once (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--deadline", type=float,
+                        help="Seconds the whole run may take; sources are cut short to meet it")
+    parser.add_argument("--salvage", action="store_true",
+                        help="Save sub-results checkpointed by a run that was killed, then exit")
+    args = parser.parse_args()
+
+    only = [n.strip() for n in args.only.split(",")] if args.only else None
+    if args.salvage:
+        saved = salvage_checkpoints(only)
+        print(f"🩹 Salvaged {len(saved)} source(s)" if saved else "ℹ️  Nothing checkpointed to salvage")
+        return EXIT_PARTIAL if saved else 1
+
+    sources = load_sources(only)
+    if not sources:
+        print("❌ No sources to run")
+        return 1
+
+    print(f"🚀 Running {len(sources)} sources in-process (concurrency={args.concurrency})...")
+    start = time.perf_counter()
+    results = asyncio.run(run_all(sources, args.concurrency, args.deadline))
+    wall_time = time.perf_counter() - start
+
+    print("\n📊 Source summary:")
+    for result in sorted(results, key=lambda r: r.duration_seconds, reverse=True):
+        status = {"complete": "✅", "partial": "🟡"}.get(result.status, "❌")
+        note = f"  ({result.error_message})" if result.error_message else ""
+        print(f"  {status} {result.source:<16} {result.entries:4d} entries  {result.duration_seconds:6.1f}s{note}")
+    print(f"⏱️  Wall time: {wall_time:.1f}s")
+
+    record_metrics(results)
+
+    if not all(r.success for r in results):
+        return 1
+    return 0 if all(r.status == "complete" for r in results) else EXIT_PARTIAL
+
+
+if __name__ == "__main__":
+    sys.exit(main())
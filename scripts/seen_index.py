@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Seen Items Index
+
+Persistent cross-day memory of every item the pulse has reported, keyed by
+a compact canonical id (8-byte digest of the canonical URL, or of the title
+for URL-less items). Each row records first_seen, last_seen, the previous
+day it was seen and on how many days it appeared.
+
+aggregate.py calls annotate() once per run: one primary-key upsert per entry
+in a single transaction, after which every entry carries
+    is_new           - first reported today
+    days_since_seen  - days since it was last reported before today (None if new)
+    first_seen       - first day it was reported
+    times_seen       - number of days it has been reported
+so the report and RAG stages read novelty from the aggregated file instead
+of scanning history.
+
+The index can always be regenerated from data/aggregated, so it lives in
+data/cache/ (restored via actions/cache in CI, not committed); when it is
+missing, aggregate.py seeds it from the archive before annotating. Rebuild by
+hand with:
+    python scripts/seen_index.py --rebuild
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from dedupe import canonical_url
+from json_stream import JSONArrayWriter
+from pulse_entry import load_entries
+
+SEEN_DB_PATH = Path(os.getenv("PULSE_SEEN_DB", "data/cache/seen_items.db"))
+
+
+@contextmanager
+def _get_connection(db_path: Path = SEEN_DB_PATH):
+    """Context manager for seen-index connections"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30.0)
+    # Primary key lookups are covering: the table is stored in the key's B-tree
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS seen_items (
+            item_id BLOB PRIMARY KEY,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            previous_seen TEXT,
+            hit_count INTEGER NOT NULL DEFAULT 1
+        ) WITHOUT ROWID
+    ''')
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def item_id(entry: Dict) -> bytes:
+    """Compact canonical id of an aggregated entry"""
+    key = canonical_url(entry['url']) if entry.get('url') else f"title:{entry.get('title', '')}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+
+
+def _record(conn, entry: Dict, day: str) -> Dict:
+    """Upsert one entry for `day` and return its novelty fields"""
+    key = item_id(entry)
+    row = conn.execute(
+        'SELECT first_seen, last_seen, previous_seen, hit_count FROM seen_items WHERE item_id = ?', (key,)
+    ).fetchone()
+
+    if row is None:
+        conn.execute(
+            'INSERT INTO seen_items (item_id, first_seen, last_seen, previous_seen, hit_count) '
+            'VALUES (?, ?, ?, NULL, 1)',
+            (key, day, day)
+        )
+        first_seen, previous_seen, hit_count = day, None, 1
+    else:
+        first_seen, last_seen, previous_seen, hit_count = row
+        if last_seen < day:
+            # First sighting today - yesterday's (or older) last_seen becomes the previous one
+            previous_seen, hit_count = last_seen, hit_count + 1
+            conn.execute(
+                'UPDATE seen_items SET last_seen = ?, previous_seen = ?, hit_count = ? WHERE item_id = ?',
+                (day, previous_seen, hit_count, key)
+            )
+
+    days_since = None
+    if previous_seen:
+        days_since = (date.fromisoformat(day) - date.fromisoformat(previous_seen)).days
+    return {
+        "is_new": first_seen == day,
+        "days_since_seen": days_since,
+        "first_seen": first_seen,
+        "times_seen": hit_count,
+    }
+
+
+def annotate(entries: List[Dict], day: Optional[str] = None, db_path: Path = SEEN_DB_PATH) -> int:
+    """
+    Record entries as reported on `day` (default today) and add novelty fields
+
+    Returns the number of entries that are new.
+    """
+    day = day or datetime.now().strftime("%Y-%m-%d")
+    new_count = 0
+    with _get_connection(db_path) as conn:
+        for entry in entries:
+            entry.update(_record(conn, entry, day))
+            new_count += entry['is_new']
+    return new_count
+
+
+def returning_items(entries: List[Dict], days_back: int = 7) -> List[Dict]:
+    """
+    Entries first reported more than `days_back` days ago that are back today
+
+    Same shape as AdaptiveProphecyEngine.get_returning_projects() results, for
+    the report's "Returning to the Veins" section.
+    """
+    cutoff = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+    returning = []
+    for entry in entries:
+        if entry.get('is_new', True) or entry.get('first_seen', cutoff) >= cutoff:
+            continue
+        last_seen = (datetime.now() - timedelta(days=entry['days_since_seen'])).strftime("%Y-%m-%d") \
+            if entry.get('days_since_seen') is not None else entry['first_seen']
+        returning.append({
+            "project_identifier": entry.get('url', ''),
+            "project_name": entry.get('title', 'Unknown'),
+            "project_type": entry.get('source', 'unknown'),
+            "first_seen": entry['first_seen'],
+            "last_seen": last_seen,
+            "total_mentions": entry.get('times_seen', 1),
+            "avg_turbo_score": entry.get('turbo_score', 0),
+            "last_highlights": ', '.join(entry.get('highlights', [])[:3]) or 'No highlights available',
+        })
+    return returning
+
+
+def rebuild(aggregated_dir: Path = Path("data/aggregated"), db_path: Path = SEEN_DB_PATH,
+            rewrite_days: Optional[Set[str]] = None) -> int:
+    """
+    Replay every archived aggregated file, oldest first; returns days replayed
+
+    Files for `rewrite_days` are saved back with their novelty fields
+    (used after a backfill has regenerated those days).
+    """
+    if db_path.exists():
+        db_path.unlink()
+    days = 0
+    for path in sorted(aggregated_dir.glob("????-??-??.json")):
+        try:
+            entries = list(load_entries(path))
+        except ValueError as e:
+            print(f"⚠️  Skipping unreadable {path}: {e}")
+            continue
+        annotate(entries, day=path.stem, db_path=db_path)
+        if rewrite_days and path.stem in rewrite_days:
+            with JSONArrayWriter(path) as writer:
+                for entry in entries:
+                    writer.write(entry.to_dict())
+        days += 1
+    return days
+
+
+def seed_if_missing(aggregated_dir: Path = Path("data/aggregated"), db_path: Path = SEEN_DB_PATH) -> int:
+    """Rebuild the index from the archive when there is none (cold cache); returns days replayed"""
+    if db_path.exists():
+        return 0
+    days = rebuild(aggregated_dir, db_path)
+    if days:
+        print(f"🔄 Seeded seen-items index from {days} archived days")
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse seen-items index")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Recreate the index from data/aggregated/*.json")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        print("🔄 Rebuilding seen-items index from aggregated archive...")
+        days = rebuild()
+        with _get_connection() as conn:
+            items = conn.execute('SELECT COUNT(*) FROM seen_items').fetchone()[0]
+        print(f"✅ Indexed {items} items across {days} days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Source Plugin API
+Common interface shared by every ingest_* script
+
+Each ingester declares a Source subclass with an async fetch() coroutine and
+registers it with @register_source. The same class backs two entry points:
+- the script's own main() (standalone run, one source)
+- run_sources.py (all registered sources in a single event loop)
+
+Blocking fetchers (requests, feedparser, bs4) are wrapped with run_blocking()
+so they overlap with other sources instead of stalling the loop. They run on
+daemon threads, which nothing waits for at shutdown, so one stuck in a
+request after its deadline cannot keep the run alive.
+
+Every run has a time budget (budget_seconds, PULSE_SOURCE_BUDGET). Sources
+that fan out into sub-fetches use gather_parts(): each finished part is
+checkpointed to data/cache/checkpoints/<source>/<day>.jsonl as it arrives and
+parts still running at the deadline are cancelled, so a slow upstream costs
+that part only and the run ends "partial" instead of "failed".
+
+Incremental cursors proposed while fetching (cursors.stage_cursor) are only
+committed after the entries they cover have been saved and journaled; those
+of cancelled or failed parts are dropped.
+"""
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Type
+
+import cursors
+import journal
+
+DATA_DIR = Path("data")
+CHECKPOINT_DIR = DATA_DIR / "cache" / "checkpoints"
+
+DEFAULT_BUDGET_SECONDS = float(os.getenv("PULSE_SOURCE_BUDGET", "90"))
+# Extra time fetch() gets past the deadline to assemble what gather_parts() returned
+DEADLINE_GRACE_SECONDS = 5.0
+
+# Absolute deadline (time.monotonic()) of the source or runner in progress
+_deadline: ContextVar[Optional[float]] = ContextVar("source_deadline", default=None)
+
+# name -> Source subclass, filled in as ingest modules are imported
+SOURCE_REGISTRY: Dict[str, Type["Source"]] = {}
+
+
+def register_source(cls):
+    """Class decorator: make a Source discoverable by run_sources.py"""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} must define a source name")
+    SOURCE_REGISTRY[cls.name] = cls
+    return cls
+
+
+def ensure_data_dir(source_dir: str) -> Path:
+    """Create data/<source_dir> if it doesn't exist"""
+    path = DATA_DIR / source_dir
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def get_today_filename(source_dir: str) -> str:
+    """Get filename for today's data of a source"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return str(DATA_DIR / source_dir / f"{today}.json")
+
+
+def dedupe_key(entry: Dict) -> str:
+    """URL when present, title otherwise"""
+    return entry.get('url') or entry.get('title', '')
+
+
+def save_entries(source_dir: str, entries: List[Dict], merge: bool = False,
+                 save_empty: bool = False) -> int:
+    """
+    Save entries to today's file for a source
+
+    Args:
+        source_dir: Directory under data/ (usually the source name)
+        entries: Entries to write
+        merge: Merge with entries already saved today (deduplicated by URL)
+        save_empty: Write an empty file rather than skipping when nothing was found
+
+    Returns:
+        Number of entries in the file after saving
+    """
+    if not entries and not save_empty:
+        print("⚠️  No data to save")
+        return 0
+
+    ensure_data_dir(source_dir)
+    filename = get_today_filename(source_dir)
+
+    existing = []
+    if merge and os.path.exists(filename):
+        with open(filename, 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+
+    unique_entries = list({dedupe_key(e): e for e in existing + entries}.values())
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(unique_entries, f, indent=2, ensure_ascii=False)
+
+    print(f"💾 Saved {len(unique_entries)} entries to {filename}")
+    return len(unique_entries)
+
+
+def _settle(future: asyncio.Future, result, error: Optional[BaseException]):
+    if future.done():  # Cancelled at the deadline: the late result is dropped
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def run_blocking(func: Callable, *args, **kwargs):
+    """
+    Run a blocking fetcher in a worker thread so other sources keep going
+
+    Unlike asyncio.to_thread(), the thread is a daemon outside the loop's
+    default executor: cancelling the await (deadline) abandons it, and
+    asyncio.run() does not wait for it before returning.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    context = contextvars.copy_context()
+
+    def worker():
+        result, error = None, None
+        try:
+            result = context.run(func, *args, **kwargs)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(_settle, future, result, error)
+        except RuntimeError:
+            pass  # The loop has already closed
+
+    threading.Thread(target=worker, name=f"source-{getattr(func, '__name__', 'fetch')}", daemon=True).start()
+    return await future
+
+
+def set_deadline(seconds: Optional[float]):
+    """Bound everything run in the current context to `seconds` from now (None clears it)"""
+    return _deadline.set(None if seconds is None else time.monotonic() + seconds)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left before the current deadline, None when unbounded"""
+    deadline = _deadline.get()
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def checkpoint_path(source_dir: str, day: Optional[str] = None) -> Path:
+    day = day or datetime.now().strftime("%Y-%m-%d")
+    return CHECKPOINT_DIR / source_dir / f"{day}.jsonl"
+
+
+def write_checkpoint(source_dir: str, part: str, entries: List[Dict]):
+    """Append one finished sub-fetch to today's checkpoint"""
+    path = checkpoint_path(source_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"part": part, "entries": entries}, ensure_ascii=False) + "\n")
+
+
+def read_checkpoint(source_dir: str, day: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """part -> entries checkpointed today (a torn last line is ignored)"""
+    path = checkpoint_path(source_dir, day)
+    if not path.exists():
+        return {}
+    parts = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            parts[record["part"]] = record["entries"]
+    return parts
+
+
+def clear_checkpoint(source_dir: str):
+    checkpoint_path(source_dir).unlink(missing_ok=True)
+
+
+def salvage_checkpoints(source_dirs: Optional[List[str]] = None) -> Dict[str, int]:
+    """
+    Save what killed runs had checkpointed today
+
+    Used after a run was stopped from outside (hard timeout) before it could
+    save. Entries are merged into today's file so earlier runs are kept.
+
+    Returns:
+        source -> number of entries in its file after saving
+    """
+    if source_dirs is None:
+        source_dirs = [p.name for p in CHECKPOINT_DIR.glob("*") if p.is_dir()]
+    saved = {}
+    for source_dir in source_dirs:
+        parts = read_checkpoint(source_dir)
+        entries = [entry for part in parts.values() for entry in part]
+        if entries:
+            print(f"🩹 Salvaging {len(entries)} checkpointed entries for {source_dir} "
+                  f"({', '.join(parts)})")
+            saved[source_dir] = save_entries(source_dir, entries, merge=True)
+            journal.append(source_dir, entries)
+        clear_checkpoint(source_dir)
+    return saved
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source run"""
+    source: str
+    entries: int
+    duration_seconds: float
+    success: bool
+    error_message: Optional[str] = None
+    status: str = "complete"  # complete | partial | failed
+
+
+class Source:
+    """
+    Base class for an ingestion source
+
+    Subclasses set `name` (also the data/<name>/ directory) and implement
+    fetch(). Override save() when the on-disk format is not a plain list.
+    """
+    name: str = ""
+    description: str = ""
+    merge: bool = False  # Merge with earlier runs of the same day
+    save_empty: bool = False  # Write [] so artifact uploads never miss the file
+    budget_seconds: Optional[float] = None  # None: DEFAULT_BUDGET_SECONDS
+
+    def __init__(self):
+        self._parts: Dict[str, List[Dict]] = {}
+        # part -> cursors it proposed, kept only for parts that finished
+        self._part_cursors: Dict[str, Dict] = {}
+        self.unfinished_parts: List[str] = []
+
+    async def fetch(self) -> List[Dict]:
+        """Collect entries from the upstream service"""
+        raise NotImplementedError
+
+    def save(self, entries: List[Dict], merge: Optional[bool] = None) -> int:
+        """Persist fetched entries, returns the number saved"""
+        merge = self.merge if merge is None else merge
+        return save_entries(self.name, entries, merge=merge, save_empty=self.save_empty)
+
+    def checkpoint(self, part: str, entries: List[Dict]):
+        """Record a finished sub-fetch so it survives a deadline or a kill"""
+        self._parts[part] = entries
+        write_checkpoint(self.name, part, entries)
+
+    async def gather_parts(self, parts: Dict[str, Awaitable]) -> Dict[str, List[Dict]]:
+        """
+        Run named sub-fetches concurrently until the deadline
+
+        Each part is checkpointed as soon as it finishes; parts still running
+        at the deadline are cancelled and listed in unfinished_parts. A part
+        that raises is logged and counted as unfinished.
+
+        Returns:
+            part -> entries for the parts that finished, in declaration order
+        """
+        async def run_part(coro, staged):
+            # Each task runs in its own context copy, so its cursors stay separate
+            cursors.stage_into(staged)
+            return await coro
+
+        staged = {name: {} for name in parts}
+        tasks = {asyncio.ensure_future(run_part(coro, staged[name])): name for name, coro in parts.items()}
+        pending = set(tasks)
+        results = {}
+        timeout = remaining_budget()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=timeout,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                name = tasks[task]
+                if task.exception() is not None:
+                    print(f"⚠️  [{self.name}] {name} failed: {task.exception()}")
+                    self.unfinished_parts.append(name)
+                    continue
+                results[name] = task.result() or []
+                self.checkpoint(name, results[name])
+                self._part_cursors[name] = staged[name]
+
+        for task in pending:
+            task.cancel()
+            self.unfinished_parts.append(tasks[task])
+        if pending:
+            print(f"⏱️  [{self.name}] deadline reached, cancelled: "
+                  f"{', '.join(tasks[t] for t in pending)}")
+        return {name: results[name] for name in parts if name in results}
+
+    async def run(self) -> SourceResult:
+        """Fetch and save within the budget, never raising so one source can't sink the others"""
+        start = time.perf_counter()
+        self._parts = {}
+        self._part_cursors = {}
+        self.unfinished_parts = []
+        budget = self.budget_seconds or DEFAULT_BUDGET_SECONDS
+        outer = remaining_budget()
+        if outer is not None:
+            budget = min(budget, outer)
+
+        clear_checkpoint(self.name)
+        token = set_deadline(budget)
+        staged = {}
+        cursor_token = cursors.stage_into(staged)
+        status, error = "complete", None
+        try:
+            try:
+                entries = await asyncio.wait_for(self.fetch(), timeout=budget + DEADLINE_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                # fetch() overran: fall back to the parts it had checkpointed
+                entries = [entry for part in self._parts.values() for entry in part]
+                staged = {}
+                error = f"deadline of {budget:.0f}s reached"
+                if not entries:
+                    print(f"❌ Source {self.name} failed: {error} with nothing checkpointed")
+                    return SourceResult(self.name, 0, time.perf_counter() - start, False, error, "failed")
+                status = "partial"
+            if self.unfinished_parts:
+                status = "partial"
+                error = f"unfinished: {', '.join(self.unfinished_parts)}"
+
+            # A partial run merges so it never shrinks what earlier runs saved today
+            saved = self.save(entries, merge=True) if status == "partial" else self.save(entries)
+            # Delta for incremental aggregation (new or changed records, and what a replaced file dropped)
+            replaced = status != "partial" and not self.merge and bool(entries or self.save_empty)
+            journal.append(self.name, entries, replace=replaced)
+            # Only now is everything the cursors skip past safely stored
+            for part_cursors in self._part_cursors.values():
+                staged.update(part_cursors)
+            cursors.set_cursors(staged)
+            clear_checkpoint(self.name)
+            return SourceResult(self.name, saved, time.perf_counter() - start, True, error, status)
+        except Exception as e:
+            print(f"❌ Source {self.name} failed: {e}")
+            return SourceResult(self.name, 0, time.perf_counter() - start, False, str(e), "failed")
+        finally:
+            cursors.reset_staging(cursor_token)
+            _deadline.reset(token)
+
+
+def run_standalone(source: Source) -> SourceResult:
+    """Run a single source from its own script's main()"""
+    return asyncio.run(source.run())
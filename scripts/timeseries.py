@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Ollama Pulse - Project Time-Series Index
+
+Per-project history of the daily GitHub snapshots (top-level
+data/YYYY-MM-DD.json: title, url, "stars: N" highlights), stored so a
+project's history is one slice of a memory-mapped array instead of a scan
+over every daily file.
+
+Store (data/cache/timeseries/, rebuilt from data/ when missing):
+    points.npy     packed rows (project, day, stars, forks), sorted by
+                   project then day; day = days since 1970-01-01,
+                   missing metrics = -1
+    offsets.npy    int64 CSR offsets: project p owns rows offsets[p]:offsets[p + 1]
+    projects.json  project keys (github owner/repo or canonical URL) and titles
+    manifest.json  indexed days -> digest of the daily file
+
+update() parses only daily files that are new or changed since the last
+run and merges their rows into the packed arrays.
+
+Usage:
+    python scripts/timeseries.py update
+    python scripts/timeseries.py history ollama/ollama --days 90
+
+    from timeseries import TimeSeriesIndex
+    TimeSeriesIndex().history("https://github.com/ollama/ollama")
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from dedupe import canonical_url
+from pulse_entry import load_entries
+
+SNAPSHOT_DIR = Path("data")
+INDEX_DIR = Path(os.getenv("PULSE_TIMESERIES_DIR", "data/cache/timeseries"))
+
+POINT_DTYPE = np.dtype([("project", "<u4"), ("day", "<i4"), ("stars", "<i4"), ("forks", "<i4")])
+_EPOCH = date(1970, 1, 1).toordinal()
+_GITHUB_RE = re.compile(r"^https://github\.com/([^/]+/[^/]+)")
+
+
+def project_key(url_or_name: str) -> str:
+    """github owner/repo (lowercased) for GitHub URLs, canonical URL otherwise"""
+    if "/" in url_or_name and "://" not in url_or_name and "." not in url_or_name.split("/")[0]:
+        return url_or_name.lower()  # already owner/repo
+    url = canonical_url(url_or_name)
+    match = _GITHUB_RE.match(url)
+    return match.group(1).lower() if match else url
+
+
+def _day_number(day: str) -> int:
+    return date.fromisoformat(day).toordinal() - _EPOCH
+
+
+def _day_string(number: int) -> str:
+    return date.fromordinal(int(number) + _EPOCH).isoformat()
+
+
+def _digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+class TimeSeriesIndex:
+    """Memory-mapped per-project (day, stars, forks) series"""
+
+    def __init__(self, index_dir: Path = INDEX_DIR, snapshot_dir: Path = SNAPSHOT_DIR):
+        self.index_dir = Path(index_dir)
+        self.snapshot_dir = Path(snapshot_dir)
+        self._points = None
+        self._offsets = None
+        self._lookup = None
+        self._titles = None
+
+    # -- storage -----------------------------------------------------------
+
+    def _load_json(self, name: str, default):
+        path = self.index_dir / name
+        if not path.exists():
+            return default
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_json(self, name: str, data):
+        tmp = self.index_dir / f"{name}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        tmp.replace(self.index_dir / name)
+
+    def _save_array(self, name: str, array: np.ndarray):
+        # np.save appends .npy to names without it, so write through a file object
+        tmp = self.index_dir / f"{name}.tmp"
+        with open(tmp, 'wb') as f:
+            np.save(f, array)
+        tmp.replace(self.index_dir / name)
+
+    def _load(self):
+        """Open the packed arrays (memory-mapped) and the project table"""
+        if self._points is not None:
+            return
+        points_path = self.index_dir / "points.npy"
+        if points_path.exists():
+            self._points = np.load(points_path, mmap_mode='r')
+            self._offsets = np.load(self.index_dir / "offsets.npy", mmap_mode='r')
+        else:
+            self._points = np.empty(0, dtype=POINT_DTYPE)
+            self._offsets = np.zeros(1, dtype=np.int64)
+        projects = self._load_json("projects.json", {"keys": [], "titles": []})
+        self._lookup = {key: i for i, key in enumerate(projects["keys"])}
+        self._titles = projects["titles"]
+
+    # -- indexing ----------------------------------------------------------
+
+    def _snapshot_days(self) -> Dict[str, Path]:
+        return {p.stem: p for p in sorted(self.snapshot_dir.glob("????-??-??.json"))}
+
+    def update(self) -> int:
+        """Index new or changed daily snapshots; returns the number of days parsed"""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+        manifest = self._load_json("manifest.json", {})
+        keys = [None] * len(self._lookup)
+        for key, i in self._lookup.items():
+            keys[i] = key
+        titles = list(self._titles)
+
+        changed = {}
+        for day, path in self._snapshot_days().items():
+            digest = _digest(path)
+            if manifest.get(day) != digest:
+                changed[day] = (path, digest)
+        if not changed:
+            return 0
+
+        rows = []
+        for day, (path, digest) in sorted(changed.items()):
+            day_number = _day_number(day)
+            seen = {}
+            for entry in load_entries(path):
+                if not entry.url:
+                    continue
+                key = project_key(entry.url)
+                p = self._lookup.get(key)
+                if p is None:
+                    p = self._lookup[key] = len(keys)
+                    keys.append(key)
+                    titles.append(entry.title)
+                # One point per project and day, the last mention wins
+                seen[p] = (p, day_number,
+                           -1 if entry.stars is None else entry.stars,
+                           -1 if entry.forks is None else entry.forks)
+            rows.extend(seen.values())
+            manifest[day] = digest
+
+        new_points = np.array(rows, dtype=POINT_DTYPE)
+        old_points = np.asarray(self._points)
+        if len(old_points):
+            # Re-indexed days replace their earlier rows
+            redone = np.array([_day_number(day) for day in changed], dtype=np.int32)
+            old_points = old_points[~np.isin(old_points["day"], redone)]
+        points = np.concatenate([old_points, new_points])
+        points = points[np.lexsort((points["day"], points["project"]))]
+        offsets = np.searchsorted(points["project"], np.arange(len(keys) + 1)).astype(np.int64)
+
+        # Drop the memory maps before replacing the files underneath them
+        self._points = self._offsets = None
+        self._save_array("points.npy", points)
+        self._save_array("offsets.npy", offsets)
+        self._save_json("projects.json", {"keys": keys, "titles": titles})
+        self._save_json("manifest.json", dict(sorted(manifest.items())))
+        self._lookup = self._titles = None
+        return len(changed)
+
+    # -- queries -----------------------------------------------------------
+
+    def project_count(self) -> int:
+        self._load()
+        return len(self._lookup)
+
+    def history_array(self, project: str) -> np.ndarray:
+        """Packed rows for a project (a view into the memory map; empty if unknown)"""
+        self._load()
+        p = self._lookup.get(project_key(project))
+        if p is None:
+            return np.empty(0, dtype=POINT_DTYPE)
+        return self._points[self._offsets[p]:self._offsets[p + 1]]
+
+    def history(self, project: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict]:
+        """[{date, stars, forks}] for a project between start and end (inclusive), oldest first"""
+        rows = self.history_array(project)
+        if start:
+            rows = rows[rows["day"] >= _day_number(start)]
+        if end:
+            rows = rows[rows["day"] <= _day_number(end)]
+        return [
+            {
+                "date": _day_string(day),
+                "stars": None if stars < 0 else int(stars),
+                "forks": None if forks < 0 else int(forks),
+            }
+            for day, stars, forks in zip(rows["day"], rows["stars"], rows["forks"])
+        ]
+
+    def title(self, project: str) -> Optional[str]:
+        self._load()
+        p = self._lookup.get(project_key(project))
+        return None if p is None else self._titles[p]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama Pulse project time-series index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("update", help="Index new or changed daily snapshots")
+    history_cmd = sub.add_parser("history", help="Print a project's history")
+    history_cmd.add_argument("project", help="GitHub URL, owner/repo or other project URL")
+    history_cmd.add_argument("--days", type=int, help="Only the last N days")
+    args = parser.parse_args()
+
+    index = TimeSeriesIndex()
+    if args.command == "update":
+        days = index.update()
+        print(f"📈 Indexed {days} new or changed day(s); {index.project_count()} projects tracked")
+        return 0
+
+    if index.project_count() == 0:
+        index.update()
+    start = (date.today() - timedelta(days=args.days)).isoformat() if args.days else None
+    points = index.history(args.project, start=start)
+    if not points:
+        print(f"⚠️  No history for {args.project}")
+        return 1
+    print(f"📈 {index.title(args.project)} ({len(points)} points)")
+    for point in points:
+        print(f"  {point['date']}  stars={point['stars']}  forks={point['forks']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Shared fixtures: scripts/ is a flat module directory, imported by bare name"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty directory, so data/ and data/cache/ paths resolve under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,76 @@
+import json
+
+from aggregate import Aggregator
+from pulse_entry import PulseEntry
+
+
+def entry(n, score_words="turbo cloud", url=None, **kwargs):
+    return PulseEntry(
+        title=f"Item {n} {score_words}",
+        summary=f"distinct summary number {n} " * 3,
+        url=url or f"https://example.com/item/{n}",
+        date=f"2026-10-{n % 28 + 1:02d}",
+        source="tools",
+        **kwargs,
+    )
+
+
+def titles(agg):
+    return [e.title for e in agg.results()[0]]
+
+
+def test_keeps_best_entries_by_score():
+    agg = Aggregator(max_entries=3)
+    for n in range(5):
+        agg.add(entry(n, "cloud"))
+    agg.add(entry(99, "turbo cloud voice api"))
+    results, total = agg.results()
+    assert total == 6
+    assert len(results) == 3
+    assert results[0].title.startswith("Item 99")
+
+
+def test_same_url_replaces_earlier_entry():
+    agg = Aggregator()
+    agg.add(entry(1, url="https://github.com/ollama/ollama"))
+    agg.add(entry(2, url="http://www.github.com/ollama/ollama/?utm_source=x"))
+    results, total = agg.results()
+    assert total == 1
+    assert [e.title for e in results] == ["Item 2 turbo cloud"]
+
+
+def test_state_round_trip_resumes_like_a_single_pass():
+    first, later = [entry(n) for n in range(6)], [entry(n + 10) for n in range(3)]
+    later.append(entry(50, url="https://example.com/item/2"))  # replaces a ranked entry
+
+    single = Aggregator(max_entries=5)
+    for e in first + later:
+        single.add(e)
+
+    agg = Aggregator(max_entries=5)
+    for e in first:
+        agg.add(e)
+    saved = [PulseEntry.from_dict(e.to_dict()) for e in agg.results()[0]]
+    state = json.loads(json.dumps(agg.to_state({"tools": 123})))
+    assert state["offsets"] == {"tools": 123}
+
+    resumed = Aggregator.from_state(state, saved, max_entries=5)
+    assert titles(resumed) == titles(agg)
+    for e in later:
+        resumed.add(e)
+    assert titles(resumed) == titles(single)
+    assert resumed.results()[1] == single.results()[1]
+
+
+def test_replacements_leave_stale_items_out_and_the_heap_bounded():
+    agg = Aggregator(max_entries=4)
+    for _ in range(50):
+        for n in range(6):
+            agg.add(entry(n, "turbo cloud" if n % 2 else "cloud"))
+    results, total = agg.results()
+    assert total == 6
+    assert len(results) == 4
+    assert len({e.url for e in results}) == 4
+    assert {f"https://example.com/item/{n}" for n in (1, 3, 5)} <= {e.url for e in results}
+    assert len(agg.heap) <= 2 * agg.max_entries + 1
+    assert len(agg.to_state({})["ranked"]) == 4
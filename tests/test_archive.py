@@ -0,0 +1,22 @@
+import json
+from pathlib import Path
+
+import archive
+
+
+def test_pattern_rows_keep_the_item_source_and_group_by_pattern(workdir, monkeypatch):
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", workdir / "archive")
+    Path("data/insights").mkdir(parents=True)
+    with open("data/insights/2026-10-16.json", "w") as f:
+        json.dump({"patterns": {
+            "vision_qwen3-vl": [{"title": "A", "url": "https://a", "source": "reddit"}],
+            "n8n_agents": [{"title": "B", "url": "https://b"}],
+        }}, f)
+
+    assert archive.archive_day("patterns", "2026-10-16")
+    rows = list(archive.scan("patterns", columns=["title", "source", "pattern"]))
+    assert {(r["title"], r["source"], r["pattern"]) for r in rows} == {
+        ("A", "reddit", "vision_qwen3-vl"), ("B", None, "n8n_agents")}
+
+    selected = list(archive.scan("patterns", columns=["title"], sources=["vision_qwen3-vl"]))
+    assert [r["title"] for r in selected] == ["A"]
@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+import cursors
+import ingest_community
+import ingest_issues
+import sources
+from sources import Source
+
+
+@pytest.fixture
+def cursor_db(workdir, monkeypatch):
+    monkeypatch.setattr(cursors, "CURSOR_PATH", workdir / "cursors.db")
+
+
+class StagingSource(Source):
+    name = "staging_test"
+
+    def __init__(self, fail_save=False):
+        super().__init__()
+        self.fail_save = fail_save
+
+    async def fetch(self):
+        cursors.stage_cursor(self.name, "q", "2026-10-17T10:00:00Z")
+        return [{"title": "t", "url": "https://example.com/t"}]
+
+    def save(self, entries, merge=None):
+        if self.fail_save:
+            raise OSError("disk full")
+        return super().save(entries, merge)
+
+
+def test_cursor_waits_for_a_successful_save(cursor_db):
+    result = asyncio.run(StagingSource(fail_save=True).run())
+    assert result.status == "failed"
+    assert cursors.get_cursor("staging_test", "q") is None
+
+    result = asyncio.run(StagingSource().run())
+    assert result.status == "complete"
+    assert cursors.get_cursor("staging_test", "q") == "2026-10-17T10:00:00Z"
+
+
+def test_cursors_of_unfinished_parts_are_dropped(cursor_db, monkeypatch):
+    class PartsSource(Source):
+        name = "parts_test"
+        budget_seconds = 0.2
+
+        async def fetch(self):
+            async def quick():
+                cursors.stage_cursor(self.name, "quick", "2")
+                return [{"title": "q", "url": "https://example.com/q"}]
+
+            async def slow():
+                cursors.stage_cursor(self.name, "slow", "9")
+                await asyncio.sleep(5)
+                return [{"title": "s", "url": "https://example.com/s"}]
+
+            results = await self.gather_parts({"quick": quick(), "slow": slow()})
+            return [entry for entries in results.values() for entry in entries]
+
+    result = asyncio.run(PartsSource().run())
+    assert result.status == "partial"
+    assert cursors.get_cursor("parts_test", "quick") == "2"
+    assert cursors.get_cursor("parts_test", "slow") is None
+
+
+def github_page(total, n):
+    return {
+        "total_count": total,
+        "incomplete_results": False,
+        "items": [{
+            "title": f"Issue {i}", "updated_at": f"2026-10-17T0{i}:00:00Z", "body": "",
+            "html_url": f"https://github.com/o/r/issues/{i}", "state": "open",
+            "repository_url": "https://api.github.com/repos/o/r",
+        } for i in range(n)],
+    }
+
+
+def test_first_github_run_sets_the_cursor_even_on_a_full_page(cursor_db, monkeypatch):
+    monkeypatch.setattr(ingest_issues.http_cache, "get_json", lambda *a, **k: github_page(40, 3))
+    assert len(ingest_issues.search_github_issues("ollama", max_results=3)) == 3
+    assert cursors.get_cursor("github_issues", "ollama is:issue is:open") == "2026-10-17T02:00:00Z"
+
+
+@pytest.mark.parametrize("total, n, advanced", [(3, 3, True), (40, 3, False)])
+def test_github_cursor_only_advances_past_a_complete_page(cursor_db, monkeypatch, total, n, advanced):
+    cursors.set_cursors({("github_issues", "ollama is:issue is:open"): "2026-10-16T00:00:00Z"})
+    monkeypatch.setattr(ingest_issues.http_cache, "get_json", lambda *a, **k: github_page(total, n))
+    entries = ingest_issues.search_github_issues("ollama", max_results=3)
+    assert len(entries) == n
+    cursor = cursors.get_cursor("github_issues", "ollama is:issue is:open")
+    assert cursor == ("2026-10-17T02:00:00Z" if advanced else "2026-10-16T00:00:00Z")
+
+
+def test_reddit_cursor_set_on_first_run_and_held_on_a_full_delta(cursor_db, monkeypatch):
+    def page(n, first=0):
+        return {"data": {"children": [{"data": {
+            "name": f"t3_{i}", "title": f"Post {i}", "created_utc": 1760000000 + i,
+            "permalink": f"/r/ollama/{i}", "ups": 1,
+        }} for i in range(first, first + n)]}}
+
+    size = ingest_community.REDDIT_PAGE_SIZE
+    monkeypatch.setattr(ingest_community.http_cache, "get_json", lambda *a, **k: page(size, 100))
+    assert len(ingest_community.fetch_reddit()) == size
+    assert cursors.get_cursor("reddit", "r/ollama/new") == "t3_100"
+
+    # A full page newer than the cursor may not reach back to it
+    monkeypatch.setattr(ingest_community.http_cache, "get_json", lambda *a, **k: page(size, 200))
+    ingest_community.fetch_reddit()
+    assert cursors.get_cursor("reddit", "r/ollama/new") == "t3_100"
+
+    monkeypatch.setattr(ingest_community.http_cache, "get_json", lambda *a, **k: page(2, 300))
+    ingest_community.fetch_reddit()
+    assert cursors.get_cursor("reddit", "r/ollama/new") == "t3_300"
+
+
+class HNResponse:
+    def __init__(self, nb_hits, created):
+        self.data = {"nbHits": nb_hits, "hits": [
+            {"title": f"Story {t}", "url": f"https://example.com/{t}", "created_at_i": t} for t in created
+        ]}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+def test_hackernews_cursor_set_on_first_run_and_held_on_a_full_delta(cursor_db, monkeypatch):
+    size = ingest_community.HN_PAGE_SIZE
+    page = HNResponse(500, range(1000, 1000 + size))
+    monkeypatch.setattr(ingest_community.http_transport, "get", lambda *a, **k: page)
+    ingest_community.fetch_hackernews()
+    assert cursors.get_cursor("hackernews", "ollama cloud") == str(999 + size)
+
+    page = HNResponse(size + 5, range(2000, 2000 + size))
+    ingest_community.fetch_hackernews()
+    assert cursors.get_cursor("hackernews", "ollama cloud") == str(999 + size)
+
+    page = HNResponse(2, [3000, 3001])
+    ingest_community.fetch_hackernews()
+    assert cursors.get_cursor("hackernews", "ollama cloud") == "3001"
+
+
+def test_cursor_waits_for_the_journal_append(cursor_db, monkeypatch):
+    def broken_append(source, entries, day=None, replace=False):
+        raise OSError("journal not writable")
+
+    monkeypatch.setattr(sources.journal, "append", broken_append)
+    result = asyncio.run(StagingSource().run())
+    assert result.status == "failed"
+    assert cursors.get_cursor("staging_test", "q") is None
@@ -0,0 +1,50 @@
+from aggregate import Aggregator
+from dedupe import NearDuplicateIndex, canonical_url, hamming, simhash
+from pulse_entry import PulseEntry
+
+STORY = "Ollama turbo cloud adds vision models with a faster API for multimodal agents and tools"
+# Same story as syndicated elsewhere: different case and punctuation
+REPOST = "Ollama Turbo Cloud adds vision models, with a faster API for multimodal agents and tools!"
+
+
+def test_canonical_url_spellings_agree():
+    spellings = [
+        "https://github.com/ollama/ollama",
+        "github.com/ollama/ollama/",
+        "http://www.github.com/ollama/ollama?utm_source=feed",
+        "https://GitHub.com/ollama//ollama#readme",
+        "https://github.com:443/ollama/ollama",
+    ]
+    assert {canonical_url(url) for url in spellings} == {"https://github.com/ollama/ollama"}
+
+
+def test_canonical_url_keeps_meaningful_query_sorted():
+    assert canonical_url("https://x.com/a?b=2&a=1&ref=hn") == "https://x.com/a?a=1&b=2"
+    assert canonical_url("https://x.com/a?id=1") != canonical_url("https://x.com/a?id=2")
+
+
+def test_simhash_is_stable_and_skips_short_texts():
+    assert simhash(STORY) == simhash(STORY.upper())
+    assert simhash("Ollama v0.12.3") is None
+    assert hamming(simhash(STORY), simhash(REPOST)) <= 3
+
+
+def test_near_duplicate_index_find_and_remove():
+    index = NearDuplicateIndex()
+    index.add("a", simhash(STORY))
+    assert index.find(simhash(REPOST)) == "a"
+    assert index.find(simhash("A completely unrelated note about gardening tomatoes in late summer")) is None
+    index.remove("a", simhash(STORY))
+    assert index.find(simhash(STORY)) is None
+
+
+def test_aggregator_merges_near_duplicates_across_sources():
+    agg = Aggregator()
+    agg.add(PulseEntry(title=STORY, url="https://ollama.com/blog/vision", source="official"))
+    agg.add(PulseEntry(title=REPOST, url="https://reddit.com/r/ollama/1", source="community"))
+    results, total = agg.results()
+    assert total == 2
+    assert agg.merged == 1
+    assert len(results) == 1
+    assert results[0].sources == ["official", "community"]
+    assert results[0].duplicate_urls == ["https://reddit.com/r/ollama/1"]
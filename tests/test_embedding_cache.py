@@ -0,0 +1,92 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from embedding_cache import EmbeddingCache, text_hash
+
+
+class FakeEncoder:
+    """Deterministic 4-d vectors ("t7" -> [7, 8, 9, 1]) that float16 stores exactly"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[n, n + 1, n + 2, 1] for n in (int(t[1:]) for t in texts)], dtype=np.float32)
+
+
+def make_cache(tmp_path, max_rows=100):
+    encoder = FakeEncoder()
+    return EmbeddingCache("fake/model", cache_dir=tmp_path, max_rows=max_rows, encoder=encoder), encoder
+
+
+def age(cache, texts, day="2000-01-01"):
+    """Pretend `texts` were last used long ago"""
+    with sqlite3.connect(cache.cache_dir / "index.db") as conn:
+        conn.executemany('UPDATE embeddings SET last_used = ? WHERE hash = ?',
+                         [(day, text_hash(t)) for t in texts])
+
+
+def test_only_misses_are_encoded(tmp_path):
+    cache, encoder = make_cache(tmp_path)
+    first = cache.embed(["t1", "t2", "t1"])
+    assert first.tolist() == [[1, 2, 3, 1], [2, 3, 4, 1], [1, 2, 3, 1]]
+    second = cache.embed(["t2", "t3"])
+    assert second.tolist() == [[2, 3, 4, 1], [3, 4, 5, 1]]
+    assert encoder.calls == [["t1", "t2"], ["t3"]]
+    assert cache.stats()["vectors"] == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_survives_growth_past_initial_capacity(tmp_path):
+    cache, _ = make_cache(tmp_path, max_rows=5000)
+    texts = [f"t{n}" for n in range(1500)]
+    cache.embed(texts[:10])
+    vectors = cache.embed(texts)
+    assert cache.stats()["capacity"] >= 1500
+    assert vectors[1234].tolist() == [1234, 1235, 1236, 1]
+
+
+def test_evicts_least_recently_used_and_reuses_rows(tmp_path):
+    cache, encoder = make_cache(tmp_path, max_rows=4)
+    cache.embed(["t1", "t2", "t3", "t4"])
+    age(cache, ["t1", "t2"], "2000-01-01")
+    age(cache, ["t3", "t4"], "2000-01-02")
+
+    # 6 vectors > max_rows: evict the 3 oldest (down to 90% of 4), never today's
+    cache.embed(["t5", "t6"])
+    stats = cache.stats()
+    assert stats["vectors"] == 3
+    assert stats["capacity"] == 1024
+
+    encoder.calls.clear()
+    assert cache.embed(["t4", "t5", "t6"]).tolist() == [[4, 5, 6, 1], [5, 6, 7, 1], [6, 7, 8, 1]]
+    assert encoder.calls == []
+
+    # Evicted texts are encoded again into freed rows, not appended
+    assert cache.embed(["t1"]).tolist() == [[1, 2, 3, 1]]
+    assert encoder.calls == [["t1"]]
+    with sqlite3.connect(cache.cache_dir / "index.db") as conn:
+        assert conn.execute("SELECT value FROM meta WHERE key = 'rows'").fetchone()[0] == 6
+
+
+def test_rejects_vectors_of_another_dimension(tmp_path):
+    cache, _ = make_cache(tmp_path)
+    cache.embed(["t1"])
+    cache._encoder = lambda texts: np.ones((len(texts), 3), dtype=np.float32)
+    with pytest.raises(ValueError, match="4-d"):
+        cache.embed(["t2"])
+
+
+def test_engines_get_separate_caches(tmp_path):
+    torch_cache = EmbeddingCache("fake/model", cache_dir=tmp_path, encoder=FakeEncoder(), engine_id="torch")
+    onnx_encoder = FakeEncoder()
+    onnx_cache = EmbeddingCache("fake/model", cache_dir=tmp_path, encoder=onnx_encoder, engine_id="onnx-int8")
+    assert torch_cache.cache_dir != onnx_cache.cache_dir
+    assert onnx_cache.space == "fake_model__onnx-int8"
+
+    torch_cache.embed(["t1"])
+    onnx_cache.embed(["t1"])
+    assert onnx_encoder.calls == [["t1"]]
@@ -0,0 +1,208 @@
+import json
+import random
+import shutil
+from datetime import datetime
+
+import pytest
+
+import aggregate
+import journal
+import sources
+
+DAY = "2026-10-17"
+
+
+@pytest.fixture
+def journal_dir(workdir, monkeypatch):
+    monkeypatch.setattr(journal, "JOURNAL_DIR", workdir / "journal")
+    return workdir / "journal"
+
+
+def record(n, stars=1):
+    return {"title": f"Item {n}", "url": f"https://example.com/{n}", "highlights": [f"stars: {stars}"]}
+
+
+def test_only_new_or_changed_records_are_appended(journal_dir):
+    assert journal.append("tools", [record(1), record(2)], DAY) == 2
+    assert journal.append("tools", [record(1), record(2, stars=5), record(3)], DAY) == 2
+    records, pos = journal.read_since("tools", DAY)
+    assert [r["title"] for r in records] == ["Item 1", "Item 2", "Item 2", "Item 3"]
+    assert pos == journal.position("tools", DAY)
+
+
+def test_replacing_save_journals_what_it_dropped(journal_dir):
+    journal.append("tools", [record(1), record(2), record(3)], DAY, replace=True)
+    assert journal.append("tools", [record(2), record(4)], DAY, replace=True) == 3
+    records, _ = journal.read_since("tools", DAY)
+    assert records[3:] == [record(4), {journal.REMOVED: "https://example.com/1"},
+                           {journal.REMOVED: "https://example.com/3"}]
+    # A merging save drops nothing; a record that comes back is new again
+    assert journal.append("tools", [record(1)], DAY) == 1
+
+
+def test_reads_resume_from_the_returned_position(journal_dir):
+    journal.append("tools", [record(1)], DAY)
+    _, pos = journal.read_since("tools", DAY)
+    journal.append("tools", [record(2)], DAY)
+    records, pos = journal.read_since("tools", DAY, pos)
+    assert [r["title"] for r in records] == ["Item 2"]
+    assert journal.read_since("tools", DAY, pos) == ([], pos)
+
+
+def test_torn_last_line_is_left_for_the_next_read(journal_dir):
+    journal.append("tools", [record(1)], DAY)
+    with open(journal.journal_path("tools", DAY), 'a', encoding='utf-8') as f:
+        f.write('{"title": "Item 2", "url": ')
+    records, pos = journal.read_since("tools", DAY)
+    assert len(records) == 1
+    with open(journal.journal_path("tools", DAY), 'a', encoding='utf-8') as f:
+        f.write('"https://example.com/2"}\n')
+    records, _ = journal.read_since("tools", DAY, pos)
+    assert [r["title"] for r in records] == ["Item 2"]
+
+
+def test_truncated_journal_is_reported_not_skipped(journal_dir):
+    journal.append("tools", [record(n) for n in range(20)], DAY)
+    _, pos = journal.read_since("tools", DAY)
+
+    # Cache miss: a fresh, shorter journal replaces the one `pos` points into
+    shutil.rmtree(journal_dir / "tools")
+    journal.append("tools", [record(99)], DAY)
+    records, new_pos = journal.read_since("tools", DAY, pos)
+    assert records is None
+    assert new_pos == journal.position("tools", DAY)
+
+
+def test_replaced_journal_is_reported_even_when_longer(journal_dir):
+    journal.append("tools", [record(1)], DAY)
+    _, pos = journal.read_since("tools", DAY)
+    shutil.rmtree(journal_dir / "tools")
+    journal.append("tools", [record(n) for n in range(50, 80)], DAY)
+    assert journal.read_since("tools", DAY, pos)[0] is None
+
+
+def test_journal_created_after_an_empty_position_is_read_from_the_start(journal_dir):
+    pos = journal.position("tools", DAY)
+    assert pos == [None, 0]
+    journal.append("tools", [record(1)], DAY)
+    records, _ = journal.read_since("tools", DAY, pos)
+    assert [r["title"] for r in records] == ["Item 1"]
+
+
+def test_incremental_aggregation_falls_back_after_a_journal_reset(journal_dir, workdir, monkeypatch):
+    monkeypatch.setattr(aggregate, "STATE_DIR", workdir / "state")
+    monkeypatch.setattr(aggregate, "SOURCES", [("tools", "Tools")])
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    def story(n):
+        return {"title": f"Turbo cloud story {n}", "url": f"https://example.com/{n}", "source": "tools"}
+
+    # An earlier run saved and journaled five stories, then aggregated in full
+    (workdir / "data" / "tools").mkdir(parents=True)
+    (workdir / "data" / "tools" / f"{today}.json").write_text(json.dumps([story(n) for n in range(5)]))
+    journal.append("tools", [story(n) for n in range(5)], today)
+    (workdir / "data" / "aggregated").mkdir(parents=True)
+    entries, _, agg = aggregate.aggregate_data()
+    aggregate.save_aggregated(entries)
+    aggregate.save_state(agg, today, aggregate.journal_offsets(today))
+
+    journal.append("tools", [story(5)], today)
+    result = aggregate.aggregate_incremental()
+    assert result is not None
+    assert len(result[0]) == 6
+
+    shutil.rmtree(journal_dir / "tools")
+    journal.append("tools", [story(6)], today)
+    assert aggregate.aggregate_incremental() is None
+
+
+def test_incremental_aggregation_matches_a_full_rebuild(journal_dir, workdir, monkeypatch):
+    monkeypatch.setattr(aggregate, "STATE_DIR", workdir / "state")
+    # Merged and replaced sources, in SOURCES order
+    merged = {"cloud": True, "releases": False, "tools": True, "manual": False}
+    monkeypatch.setattr(aggregate, "SOURCES", [(name, name) for name in merged])
+    today = datetime.now().strftime("%Y-%m-%d")
+    (workdir / "data" / "aggregated").mkdir(parents=True)
+    rng = random.Random(18)
+    files = {name: {} for name in merged}
+
+    def story(n, version):
+        words = rng.choice(["turbo cloud", "cloud api", "weekly notes"])
+        # Overlapping titles make near-duplicates; a shared URL pool makes cross-source links
+        title = rng.choice([f"Ollama {words} story {n}", f"Story {n} about Ollama {words}"])
+        return {"title": title, "summary": f"version {version} of story {n}",
+                "url": f"https://example.com/{n}" if n % 7 else None,
+                "date": f"2026-10-{rng.randint(10, 17)}", "source": "tools"}
+
+    def ingest(name):
+        current = files[name]
+        if merged[name]:
+            entries = [story(rng.randrange(60), step) for _ in range(rng.randint(1, 4))]
+        else:
+            kept = [e for e in current.values() if rng.random() < 0.8]
+            entries = kept + [story(rng.randrange(60), step) for _ in range(rng.randint(0, 3))]
+        if not entries:
+            return
+        sources.save_entries(name, entries, merge=merged[name])
+        journal.append(name, entries, today, replace=not merged[name])
+        files[name] = {sources.dedupe_key(e): e for e in (list(current.values()) if merged[name] else []) + entries}
+
+    incremental_runs = 0
+    for step in range(60):
+        ingest(rng.choice(list(merged)))
+        # What main() does: incremental when it can, full rebuild otherwise
+        result = aggregate.aggregate_incremental()
+        if result is None:
+            offsets = aggregate.journal_offsets(today)
+            entries, total, agg = aggregate.aggregate_data()
+        else:
+            incremental_runs += 1
+            entries, total, agg, offsets = result
+        full_entries, full_total, _ = aggregate.aggregate_data()
+        assert total == full_total
+        assert [e.to_dict() for e in entries] == [e.to_dict() for e in full_entries]
+        if entries:
+            aggregate.save_aggregated(entries)
+            aggregate.save_state(agg, today, offsets)
+    assert incremental_runs > 10
+
+
+def test_removal_and_a_link_won_by_a_later_source_rebuild_in_full(journal_dir, workdir, monkeypatch):
+    monkeypatch.setattr(aggregate, "STATE_DIR", workdir / "state")
+    monkeypatch.setattr(aggregate, "SOURCES", [("cloud", "Cloud"), ("releases", "Releases")])
+    today = datetime.now().strftime("%Y-%m-%d")
+    (workdir / "data" / "aggregated").mkdir(parents=True)
+
+    def story(n, source):
+        return {"title": f"Turbo cloud story {n} {source}", "url": f"https://example.com/{n}", "source": source}
+
+    def ingest(name, entries, merge):
+        sources.save_entries(name, entries, merge=merge)
+        journal.append(name, entries, today, replace=not merge)
+
+    def run():
+        result = aggregate.aggregate_incremental()
+        if result is None:
+            offsets = aggregate.journal_offsets(today)
+            entries, _, agg = aggregate.aggregate_data()
+        else:
+            entries, _, agg, offsets = result
+        aggregate.save_aggregated(entries)
+        aggregate.save_state(agg, today, offsets)
+        return result, [e.title for e in entries]
+
+    ingest("releases", [story(1, "releases"), story(2, "releases")], merge=False)
+    ingest("cloud", [story(3, "cloud")], merge=True)
+    run()
+
+    # Dropped from the replaced file: gone from the aggregate too
+    ingest("releases", [story(1, "releases")], merge=False)
+    result, titles = run()
+    assert result is not None
+    assert sorted(titles) == ["Turbo cloud story 1 releases", "Turbo cloud story 3 cloud"]
+
+    # The earlier source journals a link the later one owns: the later source still wins
+    ingest("cloud", [story(1, "cloud")], merge=True)
+    result, titles = run()
+    assert result is None
+    assert sorted(titles) == ["Turbo cloud story 1 releases", "Turbo cloud story 3 cloud"]
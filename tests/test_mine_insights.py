@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+import backfill
+import mine_insights
+
+
+def test_backfill_mines_days_one_at_a_time_oldest_first(workdir, monkeypatch):
+    days = ["2026-10-01", "2026-10-02", "2026-10-03", "2026-10-04"]
+    Path("data/aggregated").mkdir(parents=True)
+    for day in days:
+        Path(f"data/aggregated/{day}.json").write_text("[]")
+
+    monkeypatch.setattr(backfill, "STAMP_PATH", workdir / "backfill.db")
+    mined = []
+    monkeypatch.setattr(mine_insights, "mine", mined.append)
+    monkeypatch.setattr(sys, "argv", ["mine_insights.py", "--from", days[0], "--to", days[-1], "--workers", "4"])
+    mine_insights.main()
+    # In-process and in date order: cluster state carries from each day to the next
+    assert mined == days
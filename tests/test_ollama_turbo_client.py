@@ -0,0 +1,65 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import rate_limiter
+from ollama_turbo_client import OllamaTurboClient
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=None):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def post(self, url, json, headers):
+        self.posts += 1
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def limiter_db(workdir, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "LIMITER_PATH", workdir / "rate_limits.db")
+
+
+def test_embed_batch_429_waits_only_for_the_rate_limiter(limiter_db, monkeypatch):
+    clock, sleeps = [1_000_000.0], []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: clock[0]))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    client = OllamaTurboClient(api_key="test")
+    client.session = FakeSession([
+        FakeResponse(429, {"Retry-After": "7"}),
+        FakeResponse(200, body={"embeddings": [[1.0, 2.0]]}),
+    ])
+
+    vectors = asyncio.run(client.embed_batch("nomic-embed-text", ["text"]))
+    assert vectors.tolist() == [[1.0, 2.0]]
+    assert client.session.posts == 2
+    # One wait, for the bucket blocked by Retry-After - no extra backoff on top
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(7)
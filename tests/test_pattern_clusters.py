@@ -0,0 +1,84 @@
+import numpy as np
+
+from pattern_clusters import OnlineClusters
+
+
+def direction(degrees, dims=4):
+    """Unit vector in the plane of the first two axes"""
+    vector = np.zeros(dims, dtype=np.float32)
+    vector[0], vector[1] = np.cos(np.radians(degrees)), np.sin(np.radians(degrees))
+    return vector
+
+
+def keys(prefix, n):
+    return [f"{prefix}{i}" for i in range(n)]
+
+
+def test_items_join_nearest_cluster_and_keep_ids_across_days(tmp_path):
+    engine = OnlineClusters(tmp_path)
+    assignments, drift, events = engine.update(
+        "2026-10-01", ["a", "b", "c"], np.stack([direction(0), direction(10), direction(90)]))
+    assert assignments == [0, 0, 1]
+    assert events["created"] == [0, 1]
+    assert drift[0]["trend"] == "new"
+
+    # A fresh instance reads the persisted state; known items keep their cluster
+    engine = OnlineClusters(tmp_path)
+    assignments, drift, _ = engine.update(
+        "2026-10-02", ["a", "d"], np.stack([direction(0), direction(85)]))
+    assert assignments == [0, 1]
+    assert drift[1]["new_today"] == 1
+    assert drift[0]["new_today"] == 0
+
+
+def test_converging_clusters_merge_into_the_older_one(tmp_path):
+    engine = OnlineClusters(tmp_path)
+    vectors = [direction(0), direction(90)] + [direction(45)] * 10 + [direction(70)] * 10
+    assignments, drift, events = engine.update("2026-10-01", keys("m", len(vectors)), np.stack(vectors))
+    assert events["merged"] == [[1, 0]]
+    assert set(assignments) == {0}
+    assert list(drift) == [0]
+    assert engine.state["clusters"]["0"]["total"] == len(vectors)
+    assert "1" not in engine.state["clusters"]
+
+
+def test_spread_out_cluster_splits_in_two(tmp_path):
+    engine = OnlineClusters(tmp_path)
+    engine.update("2026-10-01", keys("base", 50), np.stack([direction(0)] * 50))
+
+    # Two groups ~123 degrees apart, each still close enough to join the cluster
+    vectors = [direction(61.5 if i % 2 else -61.5) for i in range(8)]
+    assignments, drift, events = engine.update("2026-10-02", keys("new", 8), np.stack(vectors))
+    assert events["split"] == [[0, 1]]
+    assert {assignments[i] for i in range(0, 8, 2)} != {assignments[i] for i in range(1, 8, 2)}
+    assert len({assignments[i] for i in range(0, 8, 2)}) == 1
+    assert len({assignments[i] for i in range(1, 8, 2)}) == 1
+    assert engine.state["clusters"]["1"]["total"] == 4
+    assert set(drift) == {0, 1}
+
+
+def test_days_before_the_last_processed_day_are_read_only(tmp_path):
+    engine = OnlineClusters(tmp_path)
+    engine.update("2026-10-05", ["a"], np.stack([direction(0)]))
+    assignments, drift, events = engine.update(
+        "2026-10-01", ["old", "far"], np.stack([direction(5), direction(90)]))
+    assert events["read_only"]
+    assert assignments == [0, None]
+    assert drift == {}
+    assert engine.state["last_day"] == "2026-10-05"
+    assert "old" not in engine.state["memberships"]
+
+
+def test_state_from_another_embedding_space_is_not_reused(tmp_path):
+    engine = OnlineClusters(tmp_path, space="model__torch")
+    engine.update("2026-10-01", ["a"], np.stack([direction(0)]))
+
+    engine = OnlineClusters(tmp_path, space="model__torch")
+    _, _, events = engine.update("2026-10-02", ["b"], np.stack([direction(90)]))
+    assert events["created"] == [1]
+
+    engine = OnlineClusters(tmp_path, space="model__onnx-int8")
+    assignments, _, events = engine.update("2026-10-03", ["a"], np.stack([direction(0)]))
+    assert events["created"] == [0]
+    assert engine.state["space"] == "model__onnx-int8"
+    assert list(engine.state["memberships"]) == ["a"]
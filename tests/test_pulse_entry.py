@@ -0,0 +1,34 @@
+import pytest
+
+from pulse_entry import PulseEntry, parse_metrics
+
+
+@pytest.mark.parametrize("highlight, expected", [
+    # Formats the ingesters and review_integration's old substring parsing read
+    ("stars: 1234", {"stars": 1234}),
+    ("Stars: 12", {"stars": 12}),
+    ("github_stars: 120", {"stars": 120}),
+    ("repo_forks: 7", {"forks": 7}),
+    ("⭐ stars:5", {"stars": 5}),
+    ("forks: 3 | stars: 9", {"forks": 3, "stars": 9}),
+    ("downloads: 5000", {"downloads": 5000}),
+    ("citations: 42", {"citations": 42}),
+    ("comments: 0", {"comments": 0}),
+    ("upvotes: 4", {}),
+    ("superstars: 3", {}),
+    ("state: open", {}),
+])
+def test_parse_metrics_highlight_formats(highlight, expected):
+    assert parse_metrics([highlight]) == expected
+
+
+def test_metrics_round_trip_through_dict():
+    entry = PulseEntry(title="repo", url="https://github.com/o/r", highlights=["github_stars: 120", "forks: 4"],
+                       extra={"reward": "$50"})
+    assert (entry.stars, entry.forks) == (120, 4)
+    data = entry.to_dict()
+    assert data["metrics"] == {"stars": 120, "forks": 4}
+    restored = PulseEntry.from_dict(data)
+    assert restored.metrics == entry.metrics
+    assert restored.get("reward") == "$50"
+    assert restored.to_dict() == data
@@ -0,0 +1,26 @@
+import json
+from pathlib import Path
+
+import seen_index
+
+
+def write_day(day, urls):
+    Path("data/aggregated").mkdir(parents=True, exist_ok=True)
+    with open(f"data/aggregated/{day}.json", "w") as f:
+        json.dump([{"title": url, "url": url, "source": "test"} for url in urls], f)
+
+
+def test_missing_index_is_seeded_from_the_archive(workdir):
+    db_path = workdir / "data" / "cache" / "seen_items.db"
+    write_day("2026-10-15", ["https://example.com/a"])
+    write_day("2026-10-16", ["https://example.com/a", "https://example.com/b"])
+
+    assert seen_index.seed_if_missing(db_path=db_path) == 2
+    assert seen_index.seed_if_missing(db_path=db_path) == 0
+
+    entries = [{"url": "https://example.com/a"}, {"url": "https://example.com/c"}]
+    assert seen_index.annotate(entries, day="2026-10-17", db_path=db_path) == 1
+    assert entries[0]["first_seen"] == "2026-10-15"
+    assert entries[0]["days_since_seen"] == 1
+    assert entries[0]["times_seen"] == 3
+    assert entries[1]["is_new"]
@@ -0,0 +1,90 @@
+import asyncio
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import sources
+from sources import Source, run_blocking
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def slow_fetch(seconds):
+    time.sleep(seconds)
+    return [{"title": "late", "url": "https://example.com/late"}]
+
+
+def quick_fetch():
+    return [{"title": "quick", "url": "https://example.com/quick"}]
+
+
+class SlowPartSource(Source):
+    name = "slow_part_test"
+    budget_seconds = 0.3
+
+    async def fetch(self):
+        results = await self.gather_parts({
+            "quick": run_blocking(quick_fetch),
+            "slow": run_blocking(slow_fetch, 5),
+        })
+        return [entry for entries in results.values() for entry in entries]
+
+
+class SlowFetchSource(Source):
+    name = "slow_fetch_test"
+    budget_seconds = 0.2
+
+    async def fetch(self):
+        return await run_blocking(slow_fetch, 5)
+
+
+def test_blocking_part_is_cut_at_the_deadline(workdir):
+    start = time.monotonic()
+    result = asyncio.run(SlowPartSource().run())
+    assert time.monotonic() - start < 2
+    assert result.status == "partial"
+    assert result.entries == 1
+    assert "slow" in result.error_message
+
+
+def test_blocking_fetch_past_its_budget_fails_on_time(workdir, monkeypatch):
+    monkeypatch.setattr(sources, "DEADLINE_GRACE_SECONDS", 0.1)
+    start = time.monotonic()
+    result = asyncio.run(SlowFetchSource().run())
+    assert time.monotonic() - start < 2
+    assert result.status == "failed"
+
+
+def test_run_blocking_propagates_results_errors_and_context():
+    async def main():
+        sources.set_deadline(30)
+        budget = await run_blocking(sources.remaining_budget)
+        assert 0 < budget <= 30
+        try:
+            await run_blocking(int, "not a number")
+        except ValueError:
+            return True
+
+    assert asyncio.run(main())
+
+
+def test_process_exits_without_waiting_for_an_abandoned_fetcher(tmp_path):
+    # asyncio.to_thread() workers are joined at shutdown; run_blocking() threads are not
+    script = textwrap.dedent("""
+        import asyncio, time
+        from sources import run_blocking
+
+        async def main():
+            try:
+                await asyncio.wait_for(run_blocking(time.sleep, 30), timeout=0.2)
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(main())
+    """)
+    start = time.monotonic()
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, check=True, timeout=20,
+                   env={"PYTHONPATH": str(SCRIPTS_DIR)})
+    assert time.monotonic() - start < 10